@@ -0,0 +1,71 @@
+"""Benchmark of `collect_file_infos` with different numbers of hashing threads, with and without `mmap`.
+
+Hashes two layouts written to a temporary directory: many small files (like a directory of search results) and a
+few huge files (like raw instrument data). Each configuration is run once untimed first, so all runs read the files
+from the page cache and the timings compare the hashing rather than the disk.
+
+Usage: python benchmarks/bfabric/bench_collect_file_infos.py [--small-files N] [--huge-files N] [--huge-mb N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from bfabric.transfer import collect_file_infos
+
+
+def write_layout(root: Path, n_files: int, size: int) -> Path:
+    root.mkdir()
+    block = os.urandom(min(size, 1 << 20))
+    for i in range(n_files):
+        with (root / f"file_{i:05d}.bin").open("wb") as f:
+            for offset in range(0, size, len(block)):
+                _ = f.write(block[: size - offset])
+    return root
+
+
+def _time(layout: Path, max_workers: int, use_mmap: bool, repeat: int) -> float:
+    _ = collect_file_infos([layout], max_workers=max_workers, use_mmap=use_mmap)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _ = collect_file_infos([layout], max_workers=max_workers, use_mmap=use_mmap)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--small-files", type=int, default=2000, help="number of files of the small-files layout")
+    parser.add_argument("--small-kb", type=int, default=64, help="size of every small file in KB")
+    parser.add_argument("--huge-files", type=int, default=4, help="number of files of the huge-files layout")
+    parser.add_argument("--huge-mb", type=int, default=256, help="size of every huge file in MB")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="numbers of threads to compare")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        layouts = {
+            "small": write_layout(Path(tmp) / "small", args.small_files, args.small_kb * 1000),
+            "huge": write_layout(Path(tmp) / "huge", args.huge_files, args.huge_mb * 1_000_000),
+        }
+        print(f"{'layout':<8} {'workers':>7} {'mmap':>5} {'time [s]':>9} {'MB/s':>8} {'speedup':>8}")
+        for name, layout in layouts.items():
+            total_mb = sum(path.stat().st_size for path in layout.iterdir()) / 1e6
+            baseline = None
+            for use_mmap in (False, True):
+                for max_workers in args.workers:
+                    elapsed = _time(layout, max_workers=max_workers, use_mmap=use_mmap, repeat=args.repeat)
+                    baseline = baseline or elapsed
+                    print(
+                        f"{name:<8} {max_workers:>7} {use_mmap!s:>5} {elapsed:>9.3f} {total_mb / elapsed:>8.0f}"
+                        f" {baseline / elapsed:>7.1f}x"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Microbenchmark of the conversion of suds results into dictionaries, as done by `EngineSUDS._convert_results`.
+
+Compares the per-record cost of `suds_asdict_recursive` followed by `clean_result` with the single pass of
+`suds_asdict_clean`, on records shaped like the workunits and resources returned by B-Fabric.
+
+Usage: python benchmarks/bfabric/bench_response_format_suds.py [--records N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from bfabric.engine.response_format_suds import suds_asdict_clean, suds_asdict_recursive
+from bfabric.results.response_format_dict import clean_result
+from suds.sax.text import Text
+from suds.sudsobject import Factory
+
+
+def _ref(classname: str, id: int) -> Any:
+    return Factory.object(classname, {"_id": id, "_classname": classname})
+
+
+def _common_fields(id: int) -> dict[str, Any]:
+    return {
+        "_id": id,
+        "_classname": "unknown",
+        "created": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "createdby": Text("someuser"),
+        "modified": datetime.datetime(2024, 2, 3, 4, 5, 6),
+        "modifiedby": Text("someuser"),
+        "deletable": False,
+        "updatable": True,
+    }
+
+
+def make_workunit(id: int) -> Any:
+    fields = _common_fields(id)
+    fields.update(
+        {
+            "_classname": "workunit",
+            "name": Text(f"MaxQuant workunit {id}"),
+            "description": Text("Label-free quantification of the samples of order 12345 " * 4),
+            "status": Text("available"),
+            "application": _ref("application", 255),
+            "container": Factory.object("order", {"_id": 12345, "_classname": "order", "_projectid": 3000}),
+            "inputresource": [_ref("resource", 1000 + i) for i in range(12)],
+            "resource": [_ref("resource", 2000 + i) for i in range(6)],
+            "parameter": [_ref("parameter", 3000 + i) for i in range(20)],
+            "externaljob": [_ref("externaljob", 4000 + i) for i in range(2)],
+            "exportable": True,
+            "exported": False,
+        }
+    )
+    return Factory.object("workunit", fields)
+
+
+def make_resource(id: int) -> Any:
+    fields = _common_fields(id)
+    fields.update(
+        {
+            "_classname": "resource",
+            "name": Text(f"20240102_sample_{id}.raw"),
+            "relativepath": Text(f"p3000/Proteomics/QEXACTIVE_1/20240102_sample_{id}.raw"),
+            "filechecksum": Text("0123456789abcdef0123456789abcdef"),
+            "size": 1_234_567_890,
+            "status": Text("available"),
+            "storage": _ref("storage", 2),
+            "workunit": _ref("workunit", 30),
+            "sample": _ref("sample", 40),
+            "container": Factory.object("project", {"_id": 3000, "_classname": "project", "_projectid": 3000}),
+        }
+    )
+    return Factory.object("resource", fields)
+
+
+def convert_two_pass(record: Any) -> dict[str, Any]:
+    return clean_result(suds_asdict_recursive(record, convert_types=True), drop_underscores_suds=True, sort_keys=True)
+
+
+def convert_single_pass(record: Any) -> dict[str, Any]:
+    return suds_asdict_clean(record, drop_underscores=True)
+
+
+def _time_per_record(convert: Callable[[Any], dict[str, Any]], records: list[Any], repeat: int) -> float:
+    timings = timeit.repeat(lambda: [convert(record) for record in records], number=1, repeat=repeat)
+    return min(timings) / len(records)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000, help="number of records per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed repetitions, the best one is reported")
+    args = parser.parse_args()
+
+    payloads = {
+        "workunit": [make_workunit(i) for i in range(args.records)],
+        "resource": [make_resource(i) for i in range(args.records)],
+    }
+    print(f"{'payload':<10} {'two-pass [us]':>14} {'single-pass [us]':>17} {'speedup':>8}")
+    for name, records in payloads.items():
+        assert [convert_two_pass(record) for record in records] == [convert_single_pass(record) for record in records]
+        before = _time_per_record(convert_two_pass, records, args.repeat) * 1e6
+        after = _time_per_record(convert_single_pass, records, args.repeat) * 1e6
+        print(f"{name:<10} {before:>14.1f} {after:>17.1f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
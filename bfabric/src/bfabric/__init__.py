@@ -1,10 +1,12 @@
 import importlib.metadata
 
 from bfabric.bfabric import Bfabric
+from bfabric.bfabric_async import AsyncBfabric
 from bfabric.config.bfabric_auth import BfabricAuth
 from bfabric.config.bfabric_client_config import BfabricAPIEngineType, BfabricClientConfig
 
 __all__ = [
+    "AsyncBfabric",
     "Bfabric",
     "BfabricAPIEngineType",
     "BfabricAuth",
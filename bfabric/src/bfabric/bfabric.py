@@ -18,6 +18,7 @@ import base64
 import importlib.metadata
 import sys
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import datetime
 from functools import cached_property
@@ -29,9 +30,11 @@ from loguru import logger
 from rich.console import Console
 
 from bfabric.config import DEFAULT_CONFIG_FILE, BfabricAuth, BfabricClientConfig
+from bfabric.config.bfabric_client_config import BfabricAPIEngineType
 from bfabric.config.config_data import ConfigData, load_config_data
 from bfabric.config.config_file import read_config_file
 from bfabric.engine.engine_suds import EngineSUDS
+from bfabric.engine.engine_xml import EngineXML
 from bfabric.rest.token_data import TokenData, get_token_data, validate_token
 from bfabric.results.result_container import ResultContainer
 from bfabric.utils.cli_integration import DEFAULT_THEME, HostnameHighlighter
@@ -42,6 +45,7 @@ if TYPE_CHECKING:
 
     from pydantic import SecretStr
 
+    from bfabric.engine._http_pool import ConnectionStats
     from bfabric.oauth._credential_provider import OAuthCredentialProvider
     from bfabric.entities.core.entity_reader import EntityReader
     from bfabric.experimental.webapp_integration_settings import TokenValidationSettingsProtocol
@@ -61,17 +65,26 @@ class Bfabric:
         self,
         config_data: ConfigData,
         *,
+        _engine: EngineSUDS | EngineXML | None = None,
         _credential_provider: OAuthCredentialProvider | None = None,
     ) -> None:
         self.query_counter = 0
         self._config = config_data.client
         self._auth = config_data.auth
         self._credential_provider = _credential_provider
-        self._log_version_message()
+        if _engine is not None:
+            # a client created by `for_auth`, whose original client already logged the version message
+            self._engine = _engine
+        else:
+            self._log_version_message()
 
     @cached_property
-    def _engine(self) -> EngineSUDS:
-        return EngineSUDS(base_url=self._config.base_url)
+    def _engine(self) -> EngineSUDS | EngineXML:
+        if self._config.engine == BfabricAPIEngineType.XML:
+            return EngineXML(base_url=self._config.base_url, http_config=self._config.http)
+        return EngineSUDS(
+            base_url=self._config.base_url, wsdl_cache_ttl=self._config.wsdl_cache_ttl, http_config=self._config.http
+        )
 
     @classmethod
     def connect(
@@ -113,36 +126,7 @@ class Bfabric:
 
         Loads tokens from the disk cache keyed on ``base_url`` + ``client_id`` + ``env_name``.
         """
-        from bfabric.oauth._credential_provider import OAuthCredentialProvider
-        from bfabric.oauth._token_cache import TokenCache, compute_token_cache_path
-
-        base_url = config_data.client.base_url.rstrip("/")
-        if not config_data.client_id:
-            raise ValueError(
-                "OAuth config is missing 'client_id'. Set it in the config environment "
-                "(e.g. re-run 'bfabric-cli auth login' or 'bfabric-cli auth device-code')."
-            )
-        client_id = config_data.client_id
-        if not config_data.env_name:
-            # The cache key includes the environment name, and "default" (the old fallback here) is a
-            # name the config layer forbids outright — so it could never match a CLI-written cache.
-            raise ValueError(
-                "OAuth config is missing 'env_name', so the token cache cannot be located. When "
-                "configuring via BFABRICPY_CONFIG_OVERRIDE, include 'env_name' naming the "
-                "environment whose cached token should be used."
-            )
-        cache_path = compute_token_cache_path(base_url, client_id, config_data.env_name).expanduser()
-        if not TokenCache(cache_path).load():
-            raise ValueError("No OAuth tokens found. Run 'bfabric-cli auth login' or 'bfabric-cli auth device-code'.")
-        provider = OAuthCredentialProvider(
-            client_id=client_id,
-            client_secret="",
-            token_url=f"{base_url}/rest/oauth/token",
-            scope="",
-            grant_type="refresh_token",
-            token_cache_path=cache_path,
-        )
-        return cls(config_data=config_data, _credential_provider=provider)
+        return cls(config_data=config_data, _credential_provider=_oauth_provider_from_config(config_data))
 
     @classmethod
     def from_config(
@@ -415,6 +399,12 @@ class Bfabric:
         """Returns the config data object."""
         return ConfigData(client=self._config, auth=self._auth)
 
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Returns the counters of the requests sent by this client and the HTTP connections they used, which show
+        whether connections are kept alive and reused."""
+        return self._engine.connection_stats
+
     @contextmanager
     def with_auth(self, auth: BfabricAuth) -> Generator[None, None, None]:
         """Context manager that temporarily (within the scope of the context) sets the authentication for
@@ -434,6 +424,15 @@ class Bfabric:
             self._auth = old_auth
             self._credential_provider = old_provider
 
+    def for_auth(self, auth: BfabricAuth) -> Bfabric:
+        """Returns a client authenticating with `auth`, which shares the engine of this client, i.e. its parsed WSDL
+        and its connections.
+
+        Unlike :meth:`with_auth` this does not modify the client, so a server can keep one client per B-Fabric
+        instance and derive a client for the user of every request, from several threads.
+        """
+        return Bfabric(ConfigData(client=self._config, auth=auth), _engine=self._engine)
+
     @cached_property
     def reader(self) -> EntityReader:
         """Returns an EntityReader for this client."""
@@ -449,6 +448,7 @@ class Bfabric:
         offset: int = 0,
         check: bool = True,
         return_id_only: bool = False,
+        max_workers: int = 1,
     ) -> ResultContainer:
         """Reads from the specified endpoint matching all specified attributes in `obj`.
 
@@ -463,8 +463,14 @@ class Bfabric:
         :param offset: Number of results to skip before starting to return results.
         :param check: If ``True``, raises a ``RuntimeError`` if the query fails.
         :param return_id_only: If ``True``, only returns entity IDs instead of full data (faster).
+        :param max_workers: Maximum number of pages to fetch concurrently. With the default of ``1`` pages are read
+            one after another; a larger value fetches the pages after the first one with a thread pool of that size.
+            Results are returned in page order either way.
         :return: A :class:`ResultContainer` containing the query results.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
         # Get the first page.
         logger.debug(f"Reading from endpoint {repr(endpoint)} with query {repr(obj)}")
         results = self._engine.read(
@@ -490,11 +496,101 @@ class Bfabric:
         logger.debug(f"Requested pages: {requested_pages}")
 
         # NOTE: Page numbering starts at 1
+        page_results = self._read_pages(
+            endpoint=endpoint,
+            obj=obj,
+            pages=[i_page for i_page in requested_pages if i_page != 1],
+            n_available_pages=n_available_pages,
+            return_id_only=return_id_only,
+            max_workers=max_workers,
+        )
+        page_results[1] = results
+
         response_items: list[ApiResponseObjectType] = []
         errors = results.errors
         page_offset = initial_offset
-        for i_iter, i_page in enumerate(requested_pages):
-            if not (i_iter == 0 and i_page == 1):
+        for i_page in requested_pages:
+            if i_page != 1:
+                errors += page_results[i_page].errors
+            response_items += page_results[i_page][page_offset:]
+            page_offset = 0
+
+        result = ResultContainer(response_items, total_pages_api=n_available_pages, errors=errors)
+        if check:
+            result.assert_success()
+        return result.get_first_n_results(max_results)
+
+    def _read_pages(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        pages: list[int],
+        n_available_pages: int,
+        return_id_only: bool,
+        max_workers: int,
+    ) -> dict[int, ResultContainer]:
+        """Reads the specified `pages` of a query with up to `max_workers` threads, and returns them by page number."""
+
+        def read_page(i_page: int) -> ResultContainer:
+            logger.debug(f"Reading page {i_page} of {n_available_pages}")
+            return self._engine.read(
+                endpoint=endpoint,
+                obj=obj,
+                auth=self.auth,
+                page=i_page,
+                return_id_only=return_id_only,
+            )
+
+        if max_workers == 1 or len(pages) <= 1:
+            return {i_page: read_page(i_page) for i_page in pages}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages)), thread_name_prefix="bfabric-read") as pool:
+            return dict(zip(pages, pool.map(read_page, pages), strict=True))
+
+    def iter_read(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        max_results: int | None = 100,
+        offset: int = 0,
+        check: bool = True,
+        return_id_only: bool = False,
+    ) -> Generator[ResultContainer, None, None]:
+        """Reads from the specified endpoint like :meth:`read`, but yields the results page by page as they are fetched.
+
+        Only the page currently being processed is held in memory, so this is preferable over :meth:`read` for
+        iterating over large result sets, e.g. ``for page in client.iter_read(...): for result in page: ...``.
+        The parameters have the same meaning as for :meth:`read`, in particular `max_results` and `offset` apply to
+        the concatenation of all yielded pages.
+
+        :return: A generator of :class:`ResultContainer`, one per page that was read.
+        """
+        logger.debug(f"Reading from endpoint {repr(endpoint)} with query {repr(obj)}")
+        results = self._engine.read(
+            endpoint=endpoint,
+            obj=obj,
+            auth=self.auth,
+            page=1,
+            return_id_only=return_id_only,
+        )
+        if check:
+            results.assert_success()
+        n_available_pages = results.total_pages_api
+        if not n_available_pages:
+            yield results.get_first_n_results(max_results)
+            return
+
+        requested_pages, initial_offset = compute_requested_pages(
+            n_page_total=n_available_pages,
+            n_item_per_page=BFABRIC_QUERY_LIMIT,
+            n_item_offset=offset,
+            n_item_return_max=max_results,
+        )
+        logger.debug(f"Requested pages: {requested_pages}")
+
+        n_remaining = max_results
+        page_offset = initial_offset
+        for i_page in requested_pages:
+            if i_page != 1:
                 logger.debug(f"Reading page {i_page} of {n_available_pages}")
                 results = self._engine.read(
                     endpoint=endpoint,
@@ -503,15 +599,14 @@ class Bfabric:
                     page=i_page,
                     return_id_only=return_id_only,
                 )
-                errors += results.errors
-
-            response_items += results[page_offset:]
+                if check:
+                    results.assert_success()
+            response_items = results[page_offset:]
             page_offset = 0
-
-        result = ResultContainer(response_items, total_pages_api=n_available_pages, errors=errors)
-        if check:
-            result.assert_success()
-        return result.get_first_n_results(max_results)
+            if n_remaining is not None:
+                response_items = response_items[:n_remaining]
+                n_remaining -= len(response_items)
+            yield ResultContainer(response_items, total_pages_api=n_available_pages, errors=results.errors)
 
     def save(
         self,
@@ -594,6 +689,18 @@ class Bfabric:
             check=check,
         )
 
+    def close(self) -> None:
+        """Closes the connections of the client, and of all clients sharing them, e.g. the ones of :meth:`for_auth`."""
+        # the engine is created on first use, so a client which never sent a request has no connections to close
+        if "_engine" in self.__dict__:
+            self._engine.close()
+
+    def __enter__(self) -> Bfabric:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
     def _get_version_message(self) -> tuple[str, str]:
         """Returns the version message as a string."""
         package_version = importlib.metadata.version("bfabric")
@@ -637,6 +744,39 @@ class Bfabric:
         self._credential_provider = state.get("credential_provider")
 
 
+def _oauth_provider_from_config(config_data: ConfigData) -> OAuthCredentialProvider:
+    """Returns the credential provider for a config with ``auth_method: oauth``, reading its cached tokens."""
+    from bfabric.oauth._credential_provider import OAuthCredentialProvider
+    from bfabric.oauth._token_cache import TokenCache, compute_token_cache_path
+
+    base_url = config_data.client.base_url.rstrip("/")
+    if not config_data.client_id:
+        raise ValueError(
+            "OAuth config is missing 'client_id'. Set it in the config environment "
+            "(e.g. re-run 'bfabric-cli auth login' or 'bfabric-cli auth device-code')."
+        )
+    client_id = config_data.client_id
+    if not config_data.env_name:
+        # The cache key includes the environment name, and "default" (the old fallback here) is a
+        # name the config layer forbids outright — so it could never match a CLI-written cache.
+        raise ValueError(
+            "OAuth config is missing 'env_name', so the token cache cannot be located. When "
+            "configuring via BFABRICPY_CONFIG_OVERRIDE, include 'env_name' naming the "
+            "environment whose cached token should be used."
+        )
+    cache_path = compute_token_cache_path(base_url, client_id, config_data.env_name).expanduser()
+    if not TokenCache(cache_path).load():
+        raise ValueError("No OAuth tokens found. Run 'bfabric-cli auth login' or 'bfabric-cli auth device-code'.")
+    return OAuthCredentialProvider(
+        client_id=client_id,
+        client_secret="",
+        token_url=f"{base_url}/rest/oauth/token",
+        scope="",
+        grant_type="refresh_token",
+        token_cache_path=cache_path,
+    )
+
+
 def get_system_auth(
     login: str | None = None,
     password: str | None = None,
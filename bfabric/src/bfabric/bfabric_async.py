@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal
+
+from loguru import logger
+
+from bfabric.bfabric import _oauth_provider_from_config
+from bfabric.config import DEFAULT_CONFIG_FILE, BfabricAuth, BfabricClientConfig
+from bfabric.config.config_data import ConfigData, load_config_data
+from bfabric.engine.engine_xml import AsyncEngineXML
+from bfabric.rest.token_data import TokenData, validate_token
+from bfabric.results.result_container import ResultContainer
+from bfabric.utils.paginator import BFABRIC_QUERY_LIMIT, compute_requested_pages
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+    from pydantic import SecretStr
+
+    from bfabric.entities.core.entity_reader_async import AsyncEntityReader
+    from bfabric.experimental.webapp_integration_settings import TokenValidationSettingsProtocol
+    from bfabric.oauth._credential_provider import OAuthCredentialProvider
+    from bfabric.typing import ApiRequestObjectType, ApiResponseObjectType
+
+
+class AsyncBfabric:
+    """Asynchronous B-Fabric client, for use in asyncio applications such as web apps.
+
+    Provides awaitable counterparts of the data methods of :class:`bfabric.Bfabric` (`read`, `iter_read`, `save`,
+    `delete` and `exists`), so that requests do not block the event loop. Requests are sent with
+    :class:`AsyncEngineXML` regardless of the configured engine, over a pool of connections that is shared with the
+    clients created by :meth:`with_auth`. Close the client with :meth:`aclose`, or use it as an async context manager.
+
+    Use `AsyncBfabric.connect()` or `AsyncBfabric.connect_token_async()` to create a new instance.
+    """
+
+    def __init__(
+        self,
+        config_data: ConfigData,
+        *,
+        max_connections: int | None = None,
+        _engine: AsyncEngineXML | None = None,
+        _credential_provider: OAuthCredentialProvider | None = None,
+    ) -> None:
+        self._config = config_data.client
+        self._auth = config_data.auth
+        self._credential_provider = _credential_provider
+        if _engine is None:
+            http_config = self._config.http
+            if max_connections is not None:
+                http_config = http_config.model_copy(update={"max_connections": max_connections})
+            _engine = AsyncEngineXML(base_url=self._config.base_url, http_config=http_config)
+        self._engine = _engine
+
+    @classmethod
+    def connect(
+        cls,
+        *,
+        config_file_path: Path | str = DEFAULT_CONFIG_FILE,
+        config_file_env: str | Literal["default"] | None = "default",
+        include_auth: bool = True,
+        max_connections: int | None = None,
+    ) -> AsyncBfabric:
+        """Returns a new AsyncBfabric instance, configured like :meth:`bfabric.Bfabric.connect`.
+
+        :param config_file_path: a non-standard configuration file to use, if config file is selected as a config source
+        :param config_file_env: name of environment to use, if config file is selected as a config source.
+            if `"default"` is specified, the default environment will be used.
+            if `None` is specified, the file will not be used as a config source.
+        :param include_auth: whether auth information should be included (for servers, setting this to False is useful)
+        :param max_connections: the maximum number of concurrent connections to the B-Fabric instance, overriding
+            `max_connections` of the `http` settings of the config
+        """
+        config_data = load_config_data(
+            config_file_path=config_file_path, include_auth=include_auth, config_file_env=config_file_env
+        )
+        provider = _oauth_provider_from_config(config_data) if config_data.auth_method == "oauth" else None
+        return cls(config_data=config_data, max_connections=max_connections, _credential_provider=provider)
+
+    @classmethod
+    def from_token_data(cls, token_data: TokenData, max_connections: int | None = None) -> AsyncBfabric:
+        """Creates a new AsyncBfabric instance from token data."""
+        config_data_client = BfabricClientConfig.model_validate(dict(base_url=token_data.caller))
+        config_data_auth = BfabricAuth(login=token_data.user, password=token_data.user_ws_password)
+        config_data = ConfigData(client=config_data_client, auth=config_data_auth)
+        return cls(config_data=config_data, max_connections=max_connections)
+
+    @classmethod
+    async def connect_token_async(
+        cls, token: str | SecretStr, settings: TokenValidationSettingsProtocol
+    ) -> tuple[AsyncBfabric, TokenData]:
+        """Returns a new AsyncBfabric instance configured with the provided token.
+
+        Settings needs to be configured to allow the desired B-Fabric instances. A server handling many users should
+        rather create a single client and call :meth:`with_auth` for every request, to reuse its connections.
+        """
+        token_data = await validate_token(token=token, settings=settings)
+        return cls.from_token_data(token_data), token_data
+
+    @property
+    def config(self) -> BfabricClientConfig:
+        """Returns the config object."""
+        return self._config
+
+    @property
+    def auth(self) -> BfabricAuth:
+        """Returns the auth object.
+
+        :raises ValueError: If authentication is not available
+        """
+        if self._credential_provider is not None:
+            return self._credential_provider.get_auth()
+        if self._auth is None:
+            raise ValueError("Authentication not available")
+        return self._auth
+
+    def with_auth(self, auth: BfabricAuth) -> AsyncBfabric:
+        """Returns a client authenticating with `auth`, which shares the connections of this client.
+
+        Unlike :meth:`bfabric.Bfabric.with_auth` this does not modify the client, as concurrent tasks might be using
+        it with different users.
+        """
+        client = copy.copy(self)
+        client.__dict__.pop("reader", None)
+        client._auth = auth
+        client._credential_provider = None
+        return client
+
+    @cached_property
+    def reader(self) -> AsyncEntityReader:
+        """Returns an AsyncEntityReader for this client."""
+        from bfabric.entities.core.entity_reader_async import AsyncEntityReader
+
+        return AsyncEntityReader.for_client(client=self)
+
+    async def read(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        max_results: int | None = 100,
+        offset: int = 0,
+        check: bool = True,
+        return_id_only: bool = False,
+        max_concurrency: int = 4,
+    ) -> ResultContainer:
+        """Reads from the specified endpoint matching all specified attributes in `obj`, see
+        :meth:`bfabric.Bfabric.read`.
+
+        :param max_concurrency: Maximum number of pages to request concurrently, once the first page has been read and
+            the number of pages is known. Results are returned in page order.
+        :return: A :class:`ResultContainer` containing the query results.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        logger.debug(f"Reading from endpoint {repr(endpoint)} with query {repr(obj)}")
+        results = await self._engine.read(
+            endpoint=endpoint, obj=obj, auth=self.auth, page=1, return_id_only=return_id_only
+        )
+        n_available_pages = results.total_pages_api
+        if not n_available_pages:
+            if check:
+                results.assert_success()
+            return results.get_first_n_results(max_results)
+
+        requested_pages, initial_offset = compute_requested_pages(
+            n_page_total=n_available_pages,
+            n_item_per_page=BFABRIC_QUERY_LIMIT,
+            n_item_offset=offset,
+            n_item_return_max=max_results,
+        )
+        logger.debug(f"Requested pages: {requested_pages}")
+
+        # NOTE: Page numbering starts at 1
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read_page(i_page: int) -> ResultContainer:
+            if i_page == 1:
+                return results
+            async with semaphore:
+                logger.debug(f"Reading page {i_page} of {n_available_pages}")
+                return await self._engine.read(
+                    endpoint=endpoint, obj=obj, auth=self.auth, page=i_page, return_id_only=return_id_only
+                )
+
+        page_results = await asyncio.gather(*(read_page(i_page) for i_page in requested_pages))
+
+        response_items: list[ApiResponseObjectType] = []
+        errors = []
+        page_offset = initial_offset
+        for page_result in page_results:
+            errors += page_result.errors
+            response_items += page_result[page_offset:]
+            page_offset = 0
+
+        result = ResultContainer(response_items, total_pages_api=n_available_pages, errors=errors)
+        if check:
+            result.assert_success()
+        return result.get_first_n_results(max_results)
+
+    async def iter_read(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        max_results: int | None = 100,
+        offset: int = 0,
+        check: bool = True,
+        return_id_only: bool = False,
+    ) -> AsyncGenerator[ResultContainer, None]:
+        """Reads from the specified endpoint like :meth:`read`, but yields the results page by page as they are fetched,
+        see :meth:`bfabric.Bfabric.iter_read`, e.g. ``async for page in client.iter_read(...): ...``.
+
+        :return: An async generator of :class:`ResultContainer`, one per page that was read.
+        """
+        logger.debug(f"Reading from endpoint {repr(endpoint)} with query {repr(obj)}")
+        results = await self._engine.read(
+            endpoint=endpoint, obj=obj, auth=self.auth, page=1, return_id_only=return_id_only
+        )
+        if check:
+            results.assert_success()
+        n_available_pages = results.total_pages_api
+        if not n_available_pages:
+            yield results.get_first_n_results(max_results)
+            return
+
+        requested_pages, initial_offset = compute_requested_pages(
+            n_page_total=n_available_pages,
+            n_item_per_page=BFABRIC_QUERY_LIMIT,
+            n_item_offset=offset,
+            n_item_return_max=max_results,
+        )
+        logger.debug(f"Requested pages: {requested_pages}")
+
+        n_remaining = max_results
+        page_offset = initial_offset
+        for i_page in requested_pages:
+            if i_page != 1:
+                logger.debug(f"Reading page {i_page} of {n_available_pages}")
+                results = await self._engine.read(
+                    endpoint=endpoint, obj=obj, auth=self.auth, page=i_page, return_id_only=return_id_only
+                )
+                if check:
+                    results.assert_success()
+            response_items = results[page_offset:]
+            page_offset = 0
+            if n_remaining is not None:
+                response_items = response_items[:n_remaining]
+                n_remaining -= len(response_items)
+            yield ResultContainer(response_items, total_pages_api=n_available_pages, errors=results.errors)
+
+    async def save(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType | list[ApiRequestObjectType],
+        check: bool = True,
+        method: str = "save",
+    ) -> ResultContainer:
+        """Saves the provided object to the specified endpoint, see :meth:`bfabric.Bfabric.save`."""
+        results = await self._engine.save(endpoint=endpoint, obj=obj, auth=self.auth, method=method)
+        if check:
+            results.assert_success()
+        return results
+
+    async def delete(self, endpoint: str, id: int | list[int], check: bool = True) -> ResultContainer:
+        """Deletes the object with the specified ID from the specified endpoint, see :meth:`bfabric.Bfabric.delete`."""
+        results = await self._engine.delete(endpoint=endpoint, id=id, auth=self.auth)
+        if check:
+            results.assert_success()
+        return results
+
+    async def exists(
+        self,
+        endpoint: str,
+        key: str,
+        value: int | str,
+        query: ApiRequestObjectType | None = None,
+        check: bool = True,
+    ) -> bool:
+        """Returns whether an object with the specified key-value pair exists in the specified endpoint, see
+        :meth:`bfabric.Bfabric.exists`."""
+        query = query or {}
+        results = await self.read(
+            endpoint=endpoint,
+            obj={**query, key: value},
+            max_results=1,
+            check=check,
+            return_id_only=True,
+        )
+        return len(results) > 0
+
+    async def aclose(self) -> None:
+        """Closes the connections of the client, and of all clients sharing them."""
+        await self._engine.aclose()
+
+    async def __aenter__(self) -> AsyncBfabric:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        config_data = ConfigData(client=self._config, auth=self._auth)
+        return f"AsyncBfabric({config_data=})"
+
+    __str__ = __repr__
@@ -1,5 +1,5 @@
 from .bfabric_auth import BfabricAuth
-from .bfabric_client_config import BfabricClientConfig
+from .bfabric_client_config import BfabricClientConfig, BfabricHttpConfig
 from .config_file import ConfigFile, DEFAULT_CONFIG_FILE
 
-__all__ = ["BfabricAuth", "BfabricClientConfig", "ConfigFile", "DEFAULT_CONFIG_FILE"]
+__all__ = ["BfabricAuth", "BfabricClientConfig", "BfabricHttpConfig", "ConfigFile", "DEFAULT_CONFIG_FILE"]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import datetime
 from enum import StrEnum
 from typing import Annotated
 
-from pydantic import AfterValidator, AnyHttpUrl, BaseModel, Field, TypeAdapter
+from pydantic import AfterValidator, AnyHttpUrl, BaseModel, Field, NonNegativeInt, PositiveInt, TypeAdapter
 
 
 def _validate_base_url(value: str) -> str:
@@ -20,11 +21,30 @@ class BfabricAPIEngineType(StrEnum):
     """Choice of engine to use."""
 
     SUDS = "SUDS"
+    XML = "XML"
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}.{self.name}"
 
 
+class BfabricHttpConfig(BaseModel):
+    """Holds the settings of the pool of HTTP connections to a B-Fabric instance, which is shared by all requests of a
+    client.
+
+    :param max_connections: The maximum number of concurrent connections.
+    :param max_keepalive_connections: The maximum number of idle connections kept alive for later requests.
+    :param keepalive_expiry: How long an idle connection is kept alive.
+    :param timeout: The timeout of the HTTP requests.
+    :param http2: Whether to use HTTP/2 where the server supports it, which requires the `http2` extra.
+    """
+
+    max_connections: PositiveInt = 20
+    max_keepalive_connections: NonNegativeInt = 20
+    keepalive_expiry: datetime.timedelta = datetime.timedelta(seconds=15)
+    timeout: datetime.timedelta = datetime.timedelta(seconds=90)
+    http2: bool = False
+
+
 class BfabricClientConfig(BaseModel):
     """Holds the configuration for the B-Fabric client for connecting to particular instance of B-Fabric.
 
@@ -32,12 +52,16 @@ class BfabricClientConfig(BaseModel):
     :param application_ids (optional): Map of application names to ids.
     :param job_notification_emails (optional): Space-separated list of email addresses to notify when a job finishes.
     :param engine: The API engine to use (optional).
+    :param wsdl_cache_ttl: How long the WSDL of the endpoints is cached on disk, `None` disables the cache (optional).
+    :param http: The settings of the pool of HTTP connections (optional).
     """
 
     base_url: _ValidatedBaseUrl
     application_ids: Annotated[dict[str, int], Field(default_factory=dict)]
     job_notification_emails: Annotated[str, Field(default="")]
     engine: BfabricAPIEngineType = BfabricAPIEngineType.SUDS
+    wsdl_cache_ttl: datetime.timedelta | None = datetime.timedelta(days=1)
+    http: BfabricHttpConfig = BfabricHttpConfig()
 
     def copy_with(
         self,
@@ -49,6 +73,8 @@ class BfabricClientConfig(BaseModel):
             base_url=base_url if base_url is not None else self.base_url,
             application_ids=(application_ids if application_ids is not None else self.application_ids),
             job_notification_emails=self.job_notification_emails,
+            wsdl_cache_ttl=self.wsdl_cache_ttl,
+            http=self.http,
         )
 
     def __str__(self) -> str:
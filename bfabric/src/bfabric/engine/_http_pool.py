@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import importlib.util
+import io
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import suds.transport
+
+from bfabric.errors import BfabricConfigError, raise_if_unavailable
+
+if TYPE_CHECKING:
+    from bfabric.config.bfabric_client_config import BfabricHttpConfig
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    """Counters of the requests sent through an :class:`HttpPool` and the connections they used.
+
+    :param requests: the number of requests sent
+    :param connections_opened: the number of connections that were opened to send them
+    :param requests_per_connection: the number of requests sent over each connection that is still open
+    """
+
+    requests: int
+    connections_opened: int
+    requests_per_connection: tuple[int, ...]
+
+    @property
+    def requests_reused(self) -> int:
+        """Returns the number of requests which were sent over an already open connection."""
+        return self.requests - self.connections_opened
+
+
+class HttpPool:
+    """A thread-safe `httpx.Client` keeping its connections alive, shared by all requests of an engine.
+
+    Every response is counted by the connection it was received on, so :attr:`stats` shows whether connections are
+    actually reused. Responses of transports without network streams, e.g. `httpx.MockTransport`, count as a new
+    connection each.
+
+    :param config: the pool limits, timeout and HTTP version to use
+    :param transport: the transport to send the requests with, by default a new `httpx.HTTPTransport`
+    """
+
+    def __init__(self, config: BfabricHttpConfig, transport: httpx.BaseTransport | None = None) -> None:
+        _check_http2(config)
+        self._lock = threading.Lock()
+        self._n_requests = 0
+        self._n_connections = 0
+        self._connection_requests: weakref.WeakKeyDictionary[Any, int] = weakref.WeakKeyDictionary()
+        self.client = httpx.Client(
+            timeout=config.timeout.total_seconds(),
+            limits=_limits(config),
+            http2=config.http2,
+            transport=transport,
+            event_hooks={"response": [self._count_response]},
+        )
+
+    @property
+    def stats(self) -> ConnectionStats:
+        """Returns the current request and connection counters."""
+        with self._lock:
+            return ConnectionStats(
+                requests=self._n_requests,
+                connections_opened=self._n_connections,
+                requests_per_connection=tuple(self._connection_requests.values()),
+            )
+
+    def close(self) -> None:
+        """Closes all connections of the pool."""
+        self.client.close()
+
+    def _count_response(self, response: httpx.Response) -> None:
+        stream = response.extensions.get("network_stream")
+        with self._lock:
+            self._n_requests += 1
+            if stream is None:
+                self._n_connections += 1
+                return
+            n_requests = self._connection_requests.get(stream, 0)
+            if n_requests == 0:
+                self._n_connections += 1
+            self._connection_requests[stream] = n_requests + 1
+
+
+def create_async_client(config: BfabricHttpConfig) -> httpx.AsyncClient:
+    """Returns an `httpx.AsyncClient` with the pool limits, timeout and HTTP version of `config`."""
+    _check_http2(config)
+    return httpx.AsyncClient(timeout=config.timeout.total_seconds(), limits=_limits(config), http2=config.http2)
+
+
+def _check_http2(config: BfabricHttpConfig) -> None:
+    if config.http2 and importlib.util.find_spec("h2") is None:
+        raise BfabricConfigError(
+            "HTTP/2 requires the h2 package; install the http2 extra with `pip install 'bfabric[http2]'`."
+        )
+
+
+def _limits(config: BfabricHttpConfig) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry.total_seconds(),
+    )
+
+
+class HttpxTransport(suds.transport.Transport):
+    """A suds transport sending the requests through an :class:`HttpPool`.
+
+    The default suds transport opens a new connection for most requests. Suds deep copies the transport of a client
+    for each of its clones, so the copies of this transport all share the pool instead.
+
+    An HTTP error status is raised as `suds.transport.TransportError` like in the default transport, which suds relies
+    on to parse SOAP faults, while a connection failure is raised as :class:`bfabric.errors.BfabricUnavailableError`.
+
+    :param pool: the pool to send the requests with
+    :param base_url: the base url of the B-Fabric instance, for error messages
+    """
+
+    def __init__(self, pool: HttpPool, base_url: str) -> None:
+        super().__init__()
+        self._pool = pool
+        self._base_url = base_url
+
+    # suds declares the methods of the base class without annotations, so pyright infers their return type as Never
+    def open(  # pyright: ignore[reportIncompatibleMethodOverride, reportImplicitOverride]
+        self, request: suds.transport.Request
+    ) -> io.BytesIO:
+        """Fetches a document, i.e. a WSDL or XSD file, and returns it as a stream."""
+        response = self._request("GET", request)
+        return io.BytesIO(response.content)
+
+    def send(  # pyright: ignore[reportIncompatibleMethodOverride, reportImplicitOverride]
+        self, request: suds.transport.Request
+    ) -> suds.transport.Reply:
+        """Sends a SOAP request and returns the reply."""
+        response = self._request("POST", request)
+        return suds.transport.Reply(response.status_code, dict(response.headers), response.content)
+
+    def _request(self, method: str, request: suds.transport.Request) -> httpx.Response:
+        with raise_if_unavailable(self._base_url):
+            response = self._pool.client.request(
+                method, request.url, content=request.message, headers=request.headers, follow_redirects=True
+            )
+        if response.status_code >= 400:
+            raise suds.transport.TransportError(
+                response.reason_phrase, response.status_code, io.BytesIO(response.content)
+            )
+        return response
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> HttpxTransport:
+        return self
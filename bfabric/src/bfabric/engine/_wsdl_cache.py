@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import datetime
+import pickle
+import tempfile
+from pathlib import Path
+from typing import IO, Any
+
+from loguru import logger
+from suds.cache import ObjectCache
+
+# Default location of the persistent WSDL cache. The tilde is kept unexpanded here;
+# it is expanded when the cache is opened.
+DEFAULT_WSDL_CACHE_DIR = Path("~/.bfabric/wsdl")
+
+
+class WsdlCache(ObjectCache):
+    """Persists the parsed WSDL definitions of the suds clients on disk, so that a new process does not have to
+    download and parse the WSDL of every endpoint again.
+
+    Entries are keyed by suds on the WSDL URL, i.e. on base url and endpoint, and the whole cache is discarded by suds
+    when its version changes. Unlike suds' own file cache, expired entries are not deleted but only ignored, so that
+    they remain available through :meth:`stale` as a fallback when the B-Fabric instance cannot be reached.
+    """
+
+    def __init__(self, location: Path, ttl: datetime.timedelta, *, allow_stale: bool = False) -> None:
+        super().__init__(location=str(location), seconds=ttl.total_seconds())
+        self._allow_stale = allow_stale
+
+    @classmethod
+    def try_open(cls, location: Path, ttl: datetime.timedelta) -> WsdlCache | None:
+        """Returns the cache at `location`, or `None` if it cannot be used (e.g. because the location is not
+        writable), in which case clients simply fetch the WSDL every time."""
+        try:
+            return cls(location.expanduser(), ttl=ttl)
+        except OSError as error:
+            logger.warning(f"WSDL cache at {location} cannot be used, continuing without: {error}")
+            return None
+
+    def stale(self) -> WsdlCache:
+        """Returns a view of this cache which also returns expired entries."""
+        return WsdlCache(Path(self.location), ttl=self.duration, allow_stale=True)
+
+    def put(self, id: str, object: Any) -> Any:
+        """Stores `object` under `id`, replacing the file atomically as other processes might be reading it."""
+        path = self._path(id)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as file:
+                pickle.dump(object, file, self.protocol)
+            _ = Path(file.name).replace(path)
+        except (OSError, pickle.PicklingError) as error:
+            logger.debug(f"Failed to write WSDL cache entry {path}: {error}")
+        return object
+
+    def _getf(self, id: str) -> IO[bytes] | None:
+        """Opens the cache file for `id`, if it exists and, unless stale entries are allowed, has not expired."""
+        path = self._path(id)
+        try:
+            if not self._allow_stale and self._is_expired(path):
+                logger.debug(f"WSDL cache entry {path} expired")
+                return None
+            return path.open("rb")
+        except OSError:
+            return None
+
+    def _is_expired(self, path: Path) -> bool:
+        if not self.duration:
+            return False
+        modified = datetime.datetime.fromtimestamp(path.stat().st_mtime)
+        return modified + self.duration < datetime.datetime.now()
+
+    def _path(self, id: str) -> Path:
+        return Path(self.location) / f"{self.fnprefix}-{id}.{self.fnsuffix()}"
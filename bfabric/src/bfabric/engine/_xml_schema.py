@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+from xml.etree import ElementTree
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    _Document = tuple[ElementTree.Element, dict[str, str]]
+
+XSD_NS = "http://www.w3.org/2001/XMLSchema"
+XSI_NS = "http://www.w3.org/2001/XMLSchema-instance"
+WSDL_SOAP_NS = "http://schemas.xmlsoap.org/wsdl/soap/"
+
+
+@dataclass(frozen=True)
+class XmlField:
+    """An element or attribute of a complex type, with its type as a ``{namespace}name`` string."""
+
+    type_name: str | None
+    is_list: bool = False
+    nillable: bool = False
+
+
+@dataclass
+class ComplexType:
+    """The elements (in sequence order) and attributes of a complex type, excluding those of its base type."""
+
+    elements: dict[str, XmlField] = field(default_factory=dict)
+    attributes: dict[str, XmlField] = field(default_factory=dict)
+    base: str | None = None
+
+
+@dataclass
+class XmlSchema:
+    """The parts of the XML schema of a WSDL needed to encode requests and decode responses without suds.
+
+    Only the constructs used by the B-Fabric web services are supported: named and anonymous complex types built from
+    sequences, choices and extensions, simple types restricting a builtin type, and imported or included schemas.
+    """
+
+    target_namespace: str = ""
+    qualified_elements: bool = False
+    address: str | None = None
+    elements: dict[str, str | None] = field(default_factory=dict)
+    complex_types: dict[str, ComplexType] = field(default_factory=dict)
+    simple_types: dict[str, str] = field(default_factory=dict)
+    _resolved: dict[str, ComplexType] = field(default_factory=dict, repr=False)
+
+    def complex_type(self, type_name: str | None) -> ComplexType | None:
+        """Returns the complex type `type_name` including the fields of its base types, or `None` if it is not a
+        known complex type."""
+        if type_name is None:
+            return None
+        if type_name not in self._resolved:
+            complex_type = self.complex_types.get(type_name)
+            if complex_type is None:
+                return None
+            base = self.complex_type(complex_type.base)
+            if base is not None:
+                complex_type = ComplexType(
+                    elements={**base.elements, **complex_type.elements},
+                    attributes={**base.attributes, **complex_type.attributes},
+                )
+            self._resolved[type_name] = complex_type
+        return self._resolved[type_name]
+
+    def builtin_type(self, type_name: str | None) -> str | None:
+        """Returns the local name of the builtin XSD type that `type_name` is or restricts, if any."""
+        seen = set()
+        while type_name is not None and type_name not in seen:
+            if type_name.startswith(f"{{{XSD_NS}}}"):
+                return type_name[len(XSD_NS) + 2 :]
+            seen.add(type_name)
+            type_name = self.simple_types.get(type_name)
+        return None
+
+
+def parse_wsdl(url: str, fetch: Callable[[str], bytes]) -> XmlSchema:
+    """Parses the WSDL at `url` and the schemas it references, which are all retrieved with `fetch`."""
+    documents: dict[str, _Document] = {}
+    pending = [url]
+    while pending:
+        location = pending.pop()
+        if location not in documents:
+            documents[location] = _parse_document(fetch(location))
+            pending.extend(_referenced_locations(documents[location], base_url=location))
+    return _parse_wsdl_documents(url, documents)
+
+
+async def parse_wsdl_async(url: str, fetch: Callable[[str], Awaitable[bytes]]) -> XmlSchema:
+    """Parses the WSDL at `url` and the schemas it references, like :func:`parse_wsdl` but with an async `fetch`."""
+    documents: dict[str, _Document] = {}
+    pending = [url]
+    while pending:
+        location = pending.pop()
+        if location not in documents:
+            documents[location] = _parse_document(await fetch(location))
+            pending.extend(_referenced_locations(documents[location], base_url=location))
+    return _parse_wsdl_documents(url, documents)
+
+
+def _parse_wsdl_documents(url: str, documents: dict[str, _Document]) -> XmlSchema:
+    """Builds the schema of the WSDL at `url` from the already retrieved `documents`, which are keyed by URL."""
+    schema = XmlSchema()
+    root, namespaces = documents[url]
+    schema.target_namespace = root.get("targetNamespace", "")
+    for address in root.iter(f"{{{WSDL_SOAP_NS}}}address"):
+        schema.address = address.get("location")
+    parser = _SchemaParser(schema, documents, namespaces)
+    for schema_elem in root.iter(f"{{{XSD_NS}}}schema"):
+        parser.add_schema(schema_elem, base_url=url)
+    return schema
+
+
+def _parse_document(content: bytes) -> _Document:
+    """Parses an XML document, returning its root and the namespace prefixes declared anywhere in it."""
+    namespaces: dict[str, str] = {}
+    root = None
+    for event, item in ElementTree.iterparse(io.BytesIO(content), events=("start-ns", "start")):
+        if event == "start-ns":
+            prefix, uri = item
+            namespaces.setdefault(prefix, uri)
+        elif root is None:
+            root = item
+    if root is None:
+        raise ValueError("Empty XML document")
+    return root, namespaces
+
+
+def _referenced_locations(document: _Document, base_url: str) -> list[str]:
+    """Returns the URLs of the schemas imported or included by the schemas in `document`."""
+    root, _ = document
+    return [
+        urljoin(base_url, child.get("schemaLocation", ""))
+        for schema_elem in root.iter(f"{{{XSD_NS}}}schema")
+        for child in schema_elem
+        if child.tag in (f"{{{XSD_NS}}}import", f"{{{XSD_NS}}}include") and child.get("schemaLocation")
+    ]
+
+
+class _SchemaParser:
+    """Adds the definitions of XSD schema elements to an :class:`XmlSchema`."""
+
+    def __init__(self, schema: XmlSchema, documents: dict[str, _Document], namespaces: dict[str, str]) -> None:
+        self._schema = schema
+        self._documents = documents
+        self._namespaces = namespaces
+        self._visited: set[str] = set()
+
+    def add_schema(self, elem: ElementTree.Element, base_url: str) -> None:
+        target_namespace = elem.get("targetNamespace", "")
+        if elem.get("elementFormDefault") == "qualified" and target_namespace == self._schema.target_namespace:
+            self._schema.qualified_elements = True
+        for child in elem:
+            name = child.get("name")
+            if child.tag in (f"{{{XSD_NS}}}import", f"{{{XSD_NS}}}include"):
+                self._add_referenced_schema(child.get("schemaLocation"), base_url=base_url)
+            elif child.tag == f"{{{XSD_NS}}}element" and name:
+                qualified_name = f"{{{target_namespace}}}{name}"
+                self._schema.elements[qualified_name] = self._element_type(child, qualified_name)
+            elif child.tag == f"{{{XSD_NS}}}complexType" and name:
+                self._add_complex_type(child, f"{{{target_namespace}}}{name}")
+            elif child.tag == f"{{{XSD_NS}}}simpleType" and name:
+                restriction = child.find(f"{{{XSD_NS}}}restriction")
+                base = self._qname(restriction.get("base")) if restriction is not None else None
+                self._schema.simple_types[f"{{{target_namespace}}}{name}"] = base or f"{{{XSD_NS}}}string"
+
+    def _add_referenced_schema(self, location: str | None, base_url: str) -> None:
+        if not location:
+            return
+        url = urljoin(base_url, location)
+        if url in self._visited:
+            return
+        self._visited.add(url)
+        root, namespaces = self._documents[url]
+        outer_namespaces = self._namespaces
+        self._namespaces = {**outer_namespaces, **namespaces}
+        try:
+            self.add_schema(root, base_url=url)
+        finally:
+            self._namespaces = outer_namespaces
+
+    def _add_complex_type(self, elem: ElementTree.Element, qualified_name: str) -> None:
+        complex_type = ComplexType()
+        self._schema.complex_types[qualified_name] = complex_type
+        self._collect_content(elem, complex_type, qualified_name, in_list=False)
+
+    def _collect_content(
+        self, elem: ElementTree.Element, complex_type: ComplexType, type_name: str, in_list: bool
+    ) -> None:
+        """Collects the elements and attributes of the content model `elem` into `complex_type`."""
+        for child in elem:
+            if child.tag == f"{{{XSD_NS}}}element":
+                self._add_element_field(child, complex_type, type_name, in_list=in_list)
+            elif child.tag == f"{{{XSD_NS}}}attribute" and child.get("name"):
+                complex_type.attributes[child.get("name", "")] = XmlField(type_name=self._qname(child.get("type")))
+            elif child.tag in (f"{{{XSD_NS}}}sequence", f"{{{XSD_NS}}}choice", f"{{{XSD_NS}}}all"):
+                is_list = in_list or _is_multi_occurrence(child)
+                self._collect_content(child, complex_type, type_name, in_list=is_list)
+            elif child.tag in (f"{{{XSD_NS}}}complexContent", f"{{{XSD_NS}}}simpleContent"):
+                self._collect_content(child, complex_type, type_name, in_list=in_list)
+            elif child.tag in (f"{{{XSD_NS}}}extension", f"{{{XSD_NS}}}restriction"):
+                complex_type.base = self._qname(child.get("base"))
+                self._collect_content(child, complex_type, type_name, in_list=in_list)
+
+    def _add_element_field(
+        self, elem: ElementTree.Element, complex_type: ComplexType, type_name: str, in_list: bool
+    ) -> None:
+        ref = self._qname(elem.get("ref"))
+        if ref is not None:
+            name = ref.rpartition("}")[2]
+            field_type = self._schema.elements.get(ref)
+        else:
+            name = elem.get("name", "")
+            field_type = self._element_type(elem, f"{type_name}.{name}")
+        complex_type.elements[name] = XmlField(
+            type_name=field_type,
+            is_list=in_list or _is_multi_occurrence(elem),
+            nillable=elem.get("nillable") == "true",
+        )
+
+    def _element_type(self, elem: ElementTree.Element, anonymous_name: str) -> str | None:
+        """Returns the type of an element declaration, registering its anonymous type under `anonymous_name`."""
+        if elem.get("type"):
+            return self._qname(elem.get("type"))
+        inline_complex = elem.find(f"{{{XSD_NS}}}complexType")
+        if inline_complex is not None:
+            self._add_complex_type(inline_complex, anonymous_name)
+            return anonymous_name
+        inline_simple = elem.find(f"{{{XSD_NS}}}simpleType/{{{XSD_NS}}}restriction")
+        if inline_simple is not None:
+            return self._qname(inline_simple.get("base"))
+        return f"{{{XSD_NS}}}string"
+
+    def _qname(self, value: str | None) -> str | None:
+        """Resolves a prefixed name like ``tns:sample`` to ``{namespace}sample``."""
+        if value is None:
+            return None
+        prefix, _, local_name = value.rpartition(":")
+        return f"{{{self._namespaces.get(prefix, '')}}}{local_name}"
+
+
+def _is_multi_occurrence(elem: ElementTree.Element) -> bool:
+    max_occurs = elem.get("maxOccurs", "1")
+    return max_occurs == "unbounded" or int(max_occurs) > 1
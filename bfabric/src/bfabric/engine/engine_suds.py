@@ -1,33 +1,66 @@
 from __future__ import annotations
 
 import copy
-from typing import TYPE_CHECKING, Any
+import threading
+from typing import TYPE_CHECKING, Any, cast
 from urllib.error import URLError
 
 import suds.transport
+from loguru import logger
 from suds import MethodNotFound
 from suds.client import Client
 
-from bfabric.engine.response_format_suds import suds_asdict_recursive
+from bfabric.config.bfabric_client_config import BfabricHttpConfig
+from bfabric.engine._http_pool import ConnectionStats, HttpPool, HttpxTransport
+from bfabric.engine._wsdl_cache import DEFAULT_WSDL_CACHE_DIR, WsdlCache
+from bfabric.engine.response_format_suds import suds_asdict_clean
 from bfabric.errors import BfabricRequestError, BfabricUnavailableError, get_response_errors
 from bfabric.results.response_delete import ResponseDelete
-from bfabric.results.response_format_dict import clean_result
 from bfabric.results.result_container import ResultContainer
 
 if TYPE_CHECKING:
-    from suds.serviceproxy import ServiceProxy
+    import datetime
+    from pathlib import Path
+
+    from suds.client import ServiceSelector
 
     from bfabric.config import BfabricAuth
     from bfabric.typing import ApiRequestObjectType
 
 
 class EngineSUDS:
-    """B-Fabric API SUDS Engine."""
+    """B-Fabric API SUDS Engine.
+
+    :param base_url: the base url of the B-Fabric instance
+    :param drop_underscores: whether to drop the leading underscores suds adds to some keys of the results
+    :param wsdl_cache_ttl: if set, the parsed WSDL of every endpoint is cached on disk for this duration and shared
+        with other processes, otherwise the WSDL is fetched once per engine and endpoint
+    :param wsdl_cache_dir: the directory of the WSDL cache
+    :param http_config: the settings of the pool of HTTP connections, which is shared by the clients of all endpoints
+        and threads
+    """
 
-    def __init__(self, base_url: str, drop_underscores: bool = True) -> None:
-        self._cl = {}
+    def __init__(
+        self,
+        base_url: str,
+        drop_underscores: bool = True,
+        wsdl_cache_ttl: datetime.timedelta | None = None,
+        wsdl_cache_dir: Path = DEFAULT_WSDL_CACHE_DIR,
+        http_config: BfabricHttpConfig | None = None,
+    ) -> None:
+        self._cl: dict[str, Client] = {}
+        self._cl_lock: threading.Lock = threading.Lock()
+        self._thread_local: threading.local = threading.local()
         self._base_url = base_url
         self._drop_underscores = drop_underscores
+        self._wsdl_cache = WsdlCache.try_open(wsdl_cache_dir, ttl=wsdl_cache_ttl) if wsdl_cache_ttl else None
+        self._http_pool = HttpPool(http_config or BfabricHttpConfig())
+        self._transport = HttpxTransport(self._http_pool, base_url=base_url)
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Returns the counters of the requests sent by this engine and the connections they used."""
+        return self._http_pool.stats
 
     def read(
         self,
@@ -96,25 +129,63 @@ class EngineSUDS:
         response = service.delete(query)
         return ResponseDelete.from_suds(suds_response=response, endpoint=endpoint)
 
-    def _get_suds_service(self, endpoint: str) -> ServiceProxy:
+    def close(self) -> None:
+        """Closes the connections of the engine."""
+        self._http_pool.close()
+
+    def _get_suds_service(self, endpoint: str) -> ServiceSelector:
         """Returns a SUDS service for the given endpoint. Reuses existing instances when possible.
 
+        A suds client is not safe to share between threads, so every thread gets its own client. Only the first one
+        per endpoint fetches the WSDL, the clients of other threads are clones sharing the parsed WSDL.
+        """
+        if not hasattr(self._thread_local, "clients"):
+            self._thread_local.clients = {}
+        thread_clients = cast("dict[str, Client]", self._thread_local.clients)
+        if endpoint not in thread_clients:
+            with self._cl_lock:
+                if endpoint in self._cl:
+                    thread_clients[endpoint] = self._cl[endpoint].clone()
+                else:
+                    thread_clients[endpoint] = self._cl[endpoint] = self._create_suds_client(endpoint)
+        return thread_clients[endpoint].service
+
+    def _create_suds_client(self, endpoint: str) -> Client:
+        """Creates a new SUDS client for the given endpoint, from the WSDL cache if possible.
+
+        If the WSDL cannot be fetched because the instance is unreachable, an expired WSDL cache entry is used
+        instead, if there is one.
+        """
+        if self._wsdl_cache is None:
+            return self._fetch_suds_client(endpoint, cache=None)
+        try:
+            return self._fetch_suds_client(endpoint, cache=self._wsdl_cache)
+        except BfabricUnavailableError as error:
+            # raises the same error again if there is no expired entry
+            client = self._fetch_suds_client(endpoint, cache=self._wsdl_cache.stale())
+            logger.warning(f"Using expired cached WSDL for endpoint {repr(endpoint)}: {error}")
+            return client
+
+    def _fetch_suds_client(self, endpoint: str, cache: WsdlCache | None) -> Client:
+        """Creates a new SUDS client for the given endpoint, fetching its WSDL unless it is found in `cache`.
+
         Fetching the WSDL is the first thing every operation does, so it is also where an unreachable
         instance shows up. Both failure shapes are translated here: suds raises ``TransportError`` for
         an HTTP status and lets urllib's ``URLError`` through for a connection-level failure, and
         neither is a ``RuntimeError``, so untranslated they escape the callers' error handling.
+        The pooled transport raises ``BfabricUnavailableError`` for a connection-level failure itself.
         """
-        if endpoint not in self._cl:
-            try:
-                self._cl[endpoint] = Client(f"{self._base_url}/{endpoint}?wsdl", cache=None)
-            except suds.transport.TransportError as error:
-                if error.httpcode == 404:
-                    msg = f"Non-existent endpoint {repr(endpoint)} or the configured B-Fabric instance was not found."
-                    raise BfabricRequestError(msg) from error
-                raise BfabricUnavailableError(self._base_url, error) from error
-            except URLError as error:
-                raise BfabricUnavailableError(self._base_url, error) from error
-        return self._cl[endpoint].service
+        try:
+            if cache is None:
+                return Client(f"{self._base_url}/{endpoint}?wsdl", cache=None, transport=self._transport)
+            return Client(f"{self._base_url}/{endpoint}?wsdl", cache=cache, cachingpolicy=1, transport=self._transport)
+        except suds.transport.TransportError as error:
+            if error.httpcode == 404:
+                msg = f"Non-existent endpoint {repr(endpoint)} or the configured B-Fabric instance was not found."
+                raise BfabricRequestError(msg) from error
+            raise BfabricUnavailableError(self._base_url, error) from error
+        except URLError as error:
+            raise BfabricUnavailableError(self._base_url, error) from error
 
     def _convert_results(self, response: Any, endpoint: str) -> ResultContainer:
         try:
@@ -124,13 +195,5 @@ class EngineSUDS:
         errors = get_response_errors(response, endpoint=endpoint)  # pyright: ignore[reportAny]
         if not hasattr(response, endpoint):
             return ResultContainer([], total_pages_api=0, errors=errors)
-        results = []
-        for result in response[endpoint]:
-            result_parsed = suds_asdict_recursive(result, convert_types=True)
-            result_parsed = clean_result(
-                result_parsed,
-                drop_underscores_suds=self._drop_underscores,
-                sort_keys=True,
-            )
-            results += [result_parsed]
+        results = [suds_asdict_clean(result, drop_underscores=self._drop_underscores) for result in response[endpoint]]
         return ResultContainer(results=results, total_pages_api=n_available_pages, errors=errors)
@@ -0,0 +1,482 @@
+from __future__ import annotations
+
+import copy
+import datetime
+import threading
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any, cast
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape, quoteattr
+
+import httpx
+
+from bfabric.config.bfabric_client_config import BfabricHttpConfig
+from bfabric.engine._http_pool import ConnectionStats, HttpPool, create_async_client
+from bfabric.engine._xml_schema import XSI_NS, XmlField, XmlSchema, parse_wsdl, parse_wsdl_async
+from bfabric.errors import BfabricRequestError, BfabricUnavailableError, raise_if_unavailable
+from bfabric.results.response_delete import ResponseDelete
+from bfabric.results.result_container import ResultContainer
+
+if TYPE_CHECKING:
+    from bfabric.config import BfabricAuth
+    from bfabric.typing import ApiRequestObjectType
+
+_ENVELOPE_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" xmlns:ns0={namespace}>'
+    "<soapenv:Header/><soapenv:Body><ns0:{method}{default_namespace}>{parameters}</ns0:{method}></soapenv:Body>"
+    "</soapenv:Envelope>"
+)
+_SOAP_ENVELOPE_NS = "http://schemas.xmlsoap.org/soap/envelope/"
+_REQUEST_HEADERS = {"Content-Type": "text/xml; charset=utf-8", "SOAPAction": '""'}
+_XSI_NIL = f"{{{XSI_NS}}}nil"
+_DROPPED_UNDERSCORE_KEYS = frozenset({"id", "classname", "projectid"})
+_INT_TYPES = frozenset(
+    {"int", "long", "short", "byte", "integer", "nonNegativeInteger", "positiveInteger", "unsignedInt", "unsignedLong"}
+)
+_FLOAT_TYPES = frozenset({"double", "float", "decimal"})
+
+# Number of ancestors of the elements in a response: Envelope > Body > e.g. readResponse > return > e.g. sample
+_DEPTH_BODY_CHILD = 2
+_DEPTH_RETURN_CHILD = 4
+
+
+class _EngineXMLBase:
+    """The parts of :class:`EngineXML` and :class:`AsyncEngineXML` that do not depend on how requests are sent."""
+
+    def __init__(self, base_url: str, drop_underscores: bool) -> None:
+        self._base_url = base_url
+        self._drop_underscores = drop_underscores
+        self._schemas: dict[str, XmlSchema] = {}
+
+    @staticmethod
+    def _read_parameters(
+        obj: ApiRequestObjectType,
+        auth: BfabricAuth,
+        page: int,
+        return_id_only: bool,
+        include_deletable_and_updatable_fields: bool,
+    ) -> dict[str, Any]:
+        query = copy.deepcopy(dict(obj))
+        query["includedeletableupdateable"] = include_deletable_and_updatable_fields
+        return {
+            "login": auth.login,
+            "page": page,
+            "password": auth.password.get_secret_value(),
+            "query": query,
+            "idonly": return_id_only,
+        }
+
+    @staticmethod
+    def _save_parameters(
+        endpoint: str, obj: ApiRequestObjectType | list[ApiRequestObjectType], auth: BfabricAuth
+    ) -> dict[str, Any]:
+        return {"login": auth.login, "password": auth.password.get_secret_value(), endpoint: obj}
+
+    @staticmethod
+    def _delete_parameters(id: int | list[int], auth: BfabricAuth) -> dict[str, Any]:
+        return {"login": auth.login, "password": auth.password.get_secret_value(), "id": id}
+
+    def _wsdl_url(self, endpoint: str) -> str:
+        return f"{self._base_url}/{endpoint}?wsdl"
+
+    def _service_url(self, schema: XmlSchema, endpoint: str) -> str:
+        return schema.address or f"{self._base_url}/{endpoint}"
+
+    def _check_document_status(self, response: httpx.Response, url: str) -> None:
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as error:
+            if response.status_code == 404:
+                msg = f"Non-existent endpoint or the configured B-Fabric instance was not found: {url}"
+                raise BfabricRequestError(msg) from error
+            raise BfabricUnavailableError(self._base_url, error) from error
+
+    @staticmethod
+    def _check_call_status(response: httpx.Response, endpoint: str) -> None:
+        # SOAP faults are reported with status 500 and parsed from the body like any other response
+        if response.is_error and response.status_code != 500:
+            raise BfabricRequestError(f"HTTP {response.status_code} from the {endpoint} endpoint")
+
+    def _response_parser(self, schema: XmlSchema) -> _ResponseParser:
+        return _ResponseParser(schema=schema, drop_underscores=self._drop_underscores)
+
+    @staticmethod
+    def _render_envelope(schema: XmlSchema, endpoint: str, method: str, parameters: dict[str, Any]) -> bytes:
+        method_type = schema.complex_type(schema.elements.get(f"{{{schema.target_namespace}}}{method}"))
+        if method_type is None:
+            raise BfabricRequestError(f"Failed to find {method} method for the {endpoint} endpoint.")
+        parameters_field = method_type.elements.get("parameters")
+        parameters_type = parameters_field.type_name if parameters_field else None
+        rendered: list[str] = []
+        _Encoder(schema).encode("parameters", parameters, parameters_type, rendered)
+        return _ENVELOPE_TEMPLATE.format(
+            namespace=quoteattr(schema.target_namespace),
+            method=method,
+            default_namespace=f" xmlns={quoteattr(schema.target_namespace)}" if schema.qualified_elements else "",
+            parameters="".join(rendered),
+        ).encode()
+
+    @staticmethod
+    def _convert_results(response: dict[str, Any], endpoint: str) -> ResultContainer:
+        n_available_pages = response.get("numberofpages") or 0
+        if response.get("errorreport"):
+            errors = [BfabricRequestError(response["errorreport"])]
+        else:
+            results = response.get(endpoint, [])
+            errors = [
+                BfabricRequestError(result["errorreport"])
+                for result in (results if isinstance(results, list) else [results])
+                if isinstance(result, dict) and result.get("errorreport")
+            ]
+        if endpoint not in response:
+            return ResultContainer([], total_pages_api=0, errors=errors)
+        results = response[endpoint] if isinstance(response[endpoint], list) else [response[endpoint]]
+        return ResultContainer(results=results, total_pages_api=n_available_pages, errors=errors)
+
+    @staticmethod
+    def _convert_delete(response: dict[str, Any], endpoint: str) -> ResponseDelete:
+        results = response.get(endpoint, [])
+        return ResponseDelete.from_dicts(result_parsed=results if isinstance(results, list) else [results])
+
+
+class EngineXML(_EngineXMLBase):
+    """B-Fabric API engine which talks SOAP directly, without suds.
+
+    Requests are rendered from a template and responses are parsed incrementally while they are received, straight
+    into the same dictionaries :class:`EngineSUDS` returns. The XML schema of each endpoint is read once from its WSDL,
+    to know which elements are lists and how to convert their values.
+
+    :param base_url: the base url of the B-Fabric instance
+    :param drop_underscores: whether to drop the leading underscore of the `id`, `classname` and `projectid` keys,
+        which :class:`EngineSUDS` reports for the XML attributes of the results
+    :param http_config: the settings of the pool of HTTP connections, which is shared by all endpoints and threads
+    """
+
+    def __init__(
+        self, base_url: str, drop_underscores: bool = True, http_config: BfabricHttpConfig | None = None
+    ) -> None:
+        super().__init__(base_url=base_url, drop_underscores=drop_underscores)
+        self._http_pool = HttpPool(http_config or BfabricHttpConfig())
+        self._http = self._http_pool.client
+        self._schemas_lock = threading.Lock()
+
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        """Returns the counters of the requests sent by this engine and the connections they used."""
+        return self._http_pool.stats
+
+    def read(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        auth: BfabricAuth,
+        page: int = 1,
+        return_id_only: bool = False,
+        include_deletable_and_updatable_fields: bool = False,
+    ) -> ResultContainer:
+        """Reads the requested `obj` from `endpoint`.
+        :param endpoint: the endpoint to read from, e.g. "sample"
+        :param obj: a dictionary containing the query, for every field multiple possible values can be provided, the
+            final query requires the condition for each field to be met
+        :param auth: the authentication handle of the user performing the request
+        :param page: the page number to read
+        :param return_id_only: whether to return only the ids of the objects
+        :param include_deletable_and_updatable_fields: whether to include the deletable and updatable fields
+        """
+        parameters = self._read_parameters(obj, auth, page, return_id_only, include_deletable_and_updatable_fields)
+        response = self._call(endpoint=endpoint, method="read", parameters=parameters)
+        return self._convert_results(response=response, endpoint=endpoint)
+
+    def save(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType | list[ApiRequestObjectType],
+        auth: BfabricAuth,
+        method: str = "save",
+    ) -> ResultContainer:
+        """Saves the provided object to the specified endpoint.
+        :param endpoint: the endpoint to save to, e.g. "sample"
+        :param obj: the object to save
+        :param auth: the authentication handle of the user performing the request
+        :param method: the method to use for saving, generally "save", but in some cases e.g. "checkandinsert" is more
+            appropriate to be used instead.
+        """
+        parameters = self._save_parameters(endpoint, obj, auth)
+        response = self._call(endpoint=endpoint, method=method, parameters=parameters)
+        return self._convert_results(response=response, endpoint=endpoint)
+
+    def delete(self, endpoint: str, id: int | list[int], auth: BfabricAuth) -> ResultContainer:
+        """Deletes the object with the specified ID from the specified endpoint.
+        :param endpoint: the endpoint to delete from, e.g. "sample"
+        :param id: the ID of the object to delete
+        :param auth: the authentication handle of the user performing the request
+        """
+        if isinstance(id, list) and len(id) == 0:
+            return ResponseDelete.from_empty_request()
+        response = self._call(endpoint=endpoint, method="delete", parameters=self._delete_parameters(id, auth))
+        return self._convert_delete(response=response, endpoint=endpoint)
+
+    def close(self) -> None:
+        """Closes the connections of the engine."""
+        self._http_pool.close()
+
+    def _get_schema(self, endpoint: str) -> XmlSchema:
+        """Returns the XML schema of the given endpoint, fetching and parsing its WSDL on first use."""
+        with self._schemas_lock:
+            if endpoint not in self._schemas:
+                self._schemas[endpoint] = parse_wsdl(self._wsdl_url(endpoint), fetch=self._fetch_document)
+            return self._schemas[endpoint]
+
+    def _fetch_document(self, url: str) -> bytes:
+        with raise_if_unavailable(self._base_url):
+            response = self._http.get(url)
+        self._check_document_status(response, url)
+        return response.content
+
+    def _call(self, endpoint: str, method: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Calls `method` of `endpoint` and returns the content of the `return` element of the response."""
+        schema = self._get_schema(endpoint)
+        envelope = self._render_envelope(schema=schema, endpoint=endpoint, method=method, parameters=parameters)
+        parser = self._response_parser(schema)
+        with (
+            raise_if_unavailable(self._base_url),
+            self._http.stream(
+                "POST", self._service_url(schema, endpoint), content=envelope, headers=_REQUEST_HEADERS
+            ) as response,
+        ):
+            self._check_call_status(response, endpoint)
+            for chunk in response.iter_bytes():
+                parser.feed(chunk)
+        return parser.close()
+
+
+class AsyncEngineXML(_EngineXMLBase):
+    """Asynchronous variant of :class:`EngineXML`, sending the requests with an `httpx.AsyncClient`.
+
+    The connections are pooled by the client, so concurrent requests reuse up to `max_connections` of `http_config`
+    connections to the B-Fabric instance. The client is bound to the event loop it is first used in, and should be
+    closed with :meth:`aclose` when no longer needed.
+
+    :param base_url: the base url of the B-Fabric instance
+    :param drop_underscores: whether to drop the leading underscore of the `id`, `classname` and `projectid` keys
+    :param http_config: the settings of the pool of HTTP connections, i.e. its limits, timeout and HTTP version
+    """
+
+    def __init__(
+        self, base_url: str, drop_underscores: bool = True, http_config: BfabricHttpConfig | None = None
+    ) -> None:
+        super().__init__(base_url=base_url, drop_underscores=drop_underscores)
+        self._http = create_async_client(http_config or BfabricHttpConfig())
+
+    async def read(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType,
+        auth: BfabricAuth,
+        page: int = 1,
+        return_id_only: bool = False,
+        include_deletable_and_updatable_fields: bool = False,
+    ) -> ResultContainer:
+        """Reads the requested `obj` from `endpoint`, see :meth:`EngineXML.read`."""
+        parameters = self._read_parameters(obj, auth, page, return_id_only, include_deletable_and_updatable_fields)
+        response = await self._call(endpoint=endpoint, method="read", parameters=parameters)
+        return self._convert_results(response=response, endpoint=endpoint)
+
+    async def save(
+        self,
+        endpoint: str,
+        obj: ApiRequestObjectType | list[ApiRequestObjectType],
+        auth: BfabricAuth,
+        method: str = "save",
+    ) -> ResultContainer:
+        """Saves the provided object to the specified endpoint, see :meth:`EngineXML.save`."""
+        parameters = self._save_parameters(endpoint, obj, auth)
+        response = await self._call(endpoint=endpoint, method=method, parameters=parameters)
+        return self._convert_results(response=response, endpoint=endpoint)
+
+    async def delete(self, endpoint: str, id: int | list[int], auth: BfabricAuth) -> ResultContainer:
+        """Deletes the object with the specified ID from the specified endpoint, see :meth:`EngineXML.delete`."""
+        if isinstance(id, list) and len(id) == 0:
+            return ResponseDelete.from_empty_request()
+        response = await self._call(endpoint=endpoint, method="delete", parameters=self._delete_parameters(id, auth))
+        return self._convert_delete(response=response, endpoint=endpoint)
+
+    async def aclose(self) -> None:
+        """Closes the connections of the engine."""
+        await self._http.aclose()
+
+    async def _get_schema(self, endpoint: str) -> XmlSchema:
+        """Returns the XML schema of the given endpoint, fetching and parsing its WSDL on first use."""
+        # concurrent first requests to an endpoint may each fetch the WSDL, which is harmless and avoids a lock that
+        # would be bound to a single event loop
+        if endpoint not in self._schemas:
+            self._schemas[endpoint] = await parse_wsdl_async(self._wsdl_url(endpoint), fetch=self._fetch_document)
+        return self._schemas[endpoint]
+
+    async def _fetch_document(self, url: str) -> bytes:
+        with raise_if_unavailable(self._base_url):
+            response = await self._http.get(url)
+        self._check_document_status(response, url)
+        return response.content
+
+    async def _call(self, endpoint: str, method: str, parameters: dict[str, Any]) -> dict[str, Any]:
+        """Calls `method` of `endpoint` and returns the content of the `return` element of the response."""
+        schema = await self._get_schema(endpoint)
+        envelope = self._render_envelope(schema=schema, endpoint=endpoint, method=method, parameters=parameters)
+        parser = self._response_parser(schema)
+        with raise_if_unavailable(self._base_url):
+            async with self._http.stream(
+                "POST", self._service_url(schema, endpoint), content=envelope, headers=_REQUEST_HEADERS
+            ) as response:
+                self._check_call_status(response, endpoint)
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+        return parser.close()
+
+
+class _Encoder:
+    """Renders request parameters as XML elements, ordered and shaped by the schema where it is known."""
+
+    def __init__(self, schema: XmlSchema) -> None:
+        self._schema = schema
+
+    def encode(self, name: str, value: Any, type_name: str | None, out: list[str]) -> None:
+        if value is None:
+            return
+        if isinstance(value, list | tuple):
+            for item in value:
+                self.encode(name, item, type_name, out)
+        elif isinstance(value, Mapping):
+            complex_type = self._schema.complex_type(type_name)
+            elements = complex_type.elements if complex_type else {}
+            attributes = complex_type.attributes if complex_type else {}
+            keys = [key for key in elements if key in value] + [key for key in value if key not in elements]
+            rendered_attributes = "".join(
+                f" {key}={quoteattr(_format_simple(value[key]))}"
+                for key in keys
+                if key in attributes and key not in elements and value[key] is not None
+            )
+            out.append(f"<{name}{rendered_attributes}>")
+            for key in keys:
+                if key not in attributes or key in elements:
+                    field = elements.get(key)
+                    self.encode(key, value[key], field.type_name if field else None, out)
+            out.append(f"</{name}>")
+        else:
+            out.append(f"<{name}>{escape(_format_simple(value))}</{name}>")
+
+
+def _format_simple(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.datetime | datetime.date):
+        return value.isoformat()
+    return str(value)
+
+
+class _ResponseParser:
+    """Parses a SOAP response incrementally into dictionaries, converting the values according to the schema.
+
+    Every result is converted as soon as its closing tag has been received and then dropped from the element tree,
+    so the full response never exists as an element tree at once.
+    """
+
+    def __init__(self, schema: XmlSchema, drop_underscores: bool) -> None:
+        self._schema = schema
+        self._drop_underscores = drop_underscores
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._stack: list[ElementTree.Element] = []
+        self._return_type_name: str | None = None
+        self._response: dict[str, Any] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Parses the next chunk of the response, converting the results completed by it."""
+        try:
+            self._parser.feed(chunk)
+            # with the events "start" and "end", every event is a pair of the event name and the element
+            for event, elem in cast("Iterator[tuple[str, ElementTree.Element]]", self._parser.read_events()):
+                self._handle_event(event, elem)
+        except ElementTree.ParseError as error:
+            raise BfabricRequestError(f"Invalid SOAP response: {error}") from error
+
+    def close(self) -> dict[str, Any]:
+        """Finishes parsing and returns the content of the `return` element of the response."""
+        try:
+            self._parser.close()
+        except ElementTree.ParseError as error:
+            raise BfabricRequestError(f"Invalid SOAP response: {error}") from error
+        return self._response
+
+    def _handle_event(self, event: str, elem: ElementTree.Element) -> None:
+        if event == "start":
+            self._stack.append(elem)
+            if len(self._stack) == _DEPTH_BODY_CHILD + 1:
+                self._return_type_name = self._return_type(elem.tag)
+            return
+        self._stack.pop()
+        depth = len(self._stack)
+        if depth == _DEPTH_RETURN_CHILD:
+            return_type = self._schema.complex_type(self._return_type_name)
+            field = return_type.elements.get(_local_name(elem.tag)) if return_type else None
+            self._add_value(self._response, elem, field)
+            self._stack[-1].remove(elem)
+        elif depth == _DEPTH_BODY_CHILD and elem.tag == f"{{{_SOAP_ENVELOPE_NS}}}Fault":
+            raise BfabricRequestError(elem.findtext("faultstring") or "SOAP fault without message")
+
+    def _return_type(self, response_tag: str) -> str | None:
+        response_type = self._schema.complex_type(self._schema.elements.get(response_tag))
+        return_field = response_type.elements.get("return") if response_type else None
+        return return_field.type_name if return_field else None
+
+    def _add_value(self, out: dict[str, Any], elem: ElementTree.Element, field: XmlField | None) -> None:
+        key = _local_name(elem.tag)
+        value = self._convert(elem, field.type_name if field else None, nillable=field.nillable if field else True)
+        if key not in out:
+            out[key] = [value] if field is not None and field.is_list else value
+        elif isinstance(out[key], list):
+            out[key].append(value)
+        else:
+            out[key] = [out[key], value]
+
+    def _convert(self, elem: ElementTree.Element, type_name: str | None, nillable: bool) -> Any:
+        if elem.get(_XSI_NIL) == "true":
+            return None
+        has_attributes = any(not key.startswith(f"{{{XSI_NS}}}") for key in elem.attrib)
+        if not len(elem) and not has_attributes:
+            if not elem.text:
+                return None if nillable else ""
+            return self._convert_simple(elem.text, type_name)
+        complex_type = self._schema.complex_type(type_name)
+
+        out: dict[str, Any] = {}
+        for attribute, text in elem.attrib.items():
+            if attribute.startswith(f"{{{XSI_NS}}}"):
+                continue
+            field = complex_type.attributes.get(attribute) if complex_type else None
+            key = attribute if self._drop_underscores and attribute in _DROPPED_UNDERSCORE_KEYS else f"_{attribute}"
+            out[key] = self._convert_simple(text, field.type_name if field else None)
+        for child in elem:
+            field = complex_type.elements.get(_local_name(child.tag)) if complex_type else None
+            self._add_value(out, child, field)
+        if elem.text and not len(elem):
+            out["value"] = self._convert_simple(elem.text, complex_type.base if complex_type else None)
+        return dict(sorted(out.items()))
+
+    def _convert_simple(self, text: str, type_name: str | None) -> Any:
+        builtin = self._schema.builtin_type(type_name)
+        if builtin in _INT_TYPES:
+            return int(text)
+        if builtin in _FLOAT_TYPES:
+            return float(text)
+        if builtin == "boolean":
+            return text in ("true", "1")
+        if builtin == "dateTime":
+            return datetime.datetime.fromisoformat(text)
+        if builtin == "date":
+            return datetime.date.fromisoformat(text)
+        return text
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING, cast
 
 from suds.sax.text import Text
 from suds.sudsobject import asdict
 
 if TYPE_CHECKING:
+    from bfabric.typing import ApiResponseObjectType
+
     Value = list["Value"] | dict[str, "Value"] | str | int | float | bool | None | Any
 
+# Keys of the XML attributes which are reported without their leading underscore, see `clean_result`
+_DROPPED_UNDERSCORE_KEYS = {"_id": "id", "_classname": "classname", "_projectid": "projectid"}
+
 
 def convert_suds_type(item: Any) -> int | str | Any:
     """
@@ -44,3 +49,38 @@ def suds_asdict_recursive(d: Any, convert_types: bool = False) -> dict[str, Valu
         else:
             out[k] = convert_suds_type(v) if convert_types else v
     return out
+
+
+def suds_asdict_clean(d: Any, drop_underscores: bool = True) -> ApiResponseObjectType:
+    """Converts a suds object into a dictionary equal to `clean_result(suds_asdict_recursive(d, convert_types=True),
+    drop_underscores_suds=drop_underscores, sort_keys=True)`, but in a single pass over the object and without copying.
+    :param d: The input suds object
+    :param drop_underscores: if True, the leading underscores of the `_id`, `_classname` and `_projectid` keys are
+        dropped
+    :return: The suds object converted to a dictionary, with the keys of all dictionaries (including the outermost)
+        sorted
+    """
+    return cast("ApiResponseObjectType", _asdict_clean(d, _DROPPED_UNDERSCORE_KEYS if drop_underscores else {}))
+
+
+def _asdict_clean(d: Any, keymap: dict[str, str]) -> dict[str, Value]:
+    attributes = d.__dict__
+    out: dict[str, Value] = {}
+    renamed: dict[str, Value] = {}
+    for k in d.__keylist__:
+        if k not in attributes:
+            continue
+        v = attributes[k]
+        if hasattr(v, "__keylist__"):
+            v = _asdict_clean(v, keymap)
+        elif isinstance(v, list):
+            v = [_asdict_clean(item, keymap) if hasattr(item, "__keylist__") else convert_suds_type(item) for item in v]
+        elif isinstance(v, Text):
+            v = str(v)
+        if k in keymap:
+            # as in `clean_result`, the renamed key takes precedence over an existing key of the same name
+            renamed[keymap[k]] = v
+        else:
+            out[k] = v
+    out.update(renamed)
+    return dict(sorted(out.items()))
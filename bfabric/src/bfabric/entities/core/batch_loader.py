@@ -0,0 +1,134 @@
+# pyright: reportImportCycles=false
+
+from __future__ import annotations
+
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from loguru import logger
+
+from bfabric.entities.core.uri import EntityUri
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from bfabric import Bfabric
+    from bfabric.entities.core.entity import Entity
+
+EntityT = TypeVar("EntityT", bound="Entity")
+
+
+class PendingEntity(Generic[EntityT]):
+    """An entity requested from an :class:`EntityBatchLoader`, which is read together with the other pending
+    requests of the loader."""
+
+    def __init__(self, loader: EntityBatchLoader, uri: EntityUri) -> None:
+        self._loader = loader
+        self._uri = uri
+
+    @property
+    def uri(self) -> EntityUri:
+        """The URI of the requested entity."""
+        return self._uri
+
+    def result(self) -> EntityT | None:
+        """Returns the entity, or ``None`` if it does not exist.
+
+        If the entity has not been read yet, all pending requests of the loader are read first.
+        """
+        return cast("EntityT | None", self._loader.get(self._uri))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self._uri)!r})"
+
+
+class EntityBatchLoader:
+    """Collects entity lookups and sends them as batches, one multi-query per entity type, instead of one request
+    per entity (like a DataLoader).
+
+    Created with :meth:`EntityReader.batch`, the loader batches two kinds of lookups within its scope:
+
+    - Entities requested with :meth:`load` or :meth:`load_id` are only read once a result is needed, together with
+      all other requests that are pending by then.
+    - Entities created within the scope are tracked, and when a reference of one of them is loaded, e.g. with
+      ``entity.refs.get("sample")`` or a `HasOne`/`HasMany` field, the same reference is loaded for all tracked
+      entities that have not loaded it yet.
+    """
+
+    def __init__(
+        self, read_uris: Callable[[list[EntityUri]], Mapping[EntityUri, Entity | None]], client: Bfabric
+    ) -> None:
+        self._read_uris = read_uris
+        self._client = client
+        self._pending: dict[EntityUri, None] = {}
+        self._results: dict[EntityUri, Entity | None] = {}
+        self._entities: weakref.WeakValueDictionary[int, Entity] = weakref.WeakValueDictionary()
+
+    def load(self, uri: EntityUri | str) -> PendingEntity[Entity]:
+        """Requests the entity with the given URI, to be read with the next batch."""
+        uri = EntityUri(uri)
+        if uri not in self._results:
+            self._pending[uri] = None
+        return PendingEntity(self, uri)
+
+    def load_id(self, entity_type: str, entity_id: int | str) -> PendingEntity[Entity]:
+        """Requests the entity of the given type and ID, to be read with the next batch."""
+        uri = EntityUri.from_components(
+            bfabric_instance=self._client.config.base_url, entity_type=entity_type, entity_id=int(entity_id)
+        )
+        return self.load(uri)
+
+    def get(self, uri: EntityUri | str) -> Entity | None:
+        """Returns the requested entity with the given URI, reading all pending requests first if necessary.
+
+        :raises KeyError: if the entity was not requested from this loader
+        """
+        uri = EntityUri(uri)
+        if uri in self._pending:
+            self.flush()
+        return self._results[uri]
+
+    def flush(self) -> None:
+        """Reads all pending requests, with one multi-query per entity type."""
+        if not self._pending:
+            return
+        uris = list(self._pending)
+        self._pending.clear()
+        logger.debug(f"Reading batch of {len(uris)} entities")
+        self._results.update(self._read_uris(uris))
+
+    def track(self, entity: Entity) -> None:
+        """Tracks `entity`, so its references are loaded together with those of the other tracked entities."""
+        if entity._client is self._client:
+            self._entities[id(entity)] = entity
+
+    def tracked_entities(self, client: Bfabric | None) -> list[Entity]:
+        """Returns the tracked entities of `client`."""
+        if client is not self._client:
+            return []
+        return list(self._entities.values())
+
+
+_batch_loader_var: ContextVar[EntityBatchLoader | None] = ContextVar("batch_loader", default=None)
+
+
+def current_batch_loader() -> EntityBatchLoader | None:
+    """Returns the batch loader of the current context, if there is one."""
+    return _batch_loader_var.get()
+
+
+@contextmanager
+def batch_loading(
+    read_uris: Callable[[list[EntityUri]], Mapping[EntityUri, Entity | None]], client: Bfabric
+) -> Iterator[EntityBatchLoader]:
+    """Activates a new :class:`EntityBatchLoader` reading with `read_uris` within the context, reading its pending
+    requests on exit."""
+    loader = EntityBatchLoader(read_uris=read_uris, client=client)
+    token = _batch_loader_var.set(loader)
+    try:
+        yield loader
+        loader.flush()
+    finally:
+        _batch_loader_var.reset(token)
@@ -6,6 +6,7 @@ import warnings
 from functools import cached_property
 from typing import TYPE_CHECKING, Self, TypeGuard
 
+from bfabric.entities.core.batch_loader import current_batch_loader
 from bfabric.entities.core.mixins.find_mixin import FindMixin
 from bfabric.entities.core.uri import EntityUri
 
@@ -42,6 +43,10 @@ class Entity(FindMixin):
         self.__client = client
         self.__bfabric_instance = bfabric_instance
 
+        batch_loader = current_batch_loader()
+        if batch_loader is not None:
+            batch_loader.track(self)
+
     @property
     def id(self) -> int:
         """Returns the entity's ID."""
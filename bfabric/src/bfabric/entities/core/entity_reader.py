@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from typing import TYPE_CHECKING, Generic, TypeGuard, TypeVar, cast, overload
 
 from loguru import logger
 
 from bfabric.entities.cache.context import get_cache_stack
+from bfabric.entities.core.batch_loader import EntityBatchLoader, batch_loading
 from bfabric.entities.core.entity import Entity
 from bfabric.entities.core.import_entity import entity_type_of, instantiate_entity
+from bfabric.entities.core.references import References
 from bfabric.entities.core.uri import EntityUri, GroupedUris
 from bfabric.experimental import MultiQuery
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
     from bfabric import Bfabric
     from bfabric.typing import ApiRequestObjectType, ApiResponseDataType, ApiResponseObjectType
@@ -19,6 +22,9 @@ if TYPE_CHECKING:
 
 EntityT = TypeVar("EntityT", bound="Entity")
 
+# Number of batches of ids which are read concurrently, when more than `BFABRIC_QUERY_LIMIT` entities of a type are read
+_RETRIEVE_MAX_WORKERS = 4
+
 
 class EntityResult(dict[EntityUri, "EntityT | None"], Generic[EntityT]):
     """A URI-keyed entity-reader result.
@@ -72,6 +78,60 @@ class EntityReader:
         """Create an EntityReader for a single B-Fabric client."""
         return cls(client=client, _private=True)
 
+    @contextmanager
+    def batch(self) -> Iterator[EntityBatchLoader]:
+        """Batches the entity lookups within the context, sending one multi-query per entity type instead of one
+        request per entity.
+
+        Within the context, loading a reference of an entity loads the same reference of all entities created in the
+        context, and entities can be requested with ``loader.load_id`` and read once their result is needed::
+
+            with reader.batch():
+                resources = reader.read_ids("resource", resource_ids)
+                for resource in resources.present:
+                    print(resource.refs.get("sample"))  # all samples are read with the first access
+
+            with reader.batch() as loader:
+                pending = [loader.load_id("sample", sample_id) for sample_id in sample_ids]
+                samples = [item.result() for item in pending]  # all samples are read with the first result
+
+        Yields:
+            The :class:`EntityBatchLoader` of the context
+        """
+        with batch_loading(read_uris=self.read_uris, client=self._client) as loader:
+            yield loader
+
+    def prefetch(self, entities: Iterable[Entity], paths: Iterable[str]) -> None:
+        """Load the references at `paths` of all `entities` in place, reading the referenced entities in batches.
+
+        Each path is a reference name, or a dot-separated chain of reference names to load nested references, e.g.
+        ``"workunit.application"`` loads the workunit of every entity and then the application of every workunit.
+        For every level of a path, the referenced entities of all entities are read together, with one multi-query
+        per entity type, so that accessing the references afterwards does not send any requests::
+
+            reader.prefetch(resources, ["sample", "workunit.application"])
+            for resource in resources:
+                print(resource.refs.sample, resource.refs.workunit.refs.application)
+
+        Entities without the reference are skipped, and a reference to an entity that is not found stays unloaded,
+        so it still raises when accessed.
+
+        Args:
+            entities: Entities whose references should be loaded
+            paths: Reference names, or dot-separated chains of reference names
+        """
+        entities = list(entities)
+        for path in paths:
+            level = entities
+            for name in path.split("."):
+                references = [entity.refs for entity in level if name in entity.refs]
+                References.load_many(references, name, reader=self)
+                level = []
+                for refs in references:
+                    if refs.is_loaded(name):
+                        value = refs.get(name)
+                        level.extend(value if isinstance(value, list) else [value])
+
     def read_uri(self, uri: EntityUri | str, *, expected_type: type[EntityT] = Entity) -> EntityT | None:
         """Read a single entity by its B-Fabric URI.
 
@@ -379,7 +439,11 @@ class EntityReader:
 
         id_to_uri_map = {uri.components.entity_id: uri for uri in uris}
         result = MultiQuery(self._client).read_multi(
-            endpoint=entity_type, obj={}, multi_query_key="id", multi_query_vals=list(id_to_uri_map.keys())
+            endpoint=entity_type,
+            obj={},
+            multi_query_key="id",
+            multi_query_vals=list(id_to_uri_map.keys()),
+            max_workers=_RETRIEVE_MAX_WORKERS,
         )
         result_by_id = {x["id"]: x for x in result}
         if not _is_id_dict(result_by_id):
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from loguru import logger
+
+from bfabric.entities.cache.context import get_cache_stack
+from bfabric.entities.core.entity import Entity
+from bfabric.entities.core.entity_reader import EntityResult, _is_id_dict, _resolve_entity_type
+from bfabric.entities.core.import_entity import instantiate_entity
+from bfabric.entities.core.uri import EntityUri, GroupedUris
+from bfabric.utils.paginator import BFABRIC_QUERY_LIMIT, page_iter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from bfabric import AsyncBfabric
+    from bfabric.typing import ApiRequestObjectType
+
+EntityT = TypeVar("EntityT", bound="Entity")
+
+
+class AsyncEntityReader:
+    """Reads entities from B-Fabric by URI or ID with an :class:`AsyncBfabric` client, respecting the cache stack.
+
+    Provides awaitable counterparts of the methods of :class:`EntityReader`. Entities of different types are read
+    concurrently, as are the batches of ids of a single type.
+
+    The returned entities are not bound to a client, as their references would be loaded synchronously. Their
+    references can be read with this reader instead, e.g. ``await reader.read_uris(entity.refs.uris["sample"])``.
+    """
+
+    def __init__(self, client: AsyncBfabric, *, _private: bool) -> None:
+        self._client = client
+
+    @classmethod
+    def for_client(cls, client: AsyncBfabric) -> AsyncEntityReader:
+        """Create an AsyncEntityReader for a single B-Fabric client."""
+        return cls(client=client, _private=True)
+
+    async def read_uri(self, uri: EntityUri | str, *, expected_type: type[EntityT] = Entity) -> EntityT | None:
+        """Read a single entity by its B-Fabric URI, see :meth:`EntityReader.read_uri`."""
+        logger.debug(f"Reading entity for URI: {uri}")
+        return list((await self.read_uris([uri], expected_type=expected_type)).values())[0]
+
+    async def read_uris(
+        self, uris: Iterable[EntityUri | str], *, expected_type: type[EntityT] = Entity
+    ) -> EntityResult[EntityT]:
+        """Read multiple entities by their URIs, see :meth:`EntityReader.read_uris`."""
+        uris = [EntityUri(uri) for uri in uris]
+        logger.debug(f"Reading entities for URIs: {uris}")
+        grouped_uris = GroupedUris.from_uris(uris)
+        for group_key, _ in grouped_uris.items():
+            if group_key.bfabric_instance != self._client.config.base_url:
+                raise ValueError(
+                    f"Unsupported B-Fabric instances: {group_key.bfabric_instance} != {self._client.config.base_url}"
+                )
+
+        cache_stack = get_cache_stack()
+        results: dict[EntityUri, Entity | None] = {}
+        uris_to_retrieve = []
+        for _, group_uris in grouped_uris.items():
+            results_cached = cache_stack.item_get_all(group_uris)
+            results.update(results_cached)
+            uris_to_retrieve.append([uri for uri in group_uris if uri not in results_cached])
+        for results_fresh in await asyncio.gather(*(self._retrieve_entities(group) for group in uris_to_retrieve)):
+            if results_fresh:
+                cache_stack.item_put_all(entities=results_fresh.values())
+            results.update(results_fresh)
+
+        for uri in uris:
+            if uri not in results:
+                results[uri] = None
+
+        if not all(isinstance(entity, expected_type) or entity is None for entity in results.values()):
+            raise ValueError("Unexpected entity type in results")
+
+        return cast("EntityResult[EntityT]", EntityResult({uri: results[uri] for uri in uris}))
+
+    async def read_id(
+        self,
+        entity_type: str | type[EntityT],
+        entity_id: int | str,
+        bfabric_instance: str | None = None,
+        *,
+        expected_type: type[EntityT] = Entity,
+    ) -> EntityT | None:
+        """Read a single entity by its type and ID, see :meth:`EntityReader.read_id`."""
+        entity_type, expected_type = _resolve_entity_type(entity_type, expected_type)
+        results = await self.read_ids(
+            entity_type=entity_type,
+            entity_ids=[int(entity_id)],
+            bfabric_instance=bfabric_instance,
+            expected_type=expected_type,
+        )
+        return list(results.values())[0]
+
+    async def read_ids(
+        self,
+        entity_type: str | type[EntityT],
+        entity_ids: Sequence[int | str],
+        bfabric_instance: str | None = None,
+        *,
+        expected_type: type[EntityT] = Entity,
+    ) -> EntityResult[EntityT]:
+        """Read multiple entities of the same type by their IDs, see :meth:`EntityReader.read_ids`."""
+        entity_type, expected_type = _resolve_entity_type(entity_type, expected_type)
+        bfabric_instance = bfabric_instance if bfabric_instance is not None else self._client.config.base_url
+        uris = [
+            EntityUri.from_components(bfabric_instance=bfabric_instance, entity_type=entity_type, entity_id=int(id))
+            for id in entity_ids
+        ]
+        return await self.read_uris(uris, expected_type=expected_type)
+
+    async def query(
+        self,
+        entity_type: str | type[EntityT],
+        obj: ApiRequestObjectType,
+        bfabric_instance: str | None = None,
+        max_results: int | None = 100,
+        *,
+        expected_type: type[EntityT] = Entity,
+    ) -> dict[EntityUri, EntityT]:
+        """Query entities by search criteria and return them as Entity objects, see :meth:`EntityReader.query`."""
+        entity_type, expected_type = _resolve_entity_type(entity_type, expected_type)
+        bfabric_instance = bfabric_instance if bfabric_instance is not None else self._client.config.base_url
+        if bfabric_instance != self._client.config.base_url:
+            raise ValueError(f"Unsupported B-Fabric instance: {bfabric_instance} != {self._client.config.base_url}")
+
+        logger.debug(f"Querying {entity_type} by {obj}")
+        result = await self._client.read(entity_type, obj=obj, max_results=max_results)
+        entities = {
+            x.uri: x
+            for x in [instantiate_entity(data_dict=r, client=None, bfabric_instance=bfabric_instance) for r in result]
+        }
+        for entity in entities.values():
+            if not isinstance(entity, expected_type):
+                raise TypeError(f"Expected {expected_type.__name__}, got {type(entity).__name__}")
+        get_cache_stack().item_put_all(entities=entities.values())
+        return cast("dict[EntityUri, EntityT]", entities)
+
+    async def query_one(
+        self,
+        entity_type: str | type[EntityT],
+        obj: ApiRequestObjectType,
+        bfabric_instance: str | None = None,
+        *,
+        expected_type: type[EntityT] = Entity,
+    ) -> EntityT | None:
+        """Query for a single entity by search criteria, see :meth:`EntityReader.query_one`."""
+        entity_type, expected_type = _resolve_entity_type(entity_type, expected_type)
+        results = await self.query(
+            entity_type, obj, bfabric_instance=bfabric_instance, max_results=1, expected_type=expected_type
+        )
+        return next(iter(results.values()), None)
+
+    async def _retrieve_entities(self, uris: list[EntityUri]) -> dict[EntityUri, Entity]:
+        """Retrieve entities of a single type and instance from the B-Fabric API, reading batches of at most
+        `BFABRIC_QUERY_LIMIT` ids concurrently."""
+        if len(uris) == 0:
+            return {}
+        entity_type = uris[0].components.entity_type
+        id_to_uri_map = {uri.components.entity_id: uri for uri in uris}
+        batches = await asyncio.gather(
+            *(
+                self._client.read(entity_type, {"id": ids}, max_results=None)
+                for ids in page_iter(list(id_to_uri_map), page_size=BFABRIC_QUERY_LIMIT)
+            )
+        )
+        result_by_id = {x["id"]: x for batch in batches for x in batch}
+        if not _is_id_dict(result_by_id):
+            raise ValueError("All entity IDs must be integers")
+
+        return {
+            id_to_uri_map[id]: instantiate_entity(
+                data_dict=data_dict, client=None, bfabric_instance=self._client.config.base_url
+            )
+            for id, data_dict in result_by_id.items()
+        }
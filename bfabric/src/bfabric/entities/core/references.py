@@ -11,8 +11,11 @@ from bfabric.entities.core.import_entity import instantiate_entity
 from bfabric.entities.core.uri import EntityUri
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from bfabric import Bfabric
     from bfabric.entities.core.entity import Entity
+    from bfabric.entities.core.entity_reader import EntityReader
     from bfabric.typing import ApiResponseDataType, ApiResponseObjectType
 
 
@@ -112,13 +115,39 @@ class References:
                 ref_data_list[indices_map[entry_uri]].update(entity.data_dict)
 
     def __load(self, ref_info: _ReferenceInformation) -> None:
+        """Loads the reference, together with the same reference of the other entities tracked by the current
+        batch loader, if there is one."""
+        from bfabric.entities.core.batch_loader import current_batch_loader
         from bfabric.entities.core.entity_reader import EntityReader
 
+        batch_loader = current_batch_loader()
+        tracked = [] if batch_loader is None else batch_loader.tracked_entities(self._client)
+        siblings = [entity.refs for entity in tracked]
         reader = EntityReader.for_client(self._client)
-        entities = reader.read_uris(ref_info.uris)
+        entities = self.load_many([self, *(refs for refs in siblings if refs is not self)], ref_info.name, reader)
+        if not ref_info.is_loaded:
+            # raises for the referenced entity which was not found
+            self.__update_ref_data(ref_info, entities)
 
-        self.__update_ref_data(ref_info, entities)
-        ref_info.is_loaded = True
+    @staticmethod
+    def load_many(references: Sequence[References], name: str, reader: EntityReader) -> dict[EntityUri, Entity | None]:
+        """Loads the reference `name` of all `references` which have it and did not load it yet, reading the
+        referenced entities of all of them together with `reader`.
+
+        A reference to an entity which is not found stays unloaded, it is only reported when it is accessed.
+        :return: the entities which were read, by URI
+        """
+        unloaded = [refs for refs in references if name in refs and not refs.is_loaded(name)]
+        uris = list(dict.fromkeys(uri for refs in unloaded for uri in refs._ref_info[name].uris))
+        if not uris:
+            return {}
+        entities = reader.read_uris(uris)
+        for refs in unloaded:
+            ref_info = refs._ref_info[name]
+            if all(entities[uri] is not None for uri in ref_info.uris):
+                refs.__update_ref_data(ref_info, entities)
+                ref_info.is_loaded = True
+        return entities
 
     @classmethod
     def __extract_reference_info(
@@ -56,11 +56,9 @@ from bfabric.transfer import (
     tus_sink_for_resource,
 )
 
-# The mover uploads at DEFAULT_CHUNK_SIZE (4 MiB) and send_to_sink exposes no chunk_size override, so
-# the abort threshold must be expressed in real chunks: mirror that size here. The default 12 MiB file
-# is 3 chunks, so aborting after the first leaves a meaningful, resumable remainder.
-CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB — matches the mover's DEFAULT_CHUNK_SIZE
-CHUNKS_BEFORE_ABORT = 1
+# The mover adapts its chunk size, starting at INITIAL_CHUNK_SIZE (1 MiB) and doubling it while the
+# throughput rises, and send_to_sink exposes no chunk_size override. The first progress report therefore
+# arrives after 1 MiB, so aborting there leaves most of the default 12 MiB file as a resumable remainder.
 WAIT_SECONDS = 10
 
 
@@ -121,23 +119,22 @@ def main() -> None:
         creds = Credentials()  # the tus leg authenticates with the sink's own token
 
         # --- Phase 1: upload a few chunks, then ABORT ---
-        print(f"Phase 1: uploading {CHUNKS_BEFORE_ABORT} chunk(s) then aborting...")
+        print("Phase 1: uploading the first chunk then aborting...")
         saved_url: str | None = None
         abort_offset = 0
-        abort_threshold = CHUNKS_BEFORE_ABORT * CHUNK_SIZE
 
         def _capture_url(url: str) -> None:
             nonlocal saved_url
             saved_url = url
 
-        def _abort_after_threshold(done: int, _total: int) -> None:
+        def _abort_after_first_chunk(done: int, _total: int) -> None:
             nonlocal abort_offset
-            if done >= abort_threshold:
+            if done > 0:
                 abort_offset = done
                 raise _SimulatedOutage
 
         try:
-            send_to_sink(sink, test_file, creds, on_url=_capture_url, on_progress=_abort_after_threshold)
+            send_to_sink(sink, test_file, creds, on_url=_capture_url, on_progress=_abort_after_first_chunk)
         except _SimulatedOutage:
             pass
 
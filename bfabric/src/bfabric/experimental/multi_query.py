@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 
 from loguru import logger
 
 from bfabric.results.result_container import ResultContainer
 from bfabric.utils.paginator import BFABRIC_QUERY_LIMIT, page_iter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from bfabric.bfabric import Bfabric
     from bfabric.typing import ApiRequestDataType, ApiRequestObjectType
@@ -27,6 +28,34 @@ def _count_query_elements(value: ApiRequestDataType) -> int:
     return 1
 
 
+ChunkT = TypeVar("ChunkT")
+
+
+def _run_chunks(
+    chunks: list[ChunkT], request: Callable[[ChunkT], ResultContainer], max_workers: int, check: bool
+) -> ResultContainer:
+    """Calls `request` for every chunk with up to `max_workers` threads, and concatenates the responses in the order
+    of the chunks.
+
+    The errors of all chunks are collected, so with `check` a single `BfabricRequestError` lists all of them.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if max_workers == 1 or len(chunks) <= 1:
+        responses = [request(chunk) for chunk in chunks]
+    else:
+        workers = min(max_workers, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bfabric-multi-query") as pool:
+            responses = list(pool.map(request, chunks))
+
+    response_tot = ResultContainer([], total_pages_api=0, errors=[])
+    for response in responses:
+        response_tot.extend(response, reset_total_pages_api=True)
+    if check:
+        response_tot.assert_success()
+    return response_tot
+
+
 class MultiQuery:
     """Some advanced functionality that supports paginating over a list of conditions that is larger than the 100
     conditions limit of the API.
@@ -45,17 +74,21 @@ class MultiQuery:
         multi_query_key: str,
         multi_query_vals: Sequence[ApiRequestDataType],
         return_id_only: bool = False,
+        max_workers: int = 1,
+        check: bool = True,
     ) -> ResultContainer:
         """Performs a 1-parameter multi-query, i.e. `multi_query_key` is the one `obj` field taking a list of values.
 
         The API allows at most BFABRIC_QUERY_LIMIT elements per query and counts the values of the other `obj` fields
         towards that limit too, so the values are split into chunks of the remaining size.
+        :param max_workers: Maximum number of chunks to read concurrently. The results are returned in the order of the
+            chunks either way.
+        :param check: If ``True``, raises a `BfabricRequestError` listing the errors of all chunks, once all of them
+            have been read.
         :raises ValueError: if the other fields of `obj` already use up the element limit
 
         NOTE: It is assumed that there is only 1 response for each value.
         """
-        # TODO add `check` parameter
-        response_tot = ResultContainer([], total_pages_api=0, errors=[])
         # `multi_query_key` is set per chunk below, so only the other fields reserve elements.
         base_query = {key: value for key, value in obj.items() if key != multi_query_key}
         n_reserved = _count_query_elements(base_query)
@@ -69,12 +102,13 @@ class MultiQuery:
 
         # TODO the case of multiple responses per value is untested, and there is no `max_results` here, so a query
         #   matching a pattern instead of reading by id can accidentally pull the whole database
-        for page_vals in page_iter(multi_query_vals, page_size=page_size):
+        def read_chunk(page_vals: list[ApiRequestDataType]) -> ResultContainer:
             query = {**base_query, multi_query_key: page_vals}
-            response_this = self._client.read(endpoint, query, max_results=None, return_id_only=return_id_only)
-            response_tot.extend(response_this, reset_total_pages_api=True)
+            return self._client.read(endpoint, query, max_results=None, return_id_only=return_id_only, check=False)
 
-        return response_tot
+        return _run_chunks(
+            list(page_iter(multi_query_vals, page_size=page_size)), read_chunk, max_workers=max_workers, check=check
+        )
 
     # NOTE: Save-multi method is likely useless. When saving multiple objects, they all have different fields.
     #    One option would be to provide a dataframe, but it might struggle with nested dicts
@@ -89,28 +123,36 @@ class MultiQuery:
     #
     #     return response_tot
 
-    def delete_multi(self, endpoint: str, id_list: list[int]) -> ResultContainer:
-        """Deletes multiple objects from `endpoint` by their ids."""
-        # TODO document and test error handling
-        # TODO add `check` parameter
-        response_tot = ResultContainer([], total_pages_api=0, errors=[])
+    def delete_multi(
+        self, endpoint: str, id_list: list[int], max_workers: int = 1, check: bool = True
+    ) -> ResultContainer:
+        """Deletes multiple objects from `endpoint` by their ids.
 
+        :param max_workers: Maximum number of chunks of ids to delete concurrently. The results are returned in the
+            order of the chunks either way.
+        :param check: If ``True``, raises a `BfabricRequestError` listing the errors of all chunks, once all of them
+            have been deleted.
+        """
         if not id_list:
             logger.warning("empty list provided for deletion, ignoring")
-            return response_tot
+            return ResultContainer([], total_pages_api=0, errors=[])
 
         # Iterate over request chunks that fit into a single API page
-        for page_ids in page_iter(id_list):
-            response_page = self._client.delete(endpoint, page_ids)
-            response_tot.extend(response_page, reset_total_pages_api=True)
-
-        return response_tot
-
-    def exists_multi(self, endpoint: str, key: str, value: list[int | str] | int | str) -> bool | list[bool]:
+        return _run_chunks(
+            list(page_iter(id_list)),
+            lambda page_ids: self._client.delete(endpoint, page_ids, check=False),
+            max_workers=max_workers,
+            check=check,
+        )
+
+    def exists_multi(
+        self, endpoint: str, key: str, value: list[int | str] | int | str, max_workers: int = 1
+    ) -> bool | list[bool]:
         """
         :param endpoint:  endpoint
         :param key:       A key for the query (e.g. id or name)
         :param value:     A value or a list of values
+        :param max_workers: Maximum number of chunks of values to check concurrently, see :meth:`read_multi`
         :return:          Return a single bool or a list of bools for each value
             For each value, test if a key with that value is found in the API.
         """
@@ -121,7 +163,7 @@ class MultiQuery:
             raise ValueError("Unexpected data type", type(value))
 
         # 1. Read data for this id
-        results = self.read_multi(endpoint, {}, key, value)
+        results = self.read_multi(endpoint, {}, key, value, max_workers=max_workers)
 
         # 2. Extract all the ids for which there was a response
         result_vals = []
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import threading
+import time
 from collections import Counter
 from collections.abc import Callable, Mapping
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, TypeVar, cast
 
 from loguru import logger
 from pydantic import BaseModel, model_validator
@@ -44,6 +47,11 @@ FileDoneCallback = Callable[[str, bool], None]
 FileUrlCallback = Callable[[str, str], None]
 """Called with (filename, upload_url) as soon as a file's resumable tus URL is known."""
 
+_Callback = TypeVar("_Callback", bound=Callable[..., None])
+
+TOKEN_REFRESH_MARGIN = 300
+"""Seconds before its expiry at which the tus upload token is minted again, before starting the next file."""
+
 OnDuplicate = Literal["upload", "skip", "link"]
 """What to do with a file whose content the target container already stores.
 
@@ -152,6 +160,8 @@ def upload_files(
     on_url: FileUrlCallback | None = None,
     audit_attributes: dict[str, str] | None = None,
     exclude_names: Collection[str] | None = None,
+    max_workers: int = 1,
+    max_bytes_per_second: float | None = None,
 ) -> UploadSummary:
     """Upload files to a B-Fabric workunit over tus, end to end.
 
@@ -189,6 +199,9 @@ def upload_files(
     :param exclude_names: basenames to skip at any depth (e.g. a sentinel file the caller drops in
         the folder, or ``.DS_Store``). Filter here rather than pre-filtering ``files`` yourself: a
         flat file list loses the directory that gives nested files their relative resource name.
+    :param max_workers: number of files transferred at the same time. The callbacks are never called
+        concurrently, but with several workers the calls of different files interleave.
+    :param max_bytes_per_second: limits the combined transfer rate of all files, if given.
     :returns: an :class:`UploadSummary`; its ``workunit_id`` is the created or reused workunit, and is
         ``None`` only on the create path when every file was skipped as a duplicate (nothing was
         created). Setup failures raise :class:`~bfabric.transfer.BfabricTransferError`.
@@ -197,6 +210,10 @@ def upload_files(
     # missing, so a missing dependency / wrong auth / scope-less token never leaves an orphaned
     # 'failed' workunit behind. (The scope is also re-checked at initiate time for direct
     # UploadRestClient callers.)
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+        raise ValueError(f"max_bytes_per_second must be positive, got {max_bytes_per_second}")
     require_tus()
     rest = UploadRestClient(client)
     check_upload_scope(client)
@@ -246,19 +263,21 @@ def upload_files(
         if transferable:
             pending = [resources_by_name[fi.name] for fi in transferable]
             import_resource_ids = [r.import_resource_id for r in pending if r.import_resource_id is not None]
-            token_result = rest.get_upload_token(
-                workunit_id, [r.id for r in pending], import_resource_ids, job_id=job_id
+            token = _UploadToken(
+                lambda: rest.get_upload_token(workunit_id, [r.id for r in pending], import_resource_ids, job_id=job_id)
             )
             uploads, failures = _transfer_files(
                 transferable,
                 resources_by_name,
-                token_result,
+                token,
                 workunit_id=workunit_id,
                 container_id=container_id,
                 job_id=job_id,
                 on_progress=on_progress,
                 on_file_done=on_file_done,
                 on_url=on_url,
+                max_workers=max_workers,
+                max_bytes_per_second=max_bytes_per_second,
             )
     except BaseException:
         # Mark the workunit failed (do NOT delete) so the partial state is diagnosable — see the
@@ -489,7 +508,7 @@ def _pair_resources_to_files(resources: list[CreatedResource], to_upload: list[F
 def _transfer_files(
     to_upload: list[FileInfo],
     resources_by_name: dict[str, CreatedResource],
-    token_result: UploadTokenResult,
+    token: _UploadToken,
     *,
     workunit_id: int,
     container_id: int,
@@ -497,37 +516,116 @@ def _transfer_files(
     on_progress: FileProgressCallback | None,
     on_file_done: FileDoneCallback | None = None,
     on_url: FileUrlCallback | None = None,
+    max_workers: int = 1,
+    max_bytes_per_second: float | None = None,
 ) -> tuple[list[FileUpload], list[FileFailure]]:
     """Transfer each file over tus, recording per-file success/failure.
 
     A :class:`~bfabric.transfer.TransferError` is recorded and the run continues; any other exception
     propagates so a genuine bug is not silently logged as a flaky upload. ``on_file_done`` fires once
     per file either way, so a caller-side progress counter still reaches the total when files fail.
+
+    Up to ``max_workers`` files are transferred at the same time, each with the token current when it
+    starts. The callbacks are serialized, so a caller does not need to be thread-safe, and the results
+    keep the order of ``to_upload``.
     """
-    uploads: list[FileUpload] = []
-    failures: list[FileFailure] = []
+    callback_lock = threading.Lock()
+    on_progress = _serialized(on_progress, callback_lock)
+    on_file_done = _serialized(on_file_done, callback_lock)
+    on_url = _serialized(on_url, callback_lock)
+    bandwidth = _BandwidthLimit(max_bytes_per_second) if max_bytes_per_second is not None else None
     creds = Credentials()  # the tus leg authenticates with the sink's own token, not an access token
-    for file_info in to_upload:
+
+    def transfer(file_info: FileInfo) -> FileUpload | FileFailure:
         resource = resources_by_name[file_info.name]
         sink = tus_sink_for_resource(
-            resource, token_result, workunit_id=workunit_id, container_id=container_id, job_id=job_id
+            resource, token.current(), workunit_id=workunit_id, container_id=container_id, job_id=job_id
         )
-        file_progress = _make_file_progress(on_progress, file_info.name)
+        file_progress = _make_file_progress(on_progress, file_info.name, bandwidth)
         file_url = _make_file_url(on_url, file_info.name)
         try:
             _ = send_to_sink(sink, file_info.path, creds, on_progress=file_progress, on_url=file_url)
         except TransferError as error:
             logger.warning("Upload failed for {}: {}", file_info.name, error)
-            failures.append(FileFailure(filename=file_info.name, resource_id=resource.id, error=str(error)))
             if on_file_done is not None:
                 on_file_done(file_info.name, False)
-            continue
-        uploads.append(_as_file_upload(file_info.name, resource))
+            return FileFailure(filename=file_info.name, resource_id=resource.id, error=str(error))
         if on_file_done is not None:
             on_file_done(file_info.name, True)
+        return _as_file_upload(file_info.name, resource)
+
+    if max_workers == 1 or len(to_upload) == 1:
+        results = [transfer(file_info) for file_info in to_upload]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_upload)), thread_name_prefix="upload") as pool:
+            futures = [pool.submit(transfer, file_info) for file_info in to_upload]
+            _, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in not_done:
+                _ = future.cancel()
+        # re-raises the first unexpected error, in the order of the files
+        results = [future.result() for future in futures if not future.cancelled()]
+    uploads = [result for result in results if isinstance(result, FileUpload)]
+    failures = [result for result in results if isinstance(result, FileFailure)]
     return uploads, failures
 
 
+class _UploadToken:
+    """The tus upload token shared by all transfers of a run.
+
+    The token is short-lived, so it is minted again once less than :data:`TOKEN_REFRESH_MARGIN` seconds
+    are left, by the first worker starting a file after that point; the other workers wait for and reuse
+    the new token.
+    """
+
+    def __init__(self, mint: Callable[[], UploadTokenResult]) -> None:
+        self._mint = mint
+        self._lock = threading.Lock()
+        self._result = mint()
+        self._expires_at = time.monotonic() + self._result.expires_in
+
+    def current(self) -> UploadTokenResult:
+        """Returns the token, minting a new one first if it is about to expire."""
+        with self._lock:
+            if time.monotonic() >= self._expires_at - TOKEN_REFRESH_MARGIN:
+                logger.debug("Minting a new tus upload token")
+                self._result = self._mint()
+                self._expires_at = time.monotonic() + self._result.expires_in
+            return self._result
+
+
+class _BandwidthLimit:
+    """Limits the combined transfer rate of all files, by delaying each transfer after a chunk was sent.
+
+    At most one second of unused bandwidth is carried over, so an idle period is not followed by a long burst.
+    """
+
+    def __init__(self, bytes_per_second: float) -> None:
+        self._bytes_per_second = bytes_per_second
+        self._lock = threading.Lock()
+        self._available_at = time.monotonic()
+
+    def consume(self, n_bytes: int) -> None:
+        """Records ``n_bytes`` as sent, sleeping until they fit into the limit."""
+        with self._lock:
+            now = time.monotonic()
+            self._available_at = max(self._available_at, now - 1.0) + n_bytes / self._bytes_per_second
+            delay = self._available_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _serialized(callback: _Callback | None, lock: threading.Lock) -> _Callback | None:
+    """Wraps ``callback`` so that it is never called by two transfers at the same time."""
+    if callback is None:
+        return None
+
+    def _call(*args: object) -> None:
+        with lock:
+            callback(*args)
+
+    return cast("_Callback", _call)
+
+
 def _as_file_upload(filename: str, resource: CreatedResource) -> FileUpload:
     return FileUpload(
         filename=filename,
@@ -537,12 +635,20 @@ def _as_file_upload(filename: str, resource: CreatedResource) -> FileUpload:
     )
 
 
-def _make_file_progress(on_progress: FileProgressCallback | None, filename: str) -> Callable[[int, int], None] | None:
-    if on_progress is None:
+def _make_file_progress(
+    on_progress: FileProgressCallback | None, filename: str, bandwidth: _BandwidthLimit | None = None
+) -> Callable[[int, int], None] | None:
+    if on_progress is None and bandwidth is None:
         return None
+    reported = 0
 
     def _report(done: int, total: int) -> None:
-        on_progress(filename, done, total)
+        nonlocal reported
+        if bandwidth is not None:
+            bandwidth.consume(done - reported)
+            reported = done
+        if on_progress is not None:
+            on_progress(filename, done, total)
 
     return _report
 
@@ -1,3 +1,5 @@
+# pyright: reportImportCycles=false
+
 from __future__ import annotations
 
 import asyncio
@@ -30,6 +32,7 @@ if TYPE_CHECKING:
     from bfabric import Bfabric
     from bfabric.entities.core.entity import Entity
     from bfabric.experimental.webapp_integration_settings import TokenValidationSettingsProtocol
+    from bfabric.rest.token_validation_cache import TokenValidationCache
 
 
 def _parse_boolean_string(v: bool | str, handler: ValidatorFunctionWrapHandler, info: ValidationInfo) -> bool:
@@ -120,18 +123,26 @@ def get_token_data(base_url: str, token: str) -> TokenData:
 
 
 async def validate_token(
-    token: str | SecretStr, settings: TokenValidationSettingsProtocol, http_client: httpx.AsyncClient | None = None
+    token: str | SecretStr,
+    settings: TokenValidationSettingsProtocol,
+    http_client: httpx.AsyncClient | None = None,
+    cache: TokenValidationCache | None = None,
 ) -> TokenData:
     """Validates the token according to the provided settings.
 
+    If a `cache` is provided, the token data is retrieved through it, and `http_client` is ignored.
+
     Raises:
         BfabricTokenExpiredError: If the token has expired.
         BfabricTokenInvalidError: If the token is malformed, unknown, or rejected.
         BfabricInstanceNotConfiguredError: If the caller is not configured as supported.
     """
-    token_data = await get_token_data_async(
-        base_url=settings.validation_bfabric_instance, token=token, http_client=http_client
-    )
+    if cache is not None:
+        token_data = await cache.get_token_data(base_url=settings.validation_bfabric_instance, token=token)
+    else:
+        token_data = await get_token_data_async(
+            base_url=settings.validation_bfabric_instance, token=token, http_client=http_client
+        )
     if token_data.caller not in settings.supported_bfabric_instances:
         raise BfabricInstanceNotConfiguredError(token_data.caller)
     return token_data
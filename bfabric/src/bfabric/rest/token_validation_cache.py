@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+import httpx
+from loguru import logger
+from pydantic import SecretStr
+
+from bfabric.rest.token_data import TokenData, get_token_data_async
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    token_data: TokenData
+
+
+class TokenValidationCache:
+    """Caches the token data of validated tokens, and validates them with one shared, pooled HTTP client.
+
+    When many users open an app at once, every landing validates a token. With this cache, a token is only sent to
+    B-Fabric once: concurrent validations of the same token wait for the same request, and the result is reused
+    until the token expires, or for at most `max_age` seconds so that revoked tokens are noticed eventually. Failed
+    validations are not cached. Tokens are only kept as hashes.
+
+    :param max_entries: the maximum number of cached tokens, the least recently used ones are dropped first
+    :param max_age: the maximum number of seconds a validation result is reused
+    :param http_client: the client to send the validation requests with, by default a pooled client is created on
+        first use
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_age: float = 300.0, http_client: httpx.AsyncClient | None = None
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._http_client = http_client
+        self._own_http_client: httpx.AsyncClient | None = None
+        self._own_http_client_loop: asyncio.AbstractEventLoop | None = None
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[TokenData]] = {}
+
+    async def get_token_data(self, base_url: str, token: str | SecretStr) -> TokenData:
+        """Returns the token data for the provided token, like :func:`bfabric.rest.token_data.get_token_data_async`.
+
+        Raises:
+            BfabricTokenExpiredError: If the token has expired.
+            BfabricTokenInvalidError: If the token is malformed, unknown, or rejected.
+        """
+        token_str = token.get_secret_value() if isinstance(token, SecretStr) else token
+        key = hashlib.sha256(f"{base_url}\n{token_str}".encode()).hexdigest()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.time():
+                self._entries.move_to_end(key)
+                return entry.token_data
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._validate(key=key, base_url=base_url, token=token_str))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._validation_done(key))
+        # the validation continues for the other callers, if this one is cancelled
+        return await asyncio.shield(task)
+
+    async def aclose(self) -> None:
+        """Closes the HTTP client, if it was created by the cache."""
+        if self._own_http_client is not None:
+            await self._own_http_client.aclose()
+            self._own_http_client = None
+
+    async def _validate(self, key: str, base_url: str, token: str) -> TokenData:
+        http_client = await self._get_http_client()
+        token_data = await get_token_data_async(base_url=base_url, token=token, http_client=http_client)
+        expires_at = min(time.time() + self._max_age, token_data.token_expires.timestamp())
+        if expires_at > time.time():
+            self._entries[key] = _Entry(expires_at=expires_at, token_data=token_data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                _ = self._entries.popitem(last=False)
+        return token_data
+
+    def _validation_done(self, key: str) -> None:
+        task = self._in_flight.pop(key)
+        if not task.cancelled():
+            # mark a failure as retrieved, in case all callers were cancelled
+            _ = task.exception()
+
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is not None:
+            return self._http_client
+        # the connections of a client can only be used from the event loop they were opened in
+        loop = asyncio.get_running_loop()
+        if self._own_http_client is None or self._own_http_client_loop is not loop:
+            if self._own_http_client is not None and self._own_http_client_loop is not None:
+                logger.debug("Creating a new HTTP client for token validation, as the event loop changed")
+                await _close_http_client(self._own_http_client, loop=self._own_http_client_loop)
+            self._own_http_client = httpx.AsyncClient()
+            self._own_http_client_loop = loop
+        return self._own_http_client
+
+
+async def _close_http_client(http_client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Closes a client whose connections were opened in another event loop `loop`."""
+    if loop.is_running():
+        # the loop runs in another thread, which has to close the connections
+        _ = asyncio.run_coroutine_threadsafe(http_client.aclose(), loop)
+        return
+    try:
+        await http_client.aclose()
+    except RuntimeError as error:
+        # the connections of a closed loop cannot be closed anymore, and are released with it
+        logger.debug(f"Closed the HTTP client of a stopped event loop: {error}")
@@ -30,6 +30,11 @@ class ResponseDelete(ResultContainer):
     def from_suds(cls, suds_response: Any, endpoint: str) -> ResponseDelete:
         """Creates a `ResponseDelete` from a SUDS response."""
         result_parsed = [suds_asdict_recursive(entry, convert_types=True) for entry in suds_response[endpoint]]
+        return cls.from_dicts(result_parsed)
+
+    @classmethod
+    def from_dicts(cls, result_parsed: list[dict[str, Any]]) -> ResponseDelete:
+        """Creates a `ResponseDelete` from the already parsed entries of the response."""
         results, errors = cls.__convert_parsed_response(result_parsed)
         return cls(results=results, errors=errors, total_pages_api=None)
 
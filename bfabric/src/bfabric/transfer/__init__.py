@@ -3,7 +3,8 @@
 This single namespace unifies two internal halves:
 
 - The **generic movers** (``bfabric.transfer._generic``) -- transport-only source/sink value objects,
-  ``Credentials``, ``fetch_to_path`` (download) and ``send_to_sink`` (upload, tus behind ``[tus]``).
+  ``Credentials``, ``fetch_to_path`` / ``fetch_many`` (download) and ``send_to_sink`` / ``send_many`` (upload, tus
+  behind ``[tus]``).
   They know nothing about B-Fabric and are re-exported here for convenience.
 - The **domain binding** -- mapping B-Fabric objects onto those transport types:
 
@@ -19,7 +20,10 @@ from __future__ import annotations
 
 from bfabric.transfer._generic import (
     Credentials,
+    FetchCache,
+    FetchRequest,
     FileInfo,
+    SendRequest,
     TransferError,
     TransferSink,
     TransferSinkLocal,
@@ -32,9 +36,11 @@ from bfabric.transfer._generic import (
     UploadOutcome,
     collect_file_infos,
     compute_file_info,
+    fetch_many,
     fetch_to_path,
     md5_checksum,
     scp,
+    send_many,
     send_to_sink,
 )
 from bfabric.transfer.errors import (
@@ -64,8 +70,11 @@ __all__ = [
     "CreatedResource",
     "Credentials",
     "DuplicateResult",
+    "FetchCache",
+    "FetchRequest",
     "FileInfo",
     "ScopeError",
+    "SendRequest",
     "TransferError",
     "TransferSink",
     "TransferSinkLocal",
@@ -83,6 +92,7 @@ __all__ = [
     "check_upload_scope",
     "collect_file_infos",
     "compute_file_info",
+    "fetch_many",
     "fetch_to_path",
     "http_source",
     "md5_checksum",
@@ -90,6 +100,7 @@ __all__ = [
     "require_scope",
     "require_tus",
     "scp",
+    "send_many",
     "send_to_sink",
     "ssh_source",
     "token_provider",
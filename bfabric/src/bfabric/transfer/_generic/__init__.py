@@ -10,6 +10,7 @@ gated behind the ``[transfer]`` extra and is imported lazily, so a download-only
 from __future__ import annotations
 
 from bfabric.transfer._generic._upload_types import UploadOutcome
+from bfabric.transfer._generic.cache import FetchCache
 from bfabric.transfer._generic.checksums import (
     FileInfo,
     collect_file_infos,
@@ -18,9 +19,9 @@ from bfabric.transfer._generic.checksums import (
 )
 from bfabric.transfer._generic.credentials import Credentials
 from bfabric.transfer._generic.errors import TransferError
-from bfabric.transfer._generic.fetch import fetch_to_path
+from bfabric.transfer._generic.fetch import FetchRequest, fetch_many, fetch_to_path
 from bfabric.transfer._generic.scp import scp
-from bfabric.transfer._generic.send import send_to_sink
+from bfabric.transfer._generic.send import SendRequest, send_many, send_to_sink
 from bfabric.transfer._generic.sinks import (
     TransferSink,
     TransferSinkLocal,
@@ -36,7 +37,10 @@ from bfabric.transfer._generic.sources import (
 
 __all__ = [
     "Credentials",
+    "FetchCache",
+    "FetchRequest",
     "FileInfo",
+    "SendRequest",
     "TransferError",
     "TransferSink",
     "TransferSinkLocal",
@@ -49,8 +53,10 @@ __all__ = [
     "UploadOutcome",
     "collect_file_infos",
     "compute_file_info",
+    "fetch_many",
     "fetch_to_path",
     "md5_checksum",
     "scp",
+    "send_many",
     "send_to_sink",
 ]
@@ -1,8 +1,8 @@
 # tusclient (the ``tuspy`` package) ships no type information and is an OPTIONAL dependency (the
 # ``[transfer]`` extra), so it is unresolved when this package is typechecked without the extra. Disable
 # the unknown-type family for this thin wrapper module only, rather than threading casts through
-# every tuspy call.
-# pyright: reportMissingImports=false, reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false
+# every tuspy call (and through the subclasses that route its requests through a shared session).
+# pyright: reportMissingImports=false, reportUnknownMemberType=false, reportUnknownArgumentType=false, reportUnknownVariableType=false, reportUntypedBaseClass=false
 """The tus resumable-upload mover.
 
 Isolated in its own module because it is the ONLY place that imports ``tusclient`` (from the ``tuspy``
@@ -13,15 +13,24 @@ when a tus sink is actually dispatched -- so a download-only / query install nev
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from urllib.parse import urlsplit
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlsplit
 
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
 from tusclient.client import TusClient
+from tusclient.exceptions import TusCommunicationError, TusUploadFailed
+from tusclient.request import TusRequest, catch_requests_error
+from tusclient.uploader import Uploader
 
 from bfabric.transfer._generic._upload_types import (
-    DEFAULT_CHUNK_SIZE,
     DEFAULT_RETRIES,
     DEFAULT_RETRY_DELAY,
+    INITIAL_CHUNK_SIZE,
+    MAX_CHUNK_SIZE,
+    MIN_CHUNK_SIZE,
     ProgressCallback,
     UploadOutcome,
     UrlCallback,
@@ -32,6 +41,145 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
+POOL_MAXSIZE = 16
+"""Connections per host kept open by the shared session, enough for the concurrent uploads of ``upload_files``."""
+
+_THROUGHPUT_GAIN = 1.1
+"""Factor by which a chunk must beat the best throughput so far for the chunk size to keep growing."""
+
+
+def _make_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# tuspy sends every request with the module-level ``requests`` functions, i.e. a new connection (and TLS
+# handshake) per chunk. All uploads of the process go through this session instead, reusing its connections.
+_SESSION = _make_session()
+
+
+class _ChunkSizer:
+    """Chooses the size of the next PATCH request of one upload.
+
+    Starting at ``initial``, the size doubles as long as each full chunk is sent noticeably faster, in bytes per
+    second, than the best one before it, up to ``maximum``; beyond that, larger requests only add to the bytes
+    resent on a failure. A failed request halves the size, down to ``minimum``, and restarts the search from there.
+    With ``minimum == maximum`` the size is fixed.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int) -> None:
+        self.size = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._best_throughput: float | None = None
+        self._failed = False
+
+    def record(self, nbytes: int, elapsed: float) -> None:
+        """Records a chunk of ``nbytes`` confirmed by the server ``elapsed`` seconds after it was started."""
+        if self._failed:
+            # the duration includes the failed attempts and the retry delay
+            self._failed = False
+            return
+        if nbytes < self.size:
+            # the last chunk of the file is smaller and says nothing about the chunk size
+            return
+        throughput = nbytes / max(elapsed, 1e-9)
+        if self._best_throughput is None or throughput > self._best_throughput * _THROUGHPUT_GAIN:
+            self._best_throughput = throughput
+            self.size = min(self.size * 2, self._maximum)
+
+    def shrink(self) -> int:
+        """Halves the size after a failed request and returns it."""
+        self._failed = True
+        self._best_throughput = None
+        self.size = max(self.size // 2, self._minimum)
+        return self.size
+
+
+class _SessionTusRequest(TusRequest):
+    """A tuspy PATCH request sent through the shared session."""
+
+    def perform(self) -> None:
+        try:
+            chunk = self.file.read(self._content_length)
+            self.add_checksum(chunk)
+            resp = _SESSION.patch(
+                self._url,
+                data=chunk,
+                headers=self._request_headers,
+                verify=self.verify_tls_cert,
+                cert=self.client_cert,
+            )
+            self.status_code = resp.status_code
+            self.response_content = resp.content
+            self.response_headers = {k.lower(): v for k, v in resp.headers.items()}
+        except requests.exceptions.RequestException as error:
+            raise TusUploadFailed(error) from error
+        finally:
+            # tuspy opens the file for every request and leaves closing it to the garbage collector
+            self.file.close()
+
+
+class _SessionUploader(Uploader):
+    """A tuspy uploader sending its requests through the shared session and shrinking its chunks on retries."""
+
+    def __init__(self, *args: Any, chunk_sizer: _ChunkSizer, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.chunk_sizer = chunk_sizer
+
+    @catch_requests_error
+    def create_url(self) -> str:
+        if self.client is None:
+            raise TusCommunicationError("Attempt to create the upload url without a tus client")
+        resp = _SESSION.post(
+            self.client.url,
+            headers=self.get_url_creation_headers(),
+            verify=self.verify_tls_cert,
+            cert=self.client_cert,
+        )
+        url = resp.headers.get("location")
+        if url is None:
+            msg = f"Attempt to retrieve create file url with status {resp.status_code}"
+            raise TusCommunicationError(msg, resp.status_code, resp.content)
+        return urljoin(self.client.url, url)
+
+    @catch_requests_error
+    def get_offset(self) -> int:
+        if self.url is None:
+            raise TusCommunicationError("Attempt to retrieve the offset without an upload url")
+        resp = _SESSION.head(self.url, headers=self.get_headers(), verify=self.verify_tls_cert, cert=self.client_cert)
+        offset = resp.headers.get("upload-offset")
+        if offset is None:
+            msg = f"Attempt to retrieve offset fails with status {resp.status_code}"
+            raise TusCommunicationError(msg, resp.status_code, resp.content)
+        return int(offset)
+
+    def _do_request(self) -> None:
+        self.request = _SessionTusRequest(self)
+        try:
+            self.request.perform()
+            if not 200 <= self.request.status_code < 300:
+                raise TusUploadFailed("", self.request.status_code, self.request.response_content)
+        except TusUploadFailed as error:
+            self._retry_or_cry(error)
+
+    def _retry_or_cry(self, error: Exception) -> None:
+        # tuspy resends the chunk from the server's offset; a smaller one costs less if the link drops again
+        self.chunk_size = self.chunk_sizer.shrink()
+        super()._retry_or_cry(error)
+
+
+class _SessionTusClient(TusClient):
+    """A tuspy client creating :class:`_SessionUploader` uploaders."""
+
+    def uploader(self, *args: Any, **kwargs: Any) -> _SessionUploader:
+        kwargs["client"] = self
+        return _SessionUploader(*args, **kwargs)
+
+
 # RFC 6454 defines an origin using the scheme's default port when the URL omits one, so
 # https://h and https://h:443 are the same origin. urlsplit().port is None in the implicit
 # case, so compare an *effective* port to avoid spuriously rejecting a legitimate resume URL.
@@ -52,7 +200,7 @@ def upload_file(
     file_path: Path,
     metadata: dict[str, str],
     *,
-    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_size: int | None = None,
     on_progress: ProgressCallback | None = None,
     resume_url: str | None = None,
     on_url: UrlCallback | None = None,
@@ -66,7 +214,9 @@ def upload_file(
         token: Bearer token for the Authorization header (the short-lived tus upload token).
         file_path: Local file to upload.
         metadata: tus metadata sent with the creation request.
-        chunk_size: Bytes per PATCH request.
+        chunk_size: Bytes per PATCH request. If ``None``, the size adapts to the link: it starts at
+            ``INITIAL_CHUNK_SIZE``, doubles while the throughput rises (up to ``MAX_CHUNK_SIZE``) and
+            halves whenever a request has to be retried (down to ``MIN_CHUNK_SIZE``).
         on_progress: Called after each chunk with (bytes_done, total).
         resume_url: If given, resume a previously-started upload at this URL
             instead of creating a new one.
@@ -79,7 +229,8 @@ def upload_file(
         retry_delay: Seconds between retries.
 
     Returns:
-        UploadOutcome on success. A transfer failure raises TransferError.
+        UploadOutcome on success, including the duration of the transfer. A transfer failure raises
+        TransferError.
 
     Raises:
         ValueError: if ``resume_url`` does not share the origin (scheme/host/
@@ -93,16 +244,23 @@ def upload_file(
             f"send the upload token to it."
         )
 
-    client = TusClient(tus_endpoint)
+    if chunk_size is None:
+        sizer = _ChunkSizer(INITIAL_CHUNK_SIZE, minimum=MIN_CHUNK_SIZE, maximum=MAX_CHUNK_SIZE)
+    else:
+        sizer = _ChunkSizer(chunk_size, minimum=chunk_size, maximum=chunk_size)
+
+    start = time.perf_counter()
+    client = _SessionTusClient(tus_endpoint)
     client.set_headers({"Authorization": f"Bearer {token}"})
 
     file_size = file_path.stat().st_size
     uploader = client.uploader(
         file_path=str(file_path),
-        chunk_size=chunk_size,
+        chunk_size=sizer.size,
         metadata=metadata,
         retries=retries,
         retry_delay=retry_delay,
+        chunk_sizer=sizer,
     )
 
     start_offset = 0
@@ -140,13 +298,21 @@ def upload_file(
             _report_url(uploader.url)
         if on_progress is not None:
             on_progress(0, 0)
-        return UploadOutcome(bytes_uploaded=0, final_offset=0, upload_url=uploader.url or resume_url)
+        return UploadOutcome(
+            bytes_uploaded=0,
+            final_offset=0,
+            upload_url=uploader.url or resume_url,
+            elapsed=time.perf_counter() - start,
+        )
 
     if resume_url is not None and on_progress is not None:
         # Report the server-retained offset as the starting point.
         on_progress(start_offset, file_size)
 
     while uploader.offset < file_size:
+        offset = uploader.offset
+        uploader.chunk_size = sizer.size
+        chunk_start = time.perf_counter()
         try:
             uploader.upload_chunk()
         except Exception as exc:
@@ -155,11 +321,18 @@ def upload_file(
             # The creation POST sets uploader.url before the data PATCH, so the
             # URL exists even if the chunk failed -- report it either way.
             _report_url(uploader.url)
+        sizer.record(uploader.offset - offset, time.perf_counter() - chunk_start)
         if on_progress is not None:
             on_progress(uploader.offset, file_size)
 
-    return UploadOutcome(
+    outcome = UploadOutcome(
         bytes_uploaded=uploader.offset - start_offset,
         final_offset=uploader.offset,
         upload_url=uploader.url,
+        elapsed=time.perf_counter() - start,
+    )
+    logger.info(
+        f"Uploaded {outcome.bytes_uploaded} bytes of {file_path.name} in {outcome.elapsed:.1f} s"
+        f" ({(outcome.throughput or 0) / 1e6:.1f} MB/s, chunk size {sizer.size // 1024} KiB)"
     )
+    return outcome
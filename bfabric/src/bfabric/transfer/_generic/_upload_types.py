@@ -9,7 +9,12 @@ ProgressCallback = Callable[[int, int], None]
 UrlCallback = Callable[[str], None]
 """Called once with the server-side upload URL as soon as it is known."""
 
-DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+INITIAL_CHUNK_SIZE = 1024 * 1024
+"""Bytes of the first PATCH request of a tus upload whose chunk size adapts to the throughput."""
+MIN_CHUNK_SIZE = 256 * 1024
+"""Smallest chunk size an adaptive tus upload shrinks to after failed requests."""
+MAX_CHUNK_SIZE = 64 * 1024 * 1024
+"""Largest chunk size an adaptive tus upload grows to while its throughput rises."""
 DEFAULT_RETRIES = 3
 DEFAULT_RETRY_DELAY = 5
 
@@ -29,11 +34,22 @@ class UploadOutcome:
     resume a later interrupted transfer via ``send_to_sink(..., resume_url=...)``. It is ``None`` for
     non-resumable sinks (local/scp). A failed transfer raises
     :class:`~bfabric.transfer._generic.errors.TransferError` rather than returning.
+
+    ``elapsed`` is the wall-clock duration of the transfer in seconds, from which :attr:`throughput` derives the
+    effective bytes per second of this call.
     """
 
     bytes_uploaded: int
     final_offset: int
     upload_url: str | None
+    elapsed: float | None = None
+
+    @property
+    def throughput(self) -> float | None:
+        """The bytes sent per second during this call, or ``None`` if the duration is unknown or zero."""
+        if not self.elapsed:
+            return None
+        return self.bytes_uploaded / self.elapsed
 
 
 # These types are deliberately kept in a module that does NOT import ``tusclient``, so that
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, TypedDict, cast
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+
+class _IndexEntry(TypedDict):
+    """The entry of a cached file in ``index.json``."""
+
+    size: int
+    mtime_ns: int
+    last_used: float
+
+
+class FetchCache:
+    """A content-addressed cache of fetched files, keyed by their MD5 checksum.
+
+    Files are stored as ``objects/<md5[:2]>/<md5>`` under ``cache_dir`` and placed at their destination as a hard
+    link, or as a copy when the destination is on another filesystem. The size, modification time and last use of
+    every entry are kept in ``index.json``; all changes happen under an exclusive lock on ``.lock``, so several
+    processes (and threads) on the same node can share the cache. When the total size exceeds ``max_bytes``, the
+    least recently used entries are evicted.
+
+    Since an entry shares its inode with the files linked from it, a linked file which is modified in place changes
+    the entry too. Such an entry is detected by its size and modification time, and dropped instead of being used.
+
+    :param cache_dir: the directory holding the cache, created if necessary
+    :param max_bytes: the total size of the cached files to keep
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+
+    @property
+    def cache_dir(self) -> Path:
+        """The directory holding the cache."""
+        return self._cache_dir
+
+    def materialize(self, checksum: str, dest: Path) -> bool:
+        """Places the cached file with ``checksum`` at ``dest``, returning ``False`` if it is not cached."""
+        with self._locked_index() as index:
+            entry = index.get(checksum)
+            if entry is None:
+                return False
+            path = self._object_path(checksum)
+            if not _is_intact(path, entry):
+                logger.warning(f"Dropping modified or missing cache entry {path}")
+                path.unlink(missing_ok=True)
+                del index[checksum]
+                return False
+            entry["last_used"] = time.time()
+            # placed while holding the lock, so the entry cannot be evicted in between
+            _link_or_copy(path, dest)
+        logger.info(f"Using cached {checksum} for {dest}")
+        return True
+
+    def insert(self, checksum: str, path: Path) -> None:
+        """Adds the file at ``path``, which must already be verified against ``checksum``, to the cache."""
+        with self._locked_index() as index:
+            object_path = self._object_path(checksum)
+            entry = index.get(checksum)
+            if entry is not None and _is_intact(object_path, entry):
+                entry["last_used"] = time.time()
+                return
+            size = path.stat().st_size
+            if size > self._max_bytes:
+                logger.debug(f"Not caching {path}, its size exceeds the cache size of {self._max_bytes} bytes")
+                return
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(path, object_path)
+            stat = object_path.stat()
+            index[checksum] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "last_used": time.time()}
+            self._evict(index, keep=checksum)
+
+    def _evict(self, index: dict[str, _IndexEntry], keep: str) -> None:
+        total = sum(entry["size"] for entry in index.values())
+        for checksum in sorted(index, key=lambda checksum: index[checksum]["last_used"]):
+            if total <= self._max_bytes:
+                break
+            if checksum == keep:
+                continue
+            logger.debug(f"Evicting {checksum} from the fetch cache")
+            self._object_path(checksum).unlink(missing_ok=True)
+            total -= index.pop(checksum)["size"]
+
+    def _object_path(self, checksum: str) -> Path:
+        return self._cache_dir / "objects" / checksum[:2] / checksum
+
+    @contextmanager
+    def _locked_index(self) -> Generator[dict[str, _IndexEntry], None, None]:
+        """Locks the cache and yields its index, which is written back unless an error occurred."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        index_path = self._cache_dir / "index.json"
+        with (self._cache_dir / ".lock").open("a") as lock:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                index = cast("dict[str, _IndexEntry]", json.loads(index_path.read_text()))
+            except FileNotFoundError:
+                index = {}
+            except ValueError:
+                logger.warning(f"Resetting unreadable cache index {index_path}")
+                index = {}
+            yield index
+            tmp = index_path.with_name(f"{index_path.name}.part")
+            _ = tmp.write_text(json.dumps(index))
+            _ = tmp.replace(index_path)
+
+
+def _is_intact(path: Path, entry: _IndexEntry) -> bool:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return False
+    return stat.st_size == entry["size"] and stat.st_mtime_ns == entry["mtime_ns"]
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Atomically places ``source`` at ``dest`` as a hard link, or as a copy if linking is not possible."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f"{dest.name}.part")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(source, tmp)
+    except OSError:
+        _ = shutil.copyfile(source, tmp)
+    _ = tmp.replace(dest)
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import shlex
 import shutil
 import subprocess
-from pathlib import Path
+import tempfile
+from collections import Counter, defaultdict
+from pathlib import Path, PurePosixPath
 from shutil import SameFileError
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 
 import httpx
 from loguru import logger
+from pydantic import BaseModel
 
 from bfabric.transfer._generic.checksums import md5_checksum
 from bfabric.transfer._generic.errors import TransferError
@@ -23,8 +27,24 @@ from bfabric.transfer._generic.sources import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from _hashlib import HASH
+
+    from bfabric.transfer._generic.cache import FetchCache
     from bfabric.transfer._generic.credentials import Credentials
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class FetchRequest(BaseModel):
+    """A file to fetch with :func:`fetch_many`, with the same options as :func:`fetch_to_path`."""
+
+    source: TransferSource
+    dest: Path
+    checksum: str | None = None
+    link_ok: bool = False
+
 
 def fetch_to_path(
     source: TransferSource,
@@ -33,13 +53,15 @@ def fetch_to_path(
     *,
     checksum: str | None = None,
     link_ok: bool = False,
+    cache: FetchCache | None = None,
 ) -> None:
     """Fetches ``source`` to ``dest`` using rsync/scp/cp/symlink or a streamed HTTP download.
 
     The fetch is atomic and checksum-verified across all transports: every byte-copy transport writes
     to a temporary sibling, is verified, then atomically replaces ``dest`` -- so a failed or corrupt
-    transfer never leaves a partial file behind. ``link_ok`` permits symlinking a local source in place
-    of copying it (the linked file is still verified when a checksum is given). Raises
+    transfer never leaves a partial file behind. HTTP downloads and local copies compute the checksum while
+    writing the file, so verifying it does not read the file a second time. ``link_ok`` permits symlinking a
+    local source in place of copying it (the linked file is still verified when a checksum is given). Raises
     :class:`TransferError` if the transfer ultimately fails or the checksum does not match.
 
     :param source: the file to fetch (a single transport-only source; candidate-list negotiation is
@@ -50,8 +72,12 @@ def fetch_to_path(
     :param checksum: expected MD5 hex digest to verify the fetched file against (all transports), if
         available.
     :param link_ok: whether a local source may be symlinked instead of copied.
+    :param cache: a cache of verified files to take the file from instead of transferring it, and to add it to
+        after the transfer. Only used for files with a ``checksum`` which are not linked.
     """
     dest.parent.mkdir(exist_ok=True, parents=True)
+    if cache is not None and checksum is not None and not link_ok and _fetch_from_cache(cache, checksum, dest):
+        return
 
     if link_ok:
         # A remote source must never reach the symlink branch, which assumes a local path; callers
@@ -68,10 +94,15 @@ def fetch_to_path(
     # failed/corrupt transfer never lands at dest. The temp lives in dest's directory so the rename stays
     # on one filesystem (atomic).
     tmp = dest.with_name(f"{dest.name}.part")
+    digest = hashlib.md5() if checksum is not None else None
     if isinstance(source, TransferSourceHttp):
         token = creds.token_provider() if creds.token_provider is not None else None
-        success = _operation_copy_http(source=source, output_path=tmp, bearer_token=token)
+        success = _operation_copy_http(source=source, output_path=tmp, bearer_token=token, digest=digest)
+    elif isinstance(source, TransferSourceLocal) and digest is not None:
+        success = _operation_copy_cp(source, tmp, digest=digest)
     else:
+        # rsync and scp write the file themselves, so it is hashed afterwards, while it is likely still cached
+        digest = None
         success = _operation_copy_rsync(source, tmp, creds.ssh_user)
         if not success:
             success = _operation_copy(source, tmp, creds.ssh_user)
@@ -80,8 +111,123 @@ def fetch_to_path(
         tmp.unlink(missing_ok=True)
         raise TransferError(f"Failed to fetch file: {source}")
 
-    _verify_checksum(tmp, checksum, dest)  # unlinks tmp and raises on mismatch
+    actual_checksum = digest.hexdigest() if digest is not None else None
+    _verify_checksum(tmp, checksum, dest, actual_checksum=actual_checksum)  # unlinks tmp and raises on mismatch
     _ = tmp.replace(dest)
+    if cache is not None and checksum is not None:
+        _add_to_cache(cache, checksum, dest)
+
+
+def _fetch_from_cache(cache: FetchCache, checksum: str, dest: Path) -> bool:
+    try:
+        return cache.materialize(checksum, dest)
+    except OSError as error:
+        logger.warning(f"Could not use the fetch cache {cache.cache_dir}: {error}")
+        return False
+
+
+def _add_to_cache(cache: FetchCache, checksum: str, path: Path) -> None:
+    try:
+        cache.insert(checksum, path)
+    except OSError as error:
+        logger.warning(f"Could not add {path} to the fetch cache {cache.cache_dir}: {error}")
+
+
+def fetch_many(requests: Sequence[FetchRequest], creds: Credentials, *, cache: FetchCache | None = None) -> None:
+    """Fetches several files like :func:`fetch_to_path`, moving the ssh files of each host in one rsync invocation.
+
+    Fetching every file with its own rsync process means one ssh session setup per file, which dominates the time
+    when there are many files on the same host. Here the ssh sources of a host are transferred with a single
+    ``rsync --files-from`` call (so over a single ssh session) into a temporary directory, then every file is
+    verified and published to its destination through its ``.part`` sibling, exactly as in :func:`fetch_to_path`.
+    All other files -- other transports, links, relative remote paths, a host with a single file -- and any file
+    which the batch did not deliver are fetched one by one with :func:`fetch_to_path`, including its scp fallback.
+
+    :param requests: the files to fetch
+    :param creds: credentials used for the transfers
+    :param cache: a cache of verified files, used for every file like in :func:`fetch_to_path`
+    :raises TransferError: if a file cannot be fetched or its checksum does not match
+    """
+    batches: defaultdict[str, list[FetchRequest]] = defaultdict(list)
+    singles: list[FetchRequest] = []
+    for request in requests:
+        if (
+            cache is not None
+            and request.checksum is not None
+            and not request.link_ok
+            and _fetch_from_cache(cache, request.checksum, request.dest)
+        ):
+            continue
+        if _is_batchable(request):
+            assert isinstance(request.source, TransferSourceSsh)
+            batches[request.source.host].append(request)
+        else:
+            singles.append(request)
+
+    for host, batch in batches.items():
+        if len(batch) == 1:
+            singles.extend(batch)
+        else:
+            singles.extend(_fetch_batch_rsync(host, batch, creds.ssh_user, cache))
+
+    for request in singles:
+        fetch_to_path(
+            request.source, request.dest, creds, checksum=request.checksum, link_ok=request.link_ok, cache=cache
+        )
+
+
+def _is_batchable(request: FetchRequest) -> bool:
+    if request.link_ok or not isinstance(request.source, TransferSourceSsh):
+        return False
+    path = PurePosixPath(request.source.path)
+    # --files-from paths are relative to the "/" source root, so only absolute paths within it can be batched
+    return path.is_absolute() and ".." not in path.parts
+
+
+def _fetch_batch_rsync(
+    host: str, requests: list[FetchRequest], ssh_user: str | None, cache: FetchCache | None
+) -> list[FetchRequest]:
+    """Fetches the files of ``requests`` from ``host`` with one rsync call, returning the requests it missed."""
+    staging_parent = requests[0].dest.parent
+    staging_parent.mkdir(exist_ok=True, parents=True)
+    staging = Path(tempfile.mkdtemp(prefix=".rsync_batch_", dir=staging_parent))
+    try:
+        remote_paths = [request.source.path for request in requests if isinstance(request.source, TransferSourceSsh)]
+        if not _operation_copy_rsync_batch(host, remote_paths, staging, ssh_user):
+            logger.warning(f"rsync batch from {host} failed, publishing the files which were transferred")
+        n_uses = Counter(remote_paths)
+        missing: list[FetchRequest] = []
+        for request, remote_path in zip(requests, remote_paths):
+            staged = staging / "files" / remote_path.lstrip("/")
+            n_uses[remote_path] -= 1
+            if not staged.exists():
+                missing.append(request)
+                continue
+            request.dest.parent.mkdir(exist_ok=True, parents=True)
+            tmp = request.dest.with_name(f"{request.dest.name}.part")
+            # the staged file is only moved by the last request of the same remote file
+            _ = shutil.copy2(staged, tmp) if n_uses[remote_path] else shutil.move(staged, tmp)
+            _verify_checksum(tmp, request.checksum, request.dest)  # unlinks tmp and raises on mismatch
+            _ = tmp.replace(request.dest)
+            if cache is not None and request.checksum is not None:
+                _add_to_cache(cache, request.checksum, request.dest)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    if missing:
+        logger.warning(f"{len(missing)} file(s) missing from the rsync batch of {host}, fetching them one by one")
+    return missing
+
+
+def _operation_copy_rsync_batch(host: str, remote_paths: list[str], staging: Path, ssh_user: str | None) -> bool:
+    files_from = staging / "files-from"
+    _ = files_from.write_bytes(b"".join(f"{path}\0".encode() for path in remote_paths))
+    source_str = f"{ssh_user}@{host}:/" if ssh_user else f"{host}:/"
+    # Unlike the single-file call, no --partial (-P): an interrupted transfer must not leave a truncated file behind
+    # under its final name, as every file present in the staging directory afterwards is taken as complete.
+    cmd = ["rsync", "-rltv", "--from0", f"--files-from={files_from}", "--", source_str, str(staging / "files")]
+    logger.info(shlex.join(cmd))
+    result = subprocess.run(cmd, check=False)
+    return result.returncode == 0
 
 
 def _operation_copy_rsync(
@@ -107,8 +253,13 @@ def _operation_copy(source: TransferSourceSsh | TransferSourceLocal, output_path
             return _operation_copy_scp(source, output_path, ssh_user)
 
 
-def _operation_copy_http(source: TransferSourceHttp, output_path: Path, bearer_token: str | None) -> bool:
-    """Streams a file from an HTTP(S) URL to ``output_path`` (checksum verification is the caller's job)."""
+def _operation_copy_http(
+    source: TransferSourceHttp, output_path: Path, bearer_token: str | None, digest: HASH | None = None
+) -> bool:
+    """Streams a file from an HTTP(S) URL to ``output_path`` (checksum verification is the caller's job).
+
+    If ``digest`` is given, it is updated with the downloaded bytes as they are written.
+    """
     needs_auth = source.auth == "bfabric"
 
     if needs_auth and not bearer_token:
@@ -130,7 +281,10 @@ def _operation_copy_http(source: TransferSourceHttp, output_path: Path, bearer_t
         with httpx.stream("GET", source.url, headers=headers, follow_redirects=True) as response:
             _ = response.raise_for_status()
             with output_path.open("wb") as fh:
-                fh.writelines(response.iter_bytes())
+                for chunk in response.iter_bytes():
+                    _ = fh.write(chunk)
+                    if digest is not None:
+                        digest.update(chunk)
     except httpx.HTTPError as error:
         detail = ""
         if isinstance(error, httpx.HTTPStatusError):
@@ -144,13 +298,19 @@ def _operation_copy_http(source: TransferSourceHttp, output_path: Path, bearer_t
     return True
 
 
-def _verify_checksum(tmp_path: Path, expected: str | None, output_path: Path) -> None:
-    """Verifies ``tmp_path`` against ``expected``, raising on mismatch; warns and skips if none was provided."""
+def _verify_checksum(
+    tmp_path: Path, expected: str | None, output_path: Path, actual_checksum: str | None = None
+) -> None:
+    """Verifies ``tmp_path`` against ``expected``, raising on mismatch; warns and skips if none was provided.
+
+    ``actual_checksum`` is the checksum computed while the file was written, if any, so it is not read again.
+    """
     if expected is None:
         # Runs for every un-checksummed fetch of any transport, so keep it at debug to avoid per-file noise.
         logger.debug(f"No checksum available for {output_path}; skipping integrity verification.")
         return
-    actual_checksum = md5_checksum(tmp_path)
+    if actual_checksum is None:
+        actual_checksum = md5_checksum(tmp_path)
     if actual_checksum != expected:
         tmp_path.unlink(missing_ok=True)
         raise TransferError(
@@ -168,16 +328,27 @@ def _operation_copy_scp(source: TransferSourceSsh, output_path: Path, ssh_user:
     return True
 
 
-def _operation_copy_cp(source: TransferSourceLocal, output_path: Path) -> bool:
+def _operation_copy_cp(source: TransferSourceLocal, output_path: Path, digest: HASH | None = None) -> bool:
+    """Copies a local file; if ``digest`` is given, it is updated with the bytes as they are copied."""
     cmd = [str(Path(source.path).resolve()), str(output_path)]
     logger.info(shlex.join(["cp", *cmd]))
     try:
-        _ = shutil.copyfile(*cmd)
+        if digest is None:
+            _ = shutil.copyfile(*cmd)
+        else:
+            _copy_with_digest(Path(cmd[0]), output_path, digest)
     except (OSError, SameFileError):
         return False
     return True
 
 
+def _copy_with_digest(source: Path, output_path: Path, digest: HASH) -> None:
+    with source.open("rb") as src, output_path.open("wb") as dst:
+        while chunk := src.read(_COPY_CHUNK_SIZE):
+            digest.update(chunk)
+            _ = dst.write(chunk)
+
+
 def _operation_link_symbolic(source: TransferSourceLocal, output_path: Path) -> bool:
     # the link is created relative to the output file, so it should be more portable across apptainer images etc.
     # os.path.relpath (rather than Path.relative_to(..., walk_up=True), which is 3.12+) keeps this working on
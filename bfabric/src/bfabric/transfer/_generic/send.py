@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import shlex
 import shutil
+import subprocess
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
 from subprocess import CalledProcessError
 from typing import TYPE_CHECKING
 
 from loguru import logger
+from pydantic import BaseModel
 
 from bfabric.transfer._generic._upload_types import ProgressCallback, UploadOutcome, UrlCallback
 from bfabric.transfer._generic.errors import TransferError
@@ -17,11 +24,18 @@ from bfabric.transfer._generic.sinks import (
 )
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Sequence
 
     from bfabric.transfer._generic.credentials import Credentials
 
 
+class SendRequest(BaseModel):
+    """A file to send with :func:`send_many`."""
+
+    sink: TransferSink
+    src: Path
+
+
 def send_to_sink(
     sink: TransferSink,
     src: Path,
@@ -66,8 +80,73 @@ def send_to_sink(
             )
 
 
+def send_many(requests: Sequence[SendRequest], creds: Credentials) -> None:
+    """Sends several files like :func:`send_to_sink`, moving the scp files of each host in one rsync invocation.
+
+    Sending every file with its own scp process means one ssh session setup (plus one more for the remote
+    ``mkdir``) per file. Here the scp sinks of a host are pushed with a single ``rsync --files-from`` call from a
+    temporary directory of symlinks laid out like the remote paths, so over a single ssh session which also creates
+    the missing directories. All other files -- other transports, relative remote paths, a host with a single
+    file -- are sent one by one with :func:`send_to_sink`, as are all files of a host whose batch failed.
+
+    :param requests: the files to send
+    :param creds: credentials used for the transfers
+    :raises TransferError: if a file cannot be sent
+    """
+    batches: defaultdict[str, list[SendRequest]] = defaultdict(list)
+    singles: list[SendRequest] = []
+    for request in requests:
+        if _is_batchable(request):
+            assert isinstance(request.sink, TransferSinkScp)
+            batches[request.sink.host].append(request)
+        else:
+            singles.append(request)
+
+    for host, batch in batches.items():
+        if len(batch) == 1 or not _send_batch_rsync(host, batch, creds.ssh_user):
+            singles.extend(batch)
+
+    for request in singles:
+        _ = send_to_sink(request.sink, request.src, creds)
+
+
+def _is_batchable(request: SendRequest) -> bool:
+    if not isinstance(request.sink, TransferSinkScp):
+        return False
+    path = PurePosixPath(request.sink.path)
+    # --files-from paths are relative to the "/" destination root, so only absolute paths within it can be batched
+    return path.is_absolute() and ".." not in path.parts
+
+
+def _send_batch_rsync(host: str, requests: list[SendRequest], ssh_user: str | None) -> bool:
+    """Sends the files of ``requests`` to ``host`` with one rsync call, returning whether it succeeded."""
+    with tempfile.TemporaryDirectory(prefix="rsync_batch_") as tmp:
+        staging = Path(tmp) / "files"
+        remote_paths = []
+        for request in requests:
+            assert isinstance(request.sink, TransferSinkScp)
+            remote_path = request.sink.path.lstrip("/")
+            link = staging / remote_path
+            link.parent.mkdir(parents=True, exist_ok=True)
+            link.unlink(missing_ok=True)
+            link.symlink_to(request.src.absolute())
+            remote_paths.append(remote_path)
+        files_from = Path(tmp) / "files-from"
+        _ = files_from.write_bytes(b"".join(f"{path}\0".encode() for path in remote_paths))
+        target = f"{ssh_user}@{host}:/" if ssh_user else f"{host}:/"
+        # -L sends the files the symlinks point to; -O leaves the times of the existing remote directories alone.
+        cmd = ["rsync", "-rtvLO", "--from0", f"--files-from={files_from}", "--", f"{staging}/", target]
+        logger.info(shlex.join(cmd))
+        result = subprocess.run(cmd, check=False)
+    if result.returncode != 0:
+        logger.warning(f"rsync batch to {host} failed, sending its {len(requests)} file(s) one by one")
+        return False
+    return True
+
+
 def _send_local(sink: TransferSinkLocal, src: Path, on_progress: ProgressCallback | None) -> UploadOutcome:
     size = src.stat().st_size
+    start = time.perf_counter()
     sink.path.parent.mkdir(parents=True, exist_ok=True)
     logger.info(f"cp {src} {sink.path}")
     try:
@@ -76,13 +155,14 @@ def _send_local(sink: TransferSinkLocal, src: Path, on_progress: ProgressCallbac
         raise TransferError(f"failed to copy {src} to {sink.path}: {exc}") from exc
     if on_progress is not None:
         on_progress(size, size)
-    return UploadOutcome(bytes_uploaded=size, final_offset=size, upload_url=None)
+    return UploadOutcome(bytes_uploaded=size, final_offset=size, upload_url=None, elapsed=time.perf_counter() - start)
 
 
 def _send_scp(
     sink: TransferSinkScp, src: Path, creds: Credentials, on_progress: ProgressCallback | None
 ) -> UploadOutcome:
     size = src.stat().st_size
+    start = time.perf_counter()
     target = f"{sink.host}:{sink.path}"
     try:
         scp(source=src, target=target, user=creds.ssh_user)
@@ -90,4 +170,4 @@ def _send_scp(
         raise TransferError(f"scp of {src} to {target} failed: {exc}") from exc
     if on_progress is not None:
         on_progress(size, size)
-    return UploadOutcome(bytes_uploaded=size, final_offset=size, upload_url=None)
+    return UploadOutcome(bytes_uploaded=size, final_offset=size, upload_url=None, elapsed=time.perf_counter() - start)
@@ -18,6 +18,8 @@ class ActionConfig(BaseModel):
     filter: str | None = None
     force_storage: Path | None = None
     read_only: bool | None = None
+    parallel: int | None = None
+    continue_on_error: bool | None = None
 
 
 class FromConfigFile(BaseModel):
@@ -14,6 +14,7 @@ from bfabric_app_runner.actions.types import (
     ActionOutputs,
     ActionRun,
 )
+from bfabric_app_runner.app_runner.chunk_pool import run_chunks
 from bfabric_app_runner.app_runner.resolve_app import load_workunit_information
 from bfabric_app_runner.app_runner.runner import ChunksFile
 from bfabric_app_runner.app_runner.runner import Runner
@@ -49,15 +50,21 @@ def execute_dispatch(action: ActionDispatch, client: Bfabric) -> None:
 
 
 def execute_run(action: ActionRun, client: Bfabric) -> None:
-    """Executes a run action."""
+    """Executes a run action.
+
+    With ``action.parallel`` larger than 1, up to that many chunks are run at the same time.
+    """
     _ensure_dispatched(action, client=client)
     chunk_dirs = _validate_chunks_list(action.work_dir, action.chunk)
-    for chunk_dir_rel in chunk_dirs:
+
+    def run_chunk(chunk_dir_rel: Path) -> None:
         execute_inputs(action=ActionInputs.from_action_run(action, chunk=str(chunk_dir_rel)), client=client)
         execute_process(action=ActionProcess.from_action_run(action, chunk=str(chunk_dir_rel)), client=client)
         execute_outputs(action=ActionOutputs.from_action_run(action, chunk=str(chunk_dir_rel)), client=client)
 
-    # chunk=None means all chunks were processed, so it's safe to finalize the workunit.
+    run_chunks(chunk_dirs, run_chunk, parallel=action.parallel, continue_on_error=action.continue_on_error)
+
+    # chunk=None means all chunks were processed successfully, so it's safe to finalize the workunit.
     if action.chunk is None and not action.read_only:
         workunit_definition = WorkunitDefinition.from_yaml(path=action.work_dir / "workunit_definition.yml")
         assert workunit_definition.registration is not None
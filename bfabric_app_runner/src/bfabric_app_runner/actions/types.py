@@ -34,6 +34,8 @@ class ActionRun(FromConfigFile):
     force_storage: Path | None = None
     read_only: bool = False
     workunit_ref: int | Path
+    parallel: int = 1
+    continue_on_error: bool = False
 
 
 class ActionInputs(FromConfigFile):
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ALL_COMPLETED, FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from bfabric_app_runner.errors import ChunksFailedError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from concurrent.futures import Future
+    from pathlib import Path
+
+CHUNK_LOG_FILE = "app_runner.log"
+"""Name of the log file, written into every chunk directory when chunks run in parallel."""
+
+
+def run_chunks(
+    chunks: list[Path], run_chunk: Callable[[Path], None], parallel: int = 1, continue_on_error: bool = False
+) -> None:
+    """Calls ``run_chunk`` for every chunk directory, running up to ``parallel`` chunks at the same time.
+
+    The chunks of a workunit are independent of each other, and most of the time is spent in the app's commands
+    which run as subprocesses, so a thread pool is enough to keep the cores of the node busy. When running in
+    parallel, the log messages of every chunk are additionally written to its own ``app_runner.log`` file, and
+    tagged with the ``chunk`` extra field. The output of the app's commands is not captured.
+
+    :param chunks: the chunk directories to run
+    :param run_chunk: the function which runs all steps of a single chunk
+    :param parallel: the maximum number of chunks to run at the same time
+    :param continue_on_error: if True, all chunks are run even if some of them fail, and a
+        :class:`ChunksFailedError` listing the failed chunks is raised at the end. Otherwise, the first error is
+        raised as soon as the chunks that are already running have finished, without starting the remaining ones.
+    :raises ValueError: if ``parallel`` is smaller than 1
+    """
+    if parallel < 1:
+        raise ValueError(f"parallel must be at least 1, got {parallel}")
+    if parallel == 1:
+        _run_sequential(chunks, run_chunk=run_chunk, continue_on_error=continue_on_error)
+    else:
+        _run_parallel(chunks, run_chunk=run_chunk, parallel=parallel, continue_on_error=continue_on_error)
+
+
+def _run_sequential(chunks: list[Path], run_chunk: Callable[[Path], None], continue_on_error: bool) -> None:
+    failures: dict[Path, BaseException] = {}
+    for chunk in chunks:
+        logger.info(f"Processing chunk {chunk}")
+        try:
+            run_chunk(chunk)
+        except Exception as error:
+            if not continue_on_error:
+                raise
+            logger.error(f"Chunk {chunk} failed: {error}")
+            failures[chunk] = error
+    if failures:
+        raise ChunksFailedError(failures)
+
+
+def _run_parallel(
+    chunks: list[Path], run_chunk: Callable[[Path], None], parallel: int, continue_on_error: bool
+) -> None:
+    logger.info(f"Processing {len(chunks)} chunk(s) with up to {parallel} in parallel")
+    # set on the first failure without continue_on_error, so the queued chunks are skipped by the workers instead of
+    # being started before the failure is noticed
+    stop = threading.Event()
+
+    def run_logged(chunk: Path) -> None:
+        if stop.is_set():
+            return
+        with _chunk_log(chunk):
+            logger.info(f"Processing chunk {chunk}")
+            try:
+                run_chunk(chunk)
+            except Exception as error:
+                if not continue_on_error:
+                    stop.set()
+                logger.error(f"Chunk {chunk} failed: {error}")
+                raise
+
+    with ThreadPoolExecutor(max_workers=min(parallel, len(chunks)), thread_name_prefix="chunk") as pool:
+        futures = {pool.submit(run_logged, chunk): chunk for chunk in chunks}
+        _, pending = wait(futures, return_when=ALL_COMPLETED if continue_on_error else FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+
+    errors = {chunk: _exception(future) for future, chunk in futures.items()}
+    failures = {chunk: error for chunk, error in errors.items() if error is not None}
+    if not failures:
+        return
+    if not continue_on_error:
+        # report the first failed chunk in the order of the chunks file
+        raise next(iter(failures.values()))
+    raise ChunksFailedError(failures)
+
+
+def _exception(future: Future[None]) -> BaseException | None:
+    return None if future.cancelled() else future.exception()
+
+
+@contextmanager
+def _chunk_log(chunk: Path) -> Generator[None, None, None]:
+    """Tags the log messages of the current thread with the chunk, and writes them to the chunk's log file."""
+    chunk_name = str(chunk)
+    sink_id = logger.add(
+        chunk / CHUNK_LOG_FILE,
+        level="DEBUG",
+        filter=lambda record: record["extra"].get("chunk") == chunk_name,
+    )
+    try:
+        with logger.contextualize(chunk=chunk_name):
+            yield
+    finally:
+        logger.remove(sink_id)
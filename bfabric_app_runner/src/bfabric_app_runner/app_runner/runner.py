@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 import yaml
 
+from bfabric_app_runner.app_runner.chunk_pool import run_chunks
 from bfabric_app_runner.commands.execute import execute_command
 from bfabric_app_runner.inputs.prepare.prepare_folder import prepare_folder
 from bfabric_app_runner.output_registration import register_outputs
@@ -137,11 +138,13 @@ def run_app(
     ssh_user: str | None = None,
     read_only: bool = False,
     dispatch_active: bool = True,
+    parallel: int = 1,
+    continue_on_error: bool = False,
 ) -> None:
     """Executes all steps of the provided app: dispatch, then inputs/process/collect for every chunk.
 
     Unless ``read_only`` is set, the workunit status is set to ``processing`` before the run and to
-    ``available`` once all chunks have been processed.
+    ``available`` once all chunks have been processed successfully.
 
     :param app_spec: Resolved app version whose commands and settings drive execution.
     :param workunit_ref: Workunit to run, either a B-Fabric workunit ID or a path to a workunit definition YAML.
@@ -151,6 +154,9 @@ def run_app(
     :param ssh_user: SSH user for staging inputs and copying outputs; ``None`` uses the current user.
     :param read_only: When True, skips all B-Fabric mutations (workunit status updates and output registration).
     :param dispatch_active: When True, runs the dispatch step; set False to reuse an existing chunk layout.
+    :param parallel: Maximum number of chunks to run at the same time.
+    :param continue_on_error: When True, the remaining chunks are still run after a chunk failed, and a
+        ``ChunksFailedError`` is raised once all of them have finished.
     """
     # TODO would it be possible, to reuse the individual steps commands so there is certainly only one definition?
     work_dir = work_dir.resolve()
@@ -168,8 +174,8 @@ def run_app(
     if dispatch_active:
         runner.run_dispatch(workunit_ref=workunit_definition_file, work_dir=work_dir)
     chunks_file = ChunksFile.read(work_dir=work_dir)
-    for chunk in chunks_file.chunks:
-        logger.info(f"Processing chunk {chunk}")
+
+    def run_chunk(chunk: Path) -> None:
         runner.run_inputs(chunk_dir=chunk)
         runner.run_process(chunk_dir=chunk)
         runner.run_collect(workunit_ref=workunit_definition_file, chunk_dir=chunk)
@@ -182,6 +188,8 @@ def run_app(
                 force_storage=force_storage,
             )
 
+    run_chunks(chunks_file.chunks, run_chunk, parallel=parallel, continue_on_error=continue_on_error)
+
     if not read_only:
         # Set the workunit status to available
         client.save("workunit", {"id": workunit_definition.registration.workunit_id, "status": "available"})
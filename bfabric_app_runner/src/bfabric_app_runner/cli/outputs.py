@@ -23,15 +23,21 @@ def cmd_outputs_register(
     *,
     ssh_user: str | None = None,
     force_storage: Path | None = None,
+    batched: bool = False,
     client: Bfabric,
 ) -> None:
-    """Register the output files of a workunit."""
+    """Register the output files of a workunit.
+
+    :param batched: Copy and register all files together, with one rsync call per storage host and one request per
+        100 resources, instead of one copy and several requests per file.
+    """
     register_outputs(
         outputs_yaml=outputs_yaml,
         workunit_definition=_get_workunit_definition(client, workunit_ref),
         client=client,
         ssh_user=ssh_user,
         force_storage=force_storage,
+        batched=batched,
     )
 
 
@@ -1,4 +1,5 @@
 import shlex
+from pathlib import Path
 
 
 class CommandFailedError(RuntimeError):
@@ -10,3 +11,15 @@ class CommandFailedError(RuntimeError):
 
     def __init__(self, command_args: list[str], returncode: int) -> None:
         super().__init__(f"Command failed with exit code {returncode}: {shlex.join(command_args)}")
+
+
+class ChunksFailedError(RuntimeError):
+    """One or more chunks of a workunit failed, while the remaining chunks were still run to completion.
+
+    :param failures: the error of every failed chunk, by chunk directory
+    """
+
+    def __init__(self, failures: dict[Path, BaseException]) -> None:
+        self.failures = failures
+        details = "; ".join(f"{chunk}: {error}" for chunk, error in failures.items())
+        super().__init__(f"{len(failures)} chunk(s) failed: {details}")
@@ -14,6 +14,7 @@ from bfabric_app_runner.inputs.resolve.resolved_inputs import (
 if TYPE_CHECKING:
     from pathlib import Path
     from bfabric.bfabric import Bfabric
+    from bfabric_app_runner.inputs.staging_manifest import StagingManifest
 
 
 class IntegrityState(Enum):
@@ -48,7 +49,9 @@ class IntegrityState(Enum):
         return self != IntegrityState.Missing
 
 
-def check_integrity(file: ResolvedInput, local_path: Path, client: Bfabric) -> IntegrityState:
+def check_integrity(
+    file: ResolvedInput, local_path: Path, client: Bfabric, manifest: StagingManifest | None = None
+) -> IntegrityState:
     """Checks the integrity of a local file/directory against the spec.
 
     The purpose of this integrity check is to determine whether the local artifact
@@ -60,17 +63,20 @@ def check_integrity(file: ResolvedInput, local_path: Path, client: Bfabric) -> I
 
     This is NOT about validating filtering logic (include/exclude patterns) -
     that's handled during the preparation phase.
+
+    If a staging ``manifest`` is passed, checksums are only computed for files whose size, modification time or
+    inode differ from the ones recorded in it.
     """
     if not local_path.exists():
         return IntegrityState.Missing
 
     try:
         if isinstance(file, ResolvedFile):
-            return _check_file_integrity(file, local_path)
+            return _check_file_integrity(file, local_path, manifest)
         elif isinstance(file, ResolvedStaticFile):
             return _check_static_file_integrity(file, local_path)
         elif isinstance(file, ResolvedDirectory):
-            return _check_directory_integrity(file, local_path)
+            return _check_directory_integrity(file, local_path, manifest)
         else:
             assert_never(file)
     except OSError:
@@ -78,13 +84,12 @@ def check_integrity(file: ResolvedInput, local_path: Path, client: Bfabric) -> I
         return IntegrityState.Incorrect
 
 
-def _check_file_integrity(file: ResolvedFile, local_path: Path) -> IntegrityState:
+def _check_file_integrity(file: ResolvedFile, local_path: Path, manifest: StagingManifest | None) -> IntegrityState:
     """Check integrity of a regular file."""
     if file.checksum is None:
         return IntegrityState.NotChecked
     else:
-        actual_checksum = md5_checksum(local_path)
-        return IntegrityState.Correct if file.checksum == actual_checksum else IntegrityState.Incorrect
+        return _check_checksum(local_path, file.checksum, manifest)
 
 
 def _check_static_file_integrity(file: ResolvedStaticFile, local_path: Path) -> IntegrityState:
@@ -94,7 +99,9 @@ def _check_static_file_integrity(file: ResolvedStaticFile, local_path: Path) ->
         return IntegrityState.Correct if f.read() == file.content else IntegrityState.Incorrect
 
 
-def _check_directory_integrity(file: ResolvedDirectory, local_path: Path) -> IntegrityState:
+def _check_directory_integrity(
+    file: ResolvedDirectory, local_path: Path, manifest: StagingManifest | None
+) -> IntegrityState:
     """Check integrity of an extracted directory and its cache file.
 
     For directories, we validate:
@@ -121,11 +128,16 @@ def _check_directory_integrity(file: ResolvedDirectory, local_path: Path) -> Int
             if not cache_file.is_file():
                 return IntegrityState.Incorrect
             # Validate cache file checksum
-            actual_checksum = md5_checksum(cache_file)
-            return IntegrityState.Correct if file.checksum == actual_checksum else IntegrityState.Incorrect
+            return _check_checksum(cache_file, file.checksum, manifest)
         else:
             # Cache file missing but we have checksum - trigger refresh
             return IntegrityState.Incorrect
 
     # No checksum available - can only do basic validation
     return IntegrityState.NotChecked
+
+
+def _check_checksum(local_path: Path, checksum: str, manifest: StagingManifest | None) -> IntegrityState:
+    """Check the MD5 checksum of a file, using the manifest to skip hashing it if it is unchanged."""
+    matches = manifest.verify(local_path, checksum) if manifest is not None else md5_checksum(local_path) == checksum
+    return IntegrityState.Correct if matches else IntegrityState.Incorrect
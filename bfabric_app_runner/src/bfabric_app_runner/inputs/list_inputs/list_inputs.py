@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from bfabric_app_runner.inputs.list_inputs.integrity import check_integrity, IntegrityState
 from bfabric_app_runner.inputs.resolve.resolver import Resolver
+from bfabric_app_runner.inputs.staging_manifest import StagingManifest
 from rich.console import Console
 from rich.table import Table, Column
 
@@ -34,11 +35,13 @@ def list_input_states(
     :param target_folder: The target folder where the files should be stored
     :param client: A B-Fabric client
     :param check_files: If this is `True`, in addition to listing the files, their integrity states will be computed,
-        otherwise the value is always `NotChecked`.
+        otherwise the value is always `NotChecked`. Files recorded unchanged in the staging manifest of the target
+        folder are not hashed again, and the checksums computed otherwise are recorded in it.
     """
     input_states = []
     resolver = Resolver(client=client)
     input_files = resolver.resolve(specs=specs)
+    manifest = StagingManifest.load(target_folder) if check_files else None
 
     for input_file in input_files.files:
         path = target_folder / input_file.filename
@@ -46,8 +49,10 @@ def list_input_states(
         if not check_files:
             integrity = IntegrityState.NotChecked
         else:
-            integrity = check_integrity(file=input_file, local_path=path, client=client)
+            integrity = check_integrity(file=input_file, local_path=path, client=client, manifest=manifest)
         input_states.append(FileState(name=input_file.filename, path=path, exists=exists, integrity=integrity))
+    if manifest is not None:
+        manifest.try_save()
     return input_states
 
 
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from bfabric.transfer import FetchCache
+
 
 @dataclass(frozen=True)
 class PrepareContext:
@@ -18,7 +20,11 @@ class PrepareContext:
     ``token_provider`` is a *live* provider -- it is read per request/retry rather than snapshotted,
     so a long multi-file prepare survives a mid-batch OAuth token refresh. It is ``None`` for
     ssh/local-only prepares and for classic login+password clients.
+
+    ``cache`` is the node-local cache of fetched files, which inputs with a known checksum are taken from
+    instead of transferring them again; ``None`` disables it.
     """
 
     ssh_user: str | None = None
     token_provider: Callable[[], str] | None = None
+    cache: FetchCache | None = None
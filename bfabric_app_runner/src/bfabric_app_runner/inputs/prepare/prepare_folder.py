@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import math
+import os
+import shutil
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from pathlib import Path
 from typing import TYPE_CHECKING, Literal, assert_never
+from urllib.parse import urlsplit
 
-from bfabric.transfer import ScopeError, check_download_scope, token_provider
+from bfabric.transfer import FetchCache, ScopeError, check_download_scope, token_provider
 from loguru import logger
 
 from bfabric_app_runner.inputs.prepare.prepare_context import PrepareContext
 from bfabric_app_runner.inputs.prepare.prepare_resolved_directory import prepare_resolved_directory
-from bfabric_app_runner.inputs.prepare.prepare_resolved_file import prepare_resolved_file
+from bfabric_app_runner.inputs.prepare.prepare_resolved_file import prepare_resolved_file, prepare_resolved_files
 from bfabric_app_runner.inputs.prepare.prepare_resolved_static_file import prepare_resolved_static_file
 from bfabric_app_runner.inputs.resolve.resolved_inputs import (
     ResolvedInputs,
@@ -16,15 +26,28 @@ from bfabric_app_runner.inputs.resolve.resolved_inputs import (
     ResolvedDirectory,
 )
 from bfabric_app_runner.inputs.resolve.resolver import Resolver
-from bfabric_app_runner.specs.inputs.file_spec import FileSourceHttp
+from bfabric_app_runner.inputs.staging_manifest import StagingManifest
+from bfabric_app_runner.specs.inputs.file_spec import FileSourceHttp, FileSourceSsh
 from bfabric_app_runner.specs.inputs_spec import (
     InputsSpec,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
     from bfabric.bfabric import Bfabric
+    from bfabric_app_runner.inputs.resolve.resolved_inputs import ResolvedInput
+
+MAX_STAGING_WORKERS = 8
+"""Default number of input files which are staged at the same time."""
+
+MAX_STAGING_PER_HOST = 4
+"""Default number of input files which are staged at the same time from the same remote host."""
+
+INPUT_CACHE_ENV = "BFABRIC_APP_RUNNER_INPUT_CACHE"
+"""Environment variable with the directory of the node-local input cache, which is only used when it is set."""
+
+INPUT_CACHE_MAX_GB_ENV = "BFABRIC_APP_RUNNER_INPUT_CACHE_MAX_GB"
+"""Environment variable with the size budget of the input cache in GB, by default 100."""
 
 
 def prepare_folder(
@@ -34,6 +57,8 @@ def prepare_folder(
     ssh_user: str | None,
     filter: str | None,
     action: Literal["prepare", "clean"] = "prepare",
+    max_workers: int = MAX_STAGING_WORKERS,
+    max_per_host: int = MAX_STAGING_PER_HOST,
 ) -> None:
     """Prepares the input files of a chunk folder according to the provided specs.
 
@@ -43,6 +68,8 @@ def prepare_folder(
     :param ssh_user: SSH user to use for downloading the input files, should it be different from the current user.
     :param filter: only this input file will be prepared.
     :param action: Action to perform.
+    :param max_workers: Maximum number of input files to stage at the same time.
+    :param max_per_host: Maximum number of input files to stage at the same time from the same remote host.
     """
     # set defaults
     inputs_yaml = inputs_yaml.absolute()
@@ -68,14 +95,39 @@ def prepare_folder(
         # Only touch the client's auth (which may trigger an OAuth token fetch/refresh) when an HTTP input
         # actually needs a bearer token; otherwise SSH/local-only prepares stay independent of auth.
         provider = _resolve_token_provider(client) if _needs_bearer_token(input_files) else None
-        context = PrepareContext(ssh_user=ssh_user, token_provider=provider)
-        _prepare_input_files(input_files=input_files, working_dir=target_folder, context=context)
+        context = PrepareContext(ssh_user=ssh_user, token_provider=provider, cache=_input_cache_from_env())
+        _prepare_input_files(
+            input_files=input_files,
+            working_dir=target_folder,
+            context=context,
+            max_workers=max_workers,
+            max_per_host=max_per_host,
+        )
     elif action == "clean":
         _clean_input_files(input_files=input_files, working_dir=target_folder)
     else:
         raise ValueError(f"Unknown action: {action}")
 
 
+def _input_cache_from_env() -> FetchCache | None:
+    """Returns the input cache configured with the environment variables, if any.
+
+    Input files with a checksum are then shared through the cache by all chunks and workunits running on the node,
+    so staging the same resource again only creates a hard link to the cached file.
+    """
+    cache_dir = os.environ.get(INPUT_CACHE_ENV)
+    if not cache_dir:
+        return None
+    max_gb_value = os.environ.get(INPUT_CACHE_MAX_GB_ENV, "100")
+    try:
+        max_gb = float(max_gb_value)
+    except ValueError:
+        max_gb = math.nan
+    if not (math.isfinite(max_gb) and max_gb > 0):
+        raise ValueError(f"{INPUT_CACHE_MAX_GB_ENV} must be a positive number of GB, got {max_gb_value!r}")
+    return FetchCache(cache_dir=Path(cache_dir).expanduser(), max_bytes=int(max_gb * 1e9))
+
+
 def _needs_bearer_token(input_files: ResolvedInputs) -> bool:
     """Whether any resolved input is an HTTP source that requires the B-Fabric bearer token."""
     return any(
@@ -106,18 +158,193 @@ def _resolve_token_provider(client: Bfabric) -> Callable[[], str] | None:
     return provider
 
 
-def _prepare_input_files(input_files: ResolvedInputs, working_dir: Path, context: PrepareContext) -> None:
-    """Prepares the input files in the working directory according to the provided specs."""
-    for input_file in input_files.files:
-        match input_file:
-            case ResolvedFile():
-                prepare_resolved_file(file=input_file, working_dir=working_dir, context=context)
-            case ResolvedStaticFile():
-                prepare_resolved_static_file(file=input_file, working_dir=working_dir)
-            case ResolvedDirectory():
-                prepare_resolved_directory(file=input_file, working_dir=working_dir, context=context)
-            case _:
-                assert_never(input_file)
+def _prepare_input_files(
+    input_files: ResolvedInputs,
+    working_dir: Path,
+    context: PrepareContext,
+    max_workers: int = MAX_STAGING_WORKERS,
+    max_per_host: int = MAX_STAGING_PER_HOST,
+) -> None:
+    """Prepares the input files in the working directory according to the provided specs.
+
+    Staging a file is mostly waiting for a transfer, so up to `max_workers` files are staged at the same time, with
+    at most `max_per_host` transfers from the same remote host. The files copied over ssh from the same host are
+    transferred together in a single rsync call instead. Staging is all-or-nothing: if an input fails, no
+    further inputs are started, and once the running ones are finished, the files and directories this call
+    created are removed again before the first error is raised. Files which existed before are kept.
+
+    The verified checksums of the staged files are recorded in the staging manifest of the working directory, and
+    files with a checksum which are still present and unchanged are not staged again.
+    """
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+    if max_per_host < 1:
+        raise ValueError(f"max_per_host must be at least 1, got {max_per_host}")
+    manifest = StagingManifest.load(working_dir)
+    files = [file for file in input_files.files if not _is_staged(file, working_dir=working_dir, manifest=manifest)]
+    if len(files) < len(input_files.files):
+        logger.info(f"Skipping {len(input_files.files) - len(files)} unchanged input(s)")
+    if not files:
+        return
+
+    preexisting = {path for file in files for path in _staged_paths(file, working_dir) if _path_exists(path)}
+    host_slots: defaultdict[str | None, threading.BoundedSemaphore] = defaultdict(
+        lambda: threading.BoundedSemaphore(max_per_host)
+    )
+    progress = _StagingProgress(n_total=len(files))
+    # set on the first failure, so the queued batches, and those still waiting for a host slot, are skipped by the
+    # workers instead of being started before the failure is noticed
+    stop = threading.Event()
+
+    def stage(batch: list[ResolvedInput]) -> None:
+        host = _transfer_host(batch[0])
+        with nullcontext() if host is None else host_slots[host]:
+            if stop.is_set():
+                return
+            try:
+                _prepare_input_batch(batch, working_dir=working_dir, context=context)
+            except Exception:
+                # set before the host slot is released, so no batch waiting for it is started anymore
+                stop.set()
+                raise
+        for input_file in batch:
+            path = _staged_paths(input_file, working_dir)[0]
+            if isinstance(input_file, ResolvedFile) and input_file.checksum is not None:
+                manifest.record(path, input_file.checksum)
+            progress.add(path)
+
+    batches = _batch_input_files(files)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches)), thread_name_prefix="stage_input") as pool:
+        futures = [pool.submit(stage, batch) for batch in batches]
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+    manifest.try_save()
+
+    errors = [(batch, future.exception()) for batch, future in zip(batches, futures) if not future.cancelled()]
+    failures = [(batch, error) for batch, error in errors if error is not None]
+    if not failures:
+        progress.log_summary()
+        return
+
+    for batch, error in failures:
+        logger.error(f"Failed to stage {', '.join(str(file.filename) for file in batch)}: {error}")
+    _remove_staged(files, working_dir=working_dir, keep=preexisting)
+    raise failures[0][1]
+
+
+def _is_staged(input_file: ResolvedInput, working_dir: Path, manifest: StagingManifest) -> bool:
+    """Returns whether the input file is already staged with its expected checksum."""
+    if not isinstance(input_file, ResolvedFile) or input_file.checksum is None:
+        return False
+    path = working_dir / input_file.filename
+    try:
+        return path.is_file() and manifest.verify(path, input_file.checksum)
+    except OSError:
+        return False
+
+
+def _batch_input_files(files: list[ResolvedInput]) -> list[list[ResolvedInput]]:
+    """Splits the input files into the units that are staged together.
+
+    The files copied over ssh from the same host are staged together, so they are transferred in a single rsync call,
+    while every other input file is staged on its own.
+    """
+    ssh_batches: dict[str, list[ResolvedInput]] = {}
+    batches: list[list[ResolvedInput]] = []
+    for input_file in files:
+        source = input_file.source if isinstance(input_file, ResolvedFile) and not input_file.link else None
+        if isinstance(source, FileSourceSsh):
+            host = source.ssh.host
+            if host not in ssh_batches:
+                ssh_batches[host] = []
+                batches.append(ssh_batches[host])
+            ssh_batches[host].append(input_file)
+        else:
+            batches.append([input_file])
+    return batches
+
+
+def _prepare_input_batch(batch: list[ResolvedInput], working_dir: Path, context: PrepareContext) -> None:
+    """Prepares a batch of input files, as returned by :func:`_batch_input_files`."""
+    if len(batch) > 1:
+        files = [input_file for input_file in batch if isinstance(input_file, ResolvedFile)]
+        prepare_resolved_files(files=files, working_dir=working_dir, context=context)
+    else:
+        _prepare_input_file(input_file=batch[0], working_dir=working_dir, context=context)
+
+
+def _prepare_input_file(input_file: ResolvedInput, working_dir: Path, context: PrepareContext) -> None:
+    """Prepares a single input file in the working directory."""
+    match input_file:
+        case ResolvedFile():
+            prepare_resolved_file(file=input_file, working_dir=working_dir, context=context)
+        case ResolvedStaticFile():
+            prepare_resolved_static_file(file=input_file, working_dir=working_dir)
+        case ResolvedDirectory():
+            prepare_resolved_directory(file=input_file, working_dir=working_dir, context=context)
+        case _:
+            assert_never(input_file)
+
+
+def _transfer_host(input_file: ResolvedInput) -> str | None:
+    """Returns the remote host an input file is transferred from, or ``None`` if it is created locally."""
+    source = getattr(input_file, "source", None)
+    if isinstance(source, FileSourceSsh):
+        return source.ssh.host
+    if isinstance(source, FileSourceHttp):
+        return urlsplit(source.http.url).netloc
+    return None
+
+
+def _staged_paths(input_file: ResolvedInput, working_dir: Path) -> list[Path]:
+    """Returns the paths created when staging an input file, starting with the input file itself."""
+    path = working_dir / input_file.filename
+    if isinstance(input_file, ResolvedDirectory):
+        return [path, path.parent / f"{path.name}.zip"]
+    return [path]
+
+
+def _path_exists(path: Path) -> bool:
+    return path.exists() or path.is_symlink()
+
+
+def _remove_staged(files: list[ResolvedInput], working_dir: Path, keep: set[Path]) -> None:
+    """Removes the paths of the staged input files, which are not in `keep`."""
+    for input_file in files:
+        for path in _staged_paths(input_file, working_dir):
+            if path in keep or not _path_exists(path) or path.resolve() == working_dir.resolve():
+                continue
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+            logger.info(f"Removed {path}")
+
+
+class _StagingProgress:
+    """Counts the staged input files, logging the overall progress as they complete."""
+
+    def __init__(self, n_total: int) -> None:
+        self._n_total = n_total
+        self._n_done = 0
+        self._n_bytes = 0
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def add(self, path: Path) -> None:
+        """Records the input staged to `path` as completed."""
+        size = path.stat().st_size if path.is_file() else 0
+        with self._lock:
+            self._n_done += 1
+            self._n_bytes += size
+            n_done = self._n_done
+        logger.info(f"Staged input {n_done}/{self._n_total}: {path.name}")
+
+    def log_summary(self) -> None:
+        """Logs the number of staged input files, their total size and the elapsed time."""
+        elapsed = time.monotonic() - self._start
+        logger.info(f"Staged {self._n_done} input(s), {self._n_bytes / 1e6:.1f} MB in {elapsed:.1f} s")
 
 
 def _clean_input_files(input_files: ResolvedInputs, working_dir: Path) -> None:
@@ -5,10 +5,12 @@ from typing import TYPE_CHECKING
 
 from bfabric.transfer import (
     Credentials,
+    FetchRequest,
     TransferSource,
     TransferSourceHttp,
     TransferSourceLocal,
     TransferSourceSsh,
+    fetch_many,
     fetch_to_path,
 )
 
@@ -33,7 +35,21 @@ def prepare_resolved_file(file: ResolvedFile, working_dir: Path, context: Prepar
     output_path = working_dir / file.filename
     source = _to_transfer_source(file.source)
     credentials = _to_credentials(context)
-    fetch_to_path(source, output_path, credentials, checksum=file.checksum, link_ok=file.link)
+    fetch_to_path(source, output_path, credentials, checksum=file.checksum, link_ok=file.link, cache=context.cache)
+
+
+def prepare_resolved_files(files: list[ResolvedFile], working_dir: Path, context: PrepareContext) -> None:
+    """Prepares several files like :func:`prepare_resolved_file`, with a single rsync call per ssh host."""
+    requests = [
+        FetchRequest(
+            source=_to_transfer_source(file.source),
+            dest=working_dir / file.filename,
+            checksum=file.checksum,
+            link_ok=file.link,
+        )
+        for file in files
+    ]
+    fetch_many(requests, _to_credentials(context), cache=context.cache)
 
 
 def _to_transfer_source(source: FileSourceSsh | FileSourceLocal | FileSourceHttp) -> TransferSource:
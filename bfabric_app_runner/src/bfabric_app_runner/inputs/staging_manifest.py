@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from bfabric.transfer import md5_checksum
+from loguru import logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MANIFEST_FILE = ".staging_manifest.json"
+"""Name of the staging manifest, written into the folder the inputs are staged to."""
+
+
+class StagingManifest:
+    """Records the verified checksums of the input files staged to a folder.
+
+    Every entry stores the size, modification time and inode the file had when its checksum was verified. As long
+    as these are unchanged, the file is known to still have the recorded checksum, so checking it again only costs a
+    ``stat`` instead of reading the whole file. A file whose metadata changed is hashed again.
+
+    The manifest is kept in memory and only written by :meth:`save`; the methods can be called from several threads.
+
+    :param path: the path of the manifest file
+    :param entries: the entries by file path, relative to the folder of the manifest
+    """
+
+    def __init__(self, path: Path, entries: dict[str, dict[str, Any]]) -> None:
+        self._path = path
+        self._entries = entries
+        self._modified = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, folder: Path) -> StagingManifest:
+        """Loads the manifest of the folder, which is empty if the folder has none or it cannot be read."""
+        path = folder / MANIFEST_FILE
+        try:
+            entries = json.loads(path.read_text())["files"]
+        except FileNotFoundError:
+            entries = {}
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring unreadable staging manifest {path}")
+            entries = {}
+        return cls(path=path, entries=entries)
+
+    def verify(self, path: Path, checksum: str) -> bool:
+        """Returns whether the file at ``path`` has the MD5 ``checksum``, hashing it only if its metadata changed.
+
+        If the file has to be hashed and matches, it is recorded, so the next check is fast again.
+        """
+        key = self._key(path)
+        stat = path.stat()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and _matches(entry, stat):
+            return entry["checksum"] == checksum
+        logger.debug(f"Computing the checksum of {path}")
+        actual_checksum = md5_checksum(path)
+        self._record(key, stat, actual_checksum)
+        return actual_checksum == checksum
+
+    def record(self, path: Path, checksum: str) -> None:
+        """Records the file at ``path``, which has just been verified to have the MD5 ``checksum``."""
+        self._record(self._key(path), path.stat(), checksum)
+
+    def save(self) -> None:
+        """Writes the manifest if it was modified, replacing the file atomically."""
+        with self._lock:
+            if not self._modified:
+                return
+            self._modified = False
+            data = json.dumps({"files": self._entries}, indent=1, sort_keys=True)
+        tmp = self._path.with_name(f"{self._path.name}.part")
+        _ = tmp.write_text(data)
+        _ = tmp.replace(self._path)
+
+    def try_save(self) -> None:
+        """Writes the manifest like :meth:`save` if its folder exists, only logging a warning if this fails.
+
+        The manifest merely speeds up later checks, so a folder that cannot be written to is not an error.
+        """
+        if not self._path.parent.is_dir():
+            return
+        try:
+            self.save()
+        except OSError as error:
+            logger.warning(f"Could not save the staging manifest {self._path}: {error}")
+
+    def _record(self, key: str, stat: os.stat_result, checksum: str) -> None:
+        entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino, "checksum": checksum}
+        with self._lock:
+            self._entries[key] = entry
+            self._modified = True
+
+    def _key(self, path: Path) -> str:
+        return os.path.relpath(path.absolute(), self._path.parent.absolute())
+
+
+def _matches(entry: dict[str, Any], stat: os.stat_result) -> bool:
+    return (
+        entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("inode") == stat.st_ino
+    )
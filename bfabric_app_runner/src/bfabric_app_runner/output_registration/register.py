@@ -1,17 +1,28 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, assert_never, cast
 
 import polars as pl
 import yaml
 from bfabric.entities import Dataset, Resource, Storage
+from bfabric.experimental import MultiQuery
 from bfabric.operations.dataset import (
     CreateDatasetParams,
     create_dataset,
     identify_changes,
     update_dataset,
 )
-from bfabric.transfer import Credentials, TransferSinkScp, md5_checksum, send_to_sink
+from bfabric.transfer import (
+    Credentials,
+    SendRequest,
+    TransferSink,
+    TransferSinkScp,
+    md5_checksum,
+    send_many,
+    send_to_sink,
+)
+from bfabric.utils.paginator import page_iter
 from bfabric.utils.table_lint import check_for_invalid_characters
 from loguru import logger
 
@@ -28,12 +39,20 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from bfabric import Bfabric
-    from bfabric.experimental.workunit_definition import WorkunitDefinition
+    from bfabric.experimental.workunit_definition import WorkunitDefinition, WorkunitRegistrationDefinition
+    from bfabric.typing import ApiRequestObjectType
+
+
+def _get_registration(workunit_definition: WorkunitDefinition) -> WorkunitRegistrationDefinition:
+    """Returns the registration details of the workunit, which outputs can only be registered with."""
+    if workunit_definition.registration is None:
+        raise ValueError("The workunit definition has no registration details, outputs cannot be registered")
+    return workunit_definition.registration
 
 
 def _get_output_folder(spec: CopyResourceSpec, workunit_definition: WorkunitDefinition) -> Path:
     if not spec.store_folder_path:
-        return workunit_definition.registration.storage_output_folder
+        return _get_registration(workunit_definition).storage_output_folder
     else:
         return spec.store_folder_path
 
@@ -55,15 +74,57 @@ def register_file_in_workunit(
     spec: CopyResourceSpec,
     client: Bfabric,
     workunit_definition: WorkunitDefinition,
+    checksum: str | None = None,
 ) -> None:
-    """Registers a file in the workunit."""
+    """Registers a file in the workunit.
+
+    :param checksum: the MD5 checksum of the file if it is already known, otherwise it is computed
+    """
     existing_id = _identify_existing_resource_id(client, spec, workunit_definition)
-    checksum = md5_checksum(spec.local_path)
+    if checksum is None:
+        checksum = md5_checksum(spec.local_path)
+    _ = client.save("resource", _resource_data(spec, workunit_definition, checksum=checksum, existing_id=existing_id))
+
+
+def register_files_batched(
+    specs: list[CopyResourceSpec],
+    client: Bfabric,
+    workunit_definition: WorkunitDefinition,
+    storage: Storage,
+    ssh_user: str | None,
+) -> None:
+    """Copies the files to storage and registers them in the workunit, with a few requests for all of them.
+
+    Instead of a lookup, a copy and a save per file, the existing resources are looked up with one multi-query by
+    name, the files are copied with :func:`~bfabric.transfer.send_many` (one rsync call per storage host) and the
+    resources are saved with one request per 100 of them.
+    """
+    existing_ids = _identify_existing_resource_ids(client, specs, workunit_definition)
+    requests = [
+        SendRequest(sink=_storage_sink(spec, workunit_definition, storage), src=spec.local_path) for spec in specs
+    ]
+    # As in `register_all`, the checksums are computed while the files are copied.
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="hash_output") as pool:
+        checksums = [pool.submit(md5_checksum, spec.local_path) for spec in specs]
+        send_many(requests, Credentials(ssh_user=ssh_user))
+    resources = [
+        _resource_data(spec, workunit_definition, checksum=checksum.result(), existing_id=existing_id)
+        for spec, checksum, existing_id in zip(specs, checksums, existing_ids)
+    ]
+    for page in page_iter(resources):
+        logger.info(f"Saving {len(page)} resource(s)")
+        _ = client.save("resource", page)
+
+
+def _resource_data(
+    spec: CopyResourceSpec, workunit_definition: WorkunitDefinition, *, checksum: str, existing_id: int | None
+) -> ApiRequestObjectType:
+    registration = _get_registration(workunit_definition)
     output_folder = _get_output_folder(spec, workunit_definition=workunit_definition)
-    resource_data = {
+    resource_data: dict[str, str | int] = {
         "name": spec.store_entry_path.name,
-        "workunitid": workunit_definition.registration.workunit_id,
-        "storageid": workunit_definition.registration.storage_id,
+        "workunitid": registration.workunit_id,
+        "storageid": registration.storage_id,
         "relativepath": str(output_folder / spec.store_entry_path),
         "filechecksum": checksum,
         "status": "available",
@@ -71,8 +132,7 @@ def register_file_in_workunit(
     }
     if existing_id is not None:
         resource_data["id"] = existing_id
-
-    _ = client.save("resource", resource_data)
+    return resource_data
 
 
 def _identify_existing_resource_id(
@@ -80,22 +140,51 @@ def _identify_existing_resource_id(
 ) -> int | None:
     """Returns the id of the existing resource if it exists."""
     if spec.update_existing in (UpdateExisting.IF_EXISTS, UpdateExisting.REQUIRED):
+        workunit_id = _get_registration(workunit_definition).workunit_id
         # TODO maybe it would be more accurate to use relativepath here, however historically it would often start
         #      with `/` which can be confusing.
         resource = client.reader.query_one(
             Resource,
             {
                 "name": spec.store_entry_path.name,
-                "workunitid": workunit_definition.registration.workunit_id,
+                "workunitid": workunit_id,
             },
         )
         if resource is not None:
             return resource.id
         elif spec.update_existing == UpdateExisting.REQUIRED:
-            raise ValueError(f"Resource {spec.store_entry_path.name} not found in workunit {workunit_definition.id}")
+            raise ValueError(f"Resource {spec.store_entry_path.name} not found in workunit {workunit_id}")
     return None
 
 
+def _identify_existing_resource_ids(
+    client: Bfabric, specs: list[CopyResourceSpec], workunit_definition: WorkunitDefinition
+) -> list[int | None]:
+    """Returns the id of the existing resource of every spec like `_identify_existing_resource_id`, with one
+    multi-query for all of them."""
+    workunit_id = _get_registration(workunit_definition).workunit_id
+    updatable = (UpdateExisting.IF_EXISTS, UpdateExisting.REQUIRED)
+    names = sorted({spec.store_entry_path.name for spec in specs if spec.update_existing in updatable})
+    ids_by_name: dict[str, int] = {}
+    if names:
+        results = MultiQuery(client).read_multi(
+            "resource",
+            {"workunitid": workunit_id},
+            multi_query_key="name",
+            multi_query_vals=names,
+        )
+        for result in results:
+            _ = ids_by_name.setdefault(cast("str", result["name"]), cast("int", result["id"]))
+
+    existing_ids: list[int | None] = []
+    for spec in specs:
+        existing_id = ids_by_name.get(spec.store_entry_path.name) if spec.update_existing in updatable else None
+        if existing_id is None and spec.update_existing == UpdateExisting.REQUIRED:
+            raise ValueError(f"Resource {spec.store_entry_path.name} not found in workunit {workunit_id}")
+        existing_ids.append(existing_id)
+    return existing_ids
+
+
 def copy_file_to_storage(
     spec: CopyResourceSpec,
     workunit_definition: WorkunitDefinition,
@@ -107,6 +196,15 @@ def copy_file_to_storage(
     Only the byte move is delegated to the transfer package; the resource metadata is still
     registered over SOAP by :func:`register_file_in_workunit`.
     """
+    _ = send_to_sink(
+        _storage_sink(spec, workunit_definition, storage),
+        spec.local_path,
+        Credentials(ssh_user=ssh_user),
+    )
+
+
+def _storage_sink(spec: CopyResourceSpec, workunit_definition: WorkunitDefinition, storage: Storage) -> TransferSink:
+    """Returns where the file of the spec is copied to on the storage, per the spec's ``protocol``."""
     if spec.protocol == "scp":
         # The Storage entity is loaded (see `_get_storage`) only for its host:basepath. If
         # `WorkunitRegistrationDefinition` carried these directly, the entity read (and the
@@ -115,11 +213,7 @@ def copy_file_to_storage(
             raise ValueError(f"Storage {storage.id} is not configured for scp transfer (no scp_prefix)")
         host, base_path = storage.scp_prefix.split(":", 1)
         output_folder = _get_output_folder(spec, workunit_definition=workunit_definition)
-        _ = send_to_sink(
-            TransferSinkScp(host=host, path=f"{base_path}{output_folder / spec.store_entry_path}"),
-            spec.local_path,
-            Credentials(ssh_user=ssh_user),
-        )
+        return TransferSinkScp(host=host, path=f"{base_path}{output_folder / spec.store_entry_path}")
     elif spec.protocol == "tus":
         # The output byte-move now flows through bfabric.transfer, so a tus sink slots in here — but
         # the end-to-end tus output path is not wired for v1: it needs a scoped JWT delivered to the
@@ -131,6 +225,8 @@ def copy_file_to_storage(
             "tus resource-registration model are open questions); use "
             "bfabric.operations.workunit.upload_files from a JWT session for tus uploads."
         )
+    else:
+        assert_never(spec.protocol)
 
 
 def _read_dataset_table(spec: SaveDatasetSpec) -> pl.DataFrame:
@@ -228,21 +324,43 @@ def register_all(
     specs_list: list[SpecType],
     ssh_user: str | None,
     force_storage: Path | None,
+    batched: bool = False,
 ) -> None:
-    """Registers all the output specs to the workunit."""
+    """Registers all the output specs to the workunit.
+
+    :param batched: if ``True``, the files are copied and registered together, before the other specs, with
+        :func:`register_files_batched` instead of several requests and a copy per file
+    """
     storage = _get_storage(client, force_storage, specs_list, workunit_definition)
     logger.info(f"Using storage: {storage}")
 
+    if batched:
+        resource_specs = [spec for spec in specs_list if isinstance(spec, CopyResourceSpec)]
+        if resource_specs:
+            if storage is None:
+                raise ValueError("No storage to copy the files to")
+            logger.info(f"Registering {len(resource_specs)} file(s) in batches")
+            register_files_batched(resource_specs, client, workunit_definition, storage=storage, ssh_user=ssh_user)
+        specs_list = [spec for spec in specs_list if not isinstance(spec, CopyResourceSpec)]
+
     for spec in specs_list:
         logger.debug(f"Registering {spec}")
         if isinstance(spec, CopyResourceSpec):
-            copy_file_to_storage(
-                spec,
-                workunit_definition=workunit_definition,
-                storage=storage,
-                ssh_user=ssh_user,
+            if storage is None:
+                raise ValueError("No storage to copy the files to")
+            # The checksum is computed while the file is copied, both reading it at the same time, so the file is
+            # mostly read from disk once instead of twice.
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="hash_output") as pool:
+                checksum = pool.submit(md5_checksum, spec.local_path)
+                copy_file_to_storage(
+                    spec,
+                    workunit_definition=workunit_definition,
+                    storage=storage,
+                    ssh_user=ssh_user,
+                )
+            register_file_in_workunit(
+                spec, client=client, workunit_definition=workunit_definition, checksum=checksum.result()
             )
-            register_file_in_workunit(spec, client=client, workunit_definition=workunit_definition)
         elif isinstance(spec, SaveDatasetSpec):
             _save_dataset(spec, client, workunit_definition=workunit_definition)
         elif isinstance(spec, SaveLinkSpec):
@@ -271,8 +389,9 @@ def register_outputs(
     client: Bfabric,
     ssh_user: str | None,
     force_storage: Path | None,
+    batched: bool = False,
 ) -> None:
-    """Registers outputs to the workunit."""
+    """Registers outputs to the workunit, see :func:`register_all`."""
     specs_list = OutputsSpec.read_yaml(outputs_yaml)
     register_all(
         client=client,
@@ -280,4 +399,5 @@ def register_outputs(
         specs_list=specs_list,
         ssh_user=ssh_user,
         force_storage=force_storage,
+        batched=batched,
     )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from bfabric.errors import BfabricInstanceNotConfiguredError
 from bfabric.experimental.webapp_integration_settings import TokenValidationSettingsProtocol
 from bfabric.rest.token_data import validate_token
+from bfabric.rest.token_validation_cache import TokenValidationCache
 from httpx import HTTPError
 from loguru import logger
 from pydantic import SecretStr, ValidationError
@@ -15,16 +16,24 @@ from bfabric_asgi_auth.token_validation.strategy import (
 )
 
 
-def create_bfabric_validator(settings: TokenValidationSettingsProtocol) -> TokenValidatorStrategy:
+def create_bfabric_validator(
+    settings: TokenValidationSettingsProtocol, cache: TokenValidationCache | None = None
+) -> TokenValidatorStrategy:
     """Create a validator that uses async Bfabric token validation.
 
-    :param validation_instance_url: URL of the B-Fabric instance for token validation
+    The validations are sent with one pooled HTTP client, and their results are cached until the tokens expire, so
+    that concurrent landings with the same token are validated only once.
+
+    :param settings: settings specifying the B-Fabric instance for token validation and the supported instances
+    :param cache: the cache of validated tokens, by default a new one is created for the validator
     """
+    if cache is None:
+        cache = TokenValidationCache()
 
     async def bfabric_validation(token: SecretStr) -> TokenValidationResult:
         try:
             # Use async token validation
-            token_data = await validate_token(token=token.get_secret_value(), settings=settings)
+            token_data = await validate_token(token=token.get_secret_value(), settings=settings, cache=cache)
         except (HTTPError, ValidationError, BfabricInstanceNotConfiguredError) as e:
             logger.exception("Token validation failed.")
             return TokenValidationError(error=f"Bfabric token validation failed: {str(e)}")
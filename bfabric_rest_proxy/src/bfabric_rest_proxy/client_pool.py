@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+
+from bfabric.config.config_data import ConfigData
+
+from bfabric import Bfabric, BfabricAuth, BfabricClientConfig
+
+
+class BfabricClientPool:
+    """Long-lived B-Fabric clients of the proxy, one per B-Fabric instance, shared by all requests.
+
+    A new client fetches and parses the WSDL of every endpoint it uses and opens new connections. Instead, the
+    clients of the requests are derived from the client of their instance with :meth:`bfabric.Bfabric.for_auth`,
+    so that only the credentials vary per request.
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[str, Bfabric] = {}
+        self._lock = threading.Lock()
+
+    def get(self, bfabric_instance: str, auth: BfabricAuth) -> Bfabric:
+        """Returns a client of `bfabric_instance` authenticating with `auth`."""
+        with self._lock:
+            client = self._clients.get(bfabric_instance)
+            if client is None:
+                client_config = BfabricClientConfig.model_validate({"base_url": bfabric_instance})
+                client = Bfabric(ConfigData(client=client_config, auth=None))
+                self._clients[bfabric_instance] = client
+        return client.for_auth(auth)
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeVar
+
+from fastapi import HTTPException
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+class RequestLimiter:
+    """Runs the blocking B-Fabric calls of the proxy on dedicated threads, with a bounded number per instance.
+
+    Every B-Fabric instance gets its own pool of `max_concurrent` threads, so the calls of a slow instance neither
+    use up the threads of FastAPI, which then keeps serving e.g. `/health`, nor those of the other instances. Excess
+    calls wait for a free thread, which applies backpressure to the clients:
+
+    - a call arriving while `max_pending` calls of its instance are running or waiting is rejected with 429,
+    - a call which waited `queue_timeout` seconds without getting a thread is rejected with 503.
+
+    A call which already started is always awaited, as its thread cannot be interrupted.
+    """
+
+    def __init__(self, max_concurrent: int, max_pending: int, queue_timeout: float) -> None:
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        if max_pending < max_concurrent:
+            raise ValueError(f"max_pending must be at least max_concurrent ({max_concurrent}), got {max_pending}")
+        self._max_concurrent = max_concurrent
+        self._max_pending = max_pending
+        self._queue_timeout = queue_timeout
+        self._executors: dict[str, ThreadPoolExecutor] = {}
+        self._pending: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def pending_requests(self) -> dict[str, int]:
+        """Returns the number of calls which are running or waiting, by instance."""
+        with self._lock:
+            return dict(self._pending)
+
+    async def run(self, bfabric_instance: str, func: Callable[[], T]) -> T:
+        """Calls `func` on a thread of `bfabric_instance` and returns its result.
+
+        :raises HTTPException: with status 429 if too many calls of the instance are pending, or 503 if no thread
+            became free within the queue timeout
+        """
+        with self._lock:
+            n_pending = self._pending.get(bfabric_instance, 0)
+            if n_pending >= self._max_pending:
+                logger.warning(f"Rejecting request to {bfabric_instance}: {n_pending} requests are pending")
+                raise HTTPException(
+                    status_code=429, detail="Too many pending requests, retry later", headers={"Retry-After": "1"}
+                )
+            self._pending[bfabric_instance] = n_pending + 1
+            executor = self._executors.get(bfabric_instance)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=self._max_concurrent, thread_name_prefix="bfabric-proxy")
+                self._executors[bfabric_instance] = executor
+
+        future = executor.submit(func)
+        future.add_done_callback(lambda _: self._release(bfabric_instance))
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(result), timeout=self._queue_timeout)
+        except TimeoutError:
+            if future.cancel():
+                logger.warning(f"Rejecting request to {bfabric_instance}: no free thread within {self._queue_timeout}s")
+                raise HTTPException(
+                    status_code=503, detail="B-Fabric is busy, retry later", headers={"Retry-After": "5"}
+                ) from None
+            # the call is running already
+            return await result
+
+    def _release(self, bfabric_instance: str) -> None:
+        with self._lock:
+            self._pending[bfabric_instance] -= 1
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from bfabric import BfabricAuth
+
+
+class ResponseCacheKey(NamedTuple):
+    """Identifies a read of one user, so that a cached response is never served to another user."""
+
+    bfabric_instance: str
+    user: str
+    endpoint: str
+    request: str
+
+    @classmethod
+    def for_read(cls, bfabric_instance: str, auth: BfabricAuth, endpoint: str, **params: Any) -> ResponseCacheKey:
+        """Returns the key of a read of `endpoint` by `auth`, with the remaining read parameters as `params`.
+
+        The user is identified by the login and a hash of the password, as the password is only checked by B-Fabric.
+        """
+        password_hash = hashlib.sha256(auth.password.get_secret_value().encode()).hexdigest()
+        return cls(
+            bfabric_instance=bfabric_instance,
+            user=f"{auth.login}:{password_hash}",
+            endpoint=endpoint,
+            request=json.dumps(params, sort_keys=True, default=str),
+        )
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    value: Any
+
+
+class ResponseCache:
+    """In-memory LRU cache of the responses of reads, which expire after `ttl` seconds.
+
+    With `single_flight`, concurrent identical reads are coalesced, i.e. only the first one is sent to B-Fabric and
+    the others wait for its response; this also works with a `ttl` of 0, which disables storing responses. Responses
+    are only cached for successful reads, and entries of an endpoint are dropped by :meth:`invalidate` when it was
+    written to.
+
+    The cache is used from the event loop only, so it needs no locking.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, single_flight: bool) -> None:
+        if ttl < 0:
+            raise ValueError(f"ttl must be at least 0, got {ttl}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._single_flight = single_flight
+        self._entries: OrderedDict[ResponseCacheKey, _Entry] = OrderedDict()
+        self._in_flight: dict[ResponseCacheKey, asyncio.Future[Any]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached or coalesced at all."""
+        return self._ttl > 0 or self._single_flight
+
+    def stats(self) -> dict[str, int]:
+        """Returns the number of hits, misses, coalesced requests, and current entries."""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "entries": len(self._entries),
+        }
+
+    async def get_or_compute(self, key: ResponseCacheKey, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Returns the cached response of `key` if there is one, or the result of awaiting `compute` otherwise."""
+        if not self.enabled:
+            return await compute()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.value
+            del self._entries[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # the request reading the response was cancelled, e.g. because its client disconnected
+                return await self.get_or_compute(key, compute)
+
+        self._misses += 1
+        generation = self._generation
+        future: asyncio.Future[Any] | None = None
+        if self._single_flight:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            if future is not None:
+                _ = future.cancel()
+            raise
+        except Exception as error:
+            if future is not None:
+                future.set_exception(error)
+                # mark the exception as retrieved, in case no other request awaits it
+                _ = future.exception()
+            raise
+        finally:
+            if future is not None:
+                del self._in_flight[key]
+
+        if future is not None:
+            future.set_result(value)
+        # a response read while the endpoint was written to might already be outdated
+        if self._ttl > 0 and generation == self._generation:
+            self._store(key, value)
+        return value
+
+    def invalidate(self, bfabric_instance: str, endpoints: list[str]) -> None:
+        """Drops the cached responses of reads of `endpoints` on `bfabric_instance`, e.g. after writing to them."""
+        self._generation += 1
+        stale = [key for key in self._entries if key.bfabric_instance == bfabric_instance and key.endpoint in endpoints]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses of {endpoints} on {bfabric_instance}")
+
+    def _store(self, key: ResponseCacheKey, value: Any) -> None:
+        self._entries[key] = _Entry(expires_at=time.monotonic() + self._ttl, value=value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            _ = self._entries.popitem(last=False)
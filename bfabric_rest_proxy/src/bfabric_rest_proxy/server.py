@@ -1,24 +1,43 @@
 from __future__ import annotations
 
+import contextlib
 import datetime
-from typing import Annotated, Any
+import functools
+import json
+from collections.abc import AsyncIterator
+from typing import Annotated, Any, Literal
 
 import fastapi
-from bfabric.config.config_data import ConfigData
 from bfabric.rest.token_data import validate_token
+from bfabric.rest.token_validation_cache import TokenValidationCache
 from fastapi import Request
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.params import Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
 from pydantic import BaseModel, Field, SecretStr, model_validator
 
-from bfabric import Bfabric, BfabricAuth, BfabricClientConfig
+from bfabric import Bfabric, BfabricAuth
+from bfabric_rest_proxy.client_pool import BfabricClientPool
 from bfabric_rest_proxy.feeder_operations.create_workunit import CreateWorkunitRequest, create_workunit
-from bfabric_rest_proxy.settings import ServerSettings
 from bfabric_rest_proxy.feeder_operations.is_employee import is_employee
+from bfabric_rest_proxy.request_limiter import RequestLimiter
+from bfabric_rest_proxy.response_cache import ResponseCache, ResponseCacheKey
+from bfabric_rest_proxy.settings import ServerSettings
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI) -> AsyncIterator[None]:
+    """Closes the pooled HTTP client of the token validation cache when the server shuts down."""
+    yield
+    await get_token_validation_cache().aclose()
+
 
-app = fastapi.FastAPI()
+app = fastapi.FastAPI(lifespan=lifespan)
+
+WORKUNIT_WRITTEN_ENDPOINTS = ["workunit", "resource", "parameter", "link", "dataset"]
+"""The endpoints written to by `/create/workunit/v1`, whose cached responses it invalidates."""
 
 
 class BfabricAuthParam(BaseModel):
@@ -26,10 +45,46 @@ class BfabricAuthParam(BaseModel):
     webservicepassword: SecretStr
 
 
+@functools.cache
 def get_server_settings() -> ServerSettings:
+    """Returns the settings, which are read from the environment once."""
     return ServerSettings()  # pyright: ignore[reportCallIssue]
 
 
+@functools.cache
+def get_bfabric_client_pool() -> BfabricClientPool:
+    """Returns the pool of B-Fabric clients shared by all requests."""
+    return BfabricClientPool()
+
+
+@functools.cache
+def get_request_limiter() -> RequestLimiter:
+    """Returns the limiter running the B-Fabric calls of all requests."""
+    settings = get_server_settings()
+    return RequestLimiter(
+        max_concurrent=settings.max_concurrent_requests,
+        max_pending=settings.max_pending_requests,
+        queue_timeout=settings.request_queue_timeout,
+    )
+
+
+@functools.cache
+def get_response_cache() -> ResponseCache:
+    """Returns the cache of the responses of `/read`, which is disabled unless configured."""
+    settings = get_server_settings()
+    return ResponseCache(
+        ttl=settings.response_cache_ttl,
+        max_entries=settings.response_cache_max_entries,
+        single_flight=settings.response_cache_single_flight,
+    )
+
+
+@functools.cache
+def get_token_validation_cache() -> TokenValidationCache:
+    """Returns the cache of validated tokens, shared by all requests."""
+    return TokenValidationCache()
+
+
 def get_bfabric_auth(auth: BfabricAuthParam) -> BfabricAuth:
     return BfabricAuth(login=auth.login, password=auth.webservicepassword)
 
@@ -49,23 +104,23 @@ def get_bfabric_instance(settings: ServerSettingsDep, bfabric_instance: str | No
     return bfabric_instance
 
 
-def get_bfabric_user_client(bfabric_auth: BfabricAuthDep, bfabric_instance: BfabricInstanceDep) -> Bfabric:
-    client_config = BfabricClientConfig.model_validate({"base_url": bfabric_instance})
-    config_data = ConfigData(client=client_config, auth=bfabric_auth)
-    return Bfabric(config_data)
-
+def get_bfabric_user_client(
+    bfabric_auth: BfabricAuthDep, bfabric_instance: BfabricInstanceDep, client_pool: BfabricClientPoolDep
+) -> Bfabric:
+    return client_pool.get(bfabric_instance, bfabric_auth)
 
-def get_bfabric_feeder_client(settings: ServerSettingsDep, bfabric_instance: BfabricInstanceDep) -> Bfabric:
-    client_config = BfabricClientConfig.model_validate({"base_url": bfabric_instance})
-    config_data = ConfigData(
-        client=client_config,
-        auth=settings.feeder_user_credentials[bfabric_instance],
-    )
 
-    return Bfabric(config_data)
+def get_bfabric_feeder_client(
+    settings: ServerSettingsDep, bfabric_instance: BfabricInstanceDep, client_pool: BfabricClientPoolDep
+) -> Bfabric:
+    return client_pool.get(bfabric_instance, settings.feeder_user_credentials[bfabric_instance])
 
 
 ServerSettingsDep = Annotated[ServerSettings, Depends(get_server_settings)]
+BfabricClientPoolDep = Annotated[BfabricClientPool, Depends(get_bfabric_client_pool)]
+RequestLimiterDep = Annotated[RequestLimiter, Depends(get_request_limiter)]
+ResponseCacheDep = Annotated[ResponseCache, Depends(get_response_cache)]
+TokenValidationCacheDep = Annotated[TokenValidationCache, Depends(get_token_validation_cache)]
 BfabricAuthDep = Annotated[BfabricAuth, Depends(get_bfabric_auth)]
 BfabricInstanceDep = Annotated[str, Depends(get_bfabric_instance)]
 BfabricUserClientDep = Annotated[Bfabric, Depends(get_bfabric_user_client)]
@@ -83,6 +138,8 @@ class ReadParams(BaseModel):
     """The number of items to skip, after which to start reading."""
     page_max_results: int = 100
     """The maximum number of results to return."""
+    response_format: Literal["json", "ndjson"] = "json"
+    """The format of the response: a JSON array, or newline-delimited JSON which is streamed page by page."""
 
     @model_validator(mode="before")
     @classmethod
@@ -92,45 +149,138 @@ class ReadParams(BaseModel):
         return data  # pyright: ignore[reportUnknownVariableType]
 
 
+# The handlers below are `async`, running their blocking B-Fabric calls through the `RequestLimiter` instead of
+# FastAPI's threadpool, which a slow B-Fabric instance would fill up.
+
+
 @app.post("/read")
-def read(user_client: BfabricUserClientDep, params: ReadParams):
+async def read(
+    user_client: BfabricUserClientDep,
+    params: ReadParams,
+    bfabric_instance: BfabricInstanceDep,
+    limiter: RequestLimiterDep,
+    response_cache: ResponseCacheDep,
+):
     logger.info(f"Reading from endpoint {params.endpoint} for user {user_client.auth.login}")
-    res = user_client.read(
+    if params.response_format == "ndjson":
+        return await _read_ndjson(
+            user_client=user_client, params=params, bfabric_instance=bfabric_instance, limiter=limiter
+        )
+
+    def read_list_dict() -> list[dict[str, Any]]:
+        res = user_client.read(
+            endpoint=params.endpoint,
+            obj=params.query,
+            offset=params.page_offset,
+            max_results=params.page_max_results,
+        )
+        return res.to_list_dict()
+
+    cache_key = ResponseCacheKey.for_read(
+        bfabric_instance=bfabric_instance,
+        auth=user_client.auth,
+        endpoint=params.endpoint,
+        query=params.query,
+        offset=params.page_offset,
+        max_results=params.page_max_results,
+    )
+    return await response_cache.get_or_compute(cache_key, lambda: limiter.run(bfabric_instance, read_list_dict))
+
+
+async def _read_ndjson(
+    user_client: Bfabric, params: ReadParams, bfabric_instance: str, limiter: RequestLimiter
+) -> StreamingResponse:
+    """Streams the results of a read as newline-delimited JSON, sending every page as soon as it was read.
+
+    The first page is read before the response starts, so that failures of the query are still reported with an
+    error status. Every later page is read with its own call of the limiter, so a stream does not keep a thread of
+    the instance while its client is reading, but the call can fail, e.g. with 429 or 503 when the instance is busy.
+    As the status was already sent by then, such a failure ends the stream with a last record
+    `{"_error": {"status_code": ..., "detail": ...}}`, which clients have to check for to detect incomplete results.
+    """
+    pages = user_client.iter_read(
         endpoint=params.endpoint,
         obj=params.query,
         offset=params.page_offset,
         max_results=params.page_max_results,
     )
-    return res.to_list_dict()
+
+    def read_next_page() -> bytes | None:
+        page = next(pages, None)
+        if page is None:
+            return None
+        return b"".join(json.dumps(jsonable_encoder(item)).encode() + b"\n" for item in page.to_list_dict())
+
+    first_page = await limiter.run(bfabric_instance, read_next_page)
+
+    async def generate() -> AsyncIterator[bytes]:
+        page = first_page
+        while page is not None:
+            yield page
+            try:
+                page = await limiter.run(bfabric_instance, read_next_page)
+            except Exception as error:  # noqa: BLE001 -- reported inline, as the status was sent
+                logger.exception(f"Failed reading a page of endpoint {params.endpoint}, ending the stream")
+                yield _ndjson_error_record(error)
+                return
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+def _ndjson_error_record(error: Exception) -> bytes:
+    """Returns the record ending an NDJSON stream which failed after its status was sent."""
+    if isinstance(error, fastapi.HTTPException):
+        content = {"status_code": error.status_code, "detail": error.detail}
+    else:
+        content = {"status_code": 500, "detail": f"unknown exception occurred: {error}"}
+    return json.dumps({"_error": content}).encode() + b"\n"
 
 
 @app.post("/create/workunit/v1")
-def post_create_workunit(
+async def post_create_workunit(
     user_client: BfabricUserClientDep,
     feeder_client: BfabricFeederClientDep,
     params: CreateWorkunitRequest,
+    bfabric_instance: BfabricInstanceDep,
+    limiter: RequestLimiterDep,
+    response_cache: ResponseCacheDep,
 ):
-    workunit = create_workunit(user_client=user_client, feeder_client=feeder_client, request=params)
+    try:
+        workunit = await limiter.run(
+            bfabric_instance,
+            functools.partial(create_workunit, user_client=user_client, feeder_client=feeder_client, request=params),
+        )
+    finally:
+        # also after a failure, which can leave a partially created workunit behind
+        response_cache.invalidate(bfabric_instance, endpoints=WORKUNIT_WRITTEN_ENDPOINTS)
     return [{**workunit.data_dict, "uri": workunit.uri}]
 
 
 @app.post("/user/is_employee")
-def post_user_is_employee(
+async def post_user_is_employee(
     user_client: BfabricUserClientDep,
     feeder_client: BfabricFeederClientDep,
+    bfabric_instance: BfabricInstanceDep,
+    limiter: RequestLimiterDep,
 ):
     """Return whether the authenticated user is an employee on the current B-Fabric instance."""
     logger.info(f"Checking employee status for user {user_client.auth.login}")
-    return {"is_employee": is_employee(user_client=user_client, feeder_client=feeder_client)}
+    result = await limiter.run(
+        bfabric_instance, functools.partial(is_employee, user_client=user_client, feeder_client=feeder_client)
+    )
+    return {"is_employee": result}
 
 
 @app.get("/health")
-async def health(settings: ServerSettingsDep):
-    """Check server health. It also lists the known bfabric instances."""
+async def health(settings: ServerSettingsDep, limiter: RequestLimiterDep, response_cache: ResponseCacheDep):
+    """Check server health. It also lists the known bfabric instances, the number of pending requests of each, and
+    the statistics of the response cache."""
     return {
         "status": "ok",
         "date": datetime.datetime.now().isoformat(),
         "supported_bfabric_instances": settings.supported_bfabric_instances,
+        "pending_requests": limiter.pending_requests(),
+        "response_cache": response_cache.stats(),
     }
 
 
@@ -139,13 +289,15 @@ class TokenParam(BaseModel):
 
 
 @app.post("/validate_token")
-async def post_validate_token(token_param: TokenParam, settings: ServerSettingsDep):
+async def post_validate_token(
+    token_param: TokenParam, settings: ServerSettingsDep, token_validation_cache: TokenValidationCacheDep
+):
     """Validates a token and returns the token data.
 
     This endpoint is not really necessary since it proxies a REST endpoint, but is added here for consistency to avoid
     shiny apps having to interface with two different APIs.
     """
-    token_data = await validate_token(token=token_param.token, settings=settings)
+    token_data = await validate_token(token=token_param.token, settings=settings, cache=token_validation_cache)
     dump = token_data.model_dump(by_alias=True, mode="json")
     dump["userWsPassword"] = token_data.user_ws_password.get_secret_value()
     return dump
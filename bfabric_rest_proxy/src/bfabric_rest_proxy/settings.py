@@ -14,6 +14,20 @@ class ServerSettings(BaseSettings, WebappIntegrationSettings):  # pyright: ignor
     # specific to the proxy:
     default_bfabric_instance: str | None = None
 
+    max_concurrent_requests: int = 8
+    """Maximum number of B-Fabric calls running at the same time, per instance."""
+    max_pending_requests: int = 64
+    """Maximum number of B-Fabric calls running or waiting, per instance; further requests are rejected with 429."""
+    request_queue_timeout: float = 30.0
+    """Seconds a request waits for one of the `max_concurrent_requests` slots before it is rejected with 503."""
+
+    response_cache_ttl: float = 0.0
+    """Seconds for which the responses of `/read` are cached per user; 0 disables the cache."""
+    response_cache_max_entries: int = 1024
+    """Maximum number of cached responses, the least recently used ones are dropped first."""
+    response_cache_single_flight: bool = False
+    """Whether concurrent identical `/read` requests of a user are coalesced into one B-Fabric read."""
+
     @model_validator(mode="after")
     def _valid_default_instance(self) -> ServerSettings:
         if self.default_bfabric_instance not in self.supported_bfabric_instances:
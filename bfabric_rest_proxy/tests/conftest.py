@@ -12,14 +12,20 @@ from pydantic import SecretStr
 
 from bfabric import Bfabric, BfabricAuth
 from bfabric.config.config_data import ConfigData
+from bfabric.rest.token_validation_cache import TokenValidationCache
 from bfabric.results.result_container import ResultContainer
 from bfabric_rest_proxy.server import (
     app,
     get_bfabric_feeder_client,
     get_bfabric_instance,
     get_bfabric_user_client,
+    get_request_limiter,
+    get_response_cache,
     get_server_settings,
+    get_token_validation_cache,
 )
+from bfabric_rest_proxy.request_limiter import RequestLimiter
+from bfabric_rest_proxy.response_cache import ResponseCache
 from bfabric_rest_proxy.settings import ServerSettings
 
 
@@ -76,7 +82,13 @@ def mock_bfabric_feeder_client(mocker):
 
 
 @pytest.fixture
-def client(mock_settings, mock_bfabric_user_client, mock_bfabric_feeder_client):
+def response_cache():
+    """Response cache of the proxy, caching responses for a minute."""
+    return ResponseCache(ttl=60.0, max_entries=16, single_flight=True)
+
+
+@pytest.fixture
+def client(mock_settings, mock_bfabric_user_client, mock_bfabric_feeder_client, response_cache):
     """FastAPI test client with mocked dependencies.
 
     This overrides all FastAPI dependencies to ensure no real B-Fabric API calls
@@ -87,6 +99,11 @@ def client(mock_settings, mock_bfabric_user_client, mock_bfabric_feeder_client):
     app.dependency_overrides[get_bfabric_instance] = lambda: "https://test.bfabric.example.com/"
     app.dependency_overrides[get_bfabric_user_client] = lambda: mock_bfabric_user_client
     app.dependency_overrides[get_bfabric_feeder_client] = lambda: mock_bfabric_feeder_client
+    limiter = RequestLimiter(max_concurrent=2, max_pending=4, queue_timeout=5.0)
+    app.dependency_overrides[get_request_limiter] = lambda: limiter
+    app.dependency_overrides[get_response_cache] = lambda: response_cache
+    token_validation_cache = TokenValidationCache()
+    app.dependency_overrides[get_token_validation_cache] = lambda: token_validation_cache
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,53 @@
+"""Tests for the pool of B-Fabric clients shared by the requests of the proxy."""
+
+import pytest
+from pydantic import SecretStr
+
+from bfabric import BfabricAuth
+from bfabric_rest_proxy.client_pool import BfabricClientPool
+from bfabric_rest_proxy.server import get_bfabric_feeder_client, get_bfabric_user_client
+
+INSTANCE = "https://test.bfabric.example.com/"
+
+
+@pytest.fixture
+def user_auth():
+    return BfabricAuth(login="test_user", password=SecretStr("y" * 32))
+
+
+@pytest.fixture
+def other_auth():
+    return BfabricAuth(login="other_user", password=SecretStr("z" * 32))
+
+
+class TestBfabricClientPool:
+    def test_clients_of_an_instance_share_the_engine(self, user_auth, other_auth):
+        pool = BfabricClientPool()
+
+        user_client = pool.get(INSTANCE, user_auth)
+        other_client = pool.get(INSTANCE, other_auth)
+
+        assert user_client.auth == user_auth
+        assert other_client.auth == other_auth
+        assert user_client.config.base_url == INSTANCE
+        assert user_client._engine is other_client._engine
+
+    def test_instances_have_separate_engines(self, user_auth):
+        pool = BfabricClientPool()
+
+        client = pool.get(INSTANCE, user_auth)
+        other_instance_client = pool.get("https://other.bfabric.example.com/", user_auth)
+
+        assert other_instance_client.config.base_url == "https://other.bfabric.example.com/"
+        assert client._engine is not other_instance_client._engine
+
+
+def test_user_and_feeder_clients_share_the_engine(mock_settings, user_auth):
+    pool = BfabricClientPool()
+
+    user_client = get_bfabric_user_client(user_auth, INSTANCE, pool)
+    feeder_client = get_bfabric_feeder_client(mock_settings, INSTANCE, pool)
+
+    assert user_client.auth == user_auth
+    assert feeder_client.auth.login == "feeder_user"
+    assert user_client._engine is feeder_client._engine
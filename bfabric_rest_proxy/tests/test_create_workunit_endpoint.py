@@ -182,3 +182,31 @@ class TestCreateWorkunitEndpoint:
         assert mock_create.called
         assert mock_create.call_args[1]["user_client"] == mock_bfabric_user_client
         assert mock_create.call_args[1]["feeder_client"] == mock_bfabric_feeder_client
+
+    def test_create_workunit_invalidates_response_cache(self, client, mocker, response_cache):
+        """Test that creating a workunit drops the cached responses of the endpoints it writes to."""
+        mock_invalidate = mocker.patch.object(response_cache, "invalidate")
+        mock_workunit = mocker.MagicMock()
+        mock_workunit.data_dict = {"id": 1, "name": "Test Workunit", "_entityclass": "workunit"}
+        mock_workunit.uri = "https://test.bfabric.example.com/workunit/1"
+        mocker.patch("bfabric_rest_proxy.server.create_workunit", return_value=mock_workunit)
+
+        response = client.post(
+            "/create/workunit/v1",
+            json={
+                "auth": {"login": "test_user", "webservicepassword": "y" * 32},
+                "params": {
+                    "container_id": 100,
+                    "application_id": 5,
+                    "workunit_name": "Test Workunit",
+                    "parameters": {"param1": "value1"},
+                    "resources": {},
+                    "links": {},
+                },
+            },
+        )
+
+        assert response.status_code == 200, f"Response: {response.text}"
+        mock_invalidate.assert_called_once_with(
+            "https://test.bfabric.example.com/", endpoints=["workunit", "resource", "parameter", "link", "dataset"]
+        )
@@ -47,3 +47,15 @@ class TestHealthEndpoint:
         # POST should not be allowed
         response = client.post("/health")
         assert response.status_code == 405  # Method Not Allowed
+
+    def test_health_lists_pending_requests(self, client):
+        """Test that health endpoint reports the pending requests of each instance."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["pending_requests"] == {}
+
+    def test_health_reports_response_cache(self, client):
+        """Test that health endpoint reports the statistics of the response cache."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["response_cache"] == {"hits": 0, "misses": 0, "coalesced": 0, "entries": 0}
@@ -4,8 +4,11 @@ This module tests the /read endpoint with mocked Bfabric client to ensure
 no real API calls are made during testing.
 """
 
+import json
+
 import pytest
 from bfabric.results.result_container import ResultContainer
+from fastapi import HTTPException
 
 
 class TestReadEndpoint:
@@ -164,3 +167,94 @@ class TestReadEndpoint:
 
         # Verify feeder client was NOT called
         assert not mock_bfabric_feeder_client.read.called
+
+    def test_read_ndjson_streams_pages(self, client, mock_bfabric_user_client):
+        """Test that the ndjson format returns one line per result, read page by page."""
+        mock_bfabric_user_client.iter_read.return_value = iter(
+            [
+                ResultContainer([{"id": 1}, {"id": 2}], total_pages_api=2, errors=[]),
+                ResultContainer([{"id": 3, "created": "2024-01-01"}], total_pages_api=2, errors=[]),
+            ]
+        )
+
+        response = client.post(
+            "/read",
+            json={
+                "auth": {"login": "test_user", "webservicepassword": "y" * 32},
+                "params": {
+                    "endpoint": "sample",
+                    "query": {"status": "active"},
+                    "page_offset": 10,
+                    "page_max_results": 150,
+                    "response_format": "ndjson",
+                },
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1}, {"id": 2}, {"id": 3, "created": "2024-01-01"}]
+        mock_bfabric_user_client.iter_read.assert_called_once_with(
+            endpoint="sample", obj={"status": "active"}, offset=10, max_results=150
+        )
+        mock_bfabric_user_client.read.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (
+                RuntimeError("connection lost"),
+                {"status_code": 500, "detail": "unknown exception occurred: connection lost"},
+            ),
+            (HTTPException(status_code=503, detail="busy"), {"status_code": 503, "detail": "busy"}),
+        ],
+    )
+    def test_read_ndjson_when_later_page_fails(self, client, mock_bfabric_user_client, error, expected):
+        """Test that a failure after the first page ends the stream with an error record."""
+
+        def pages():
+            yield ResultContainer([{"id": 1}], total_pages_api=2, errors=[])
+            raise error
+
+        mock_bfabric_user_client.iter_read.return_value = pages()
+
+        response = client.post(
+            "/read",
+            json={
+                "auth": {"login": "test_user", "webservicepassword": "y" * 32},
+                "params": {"endpoint": "sample", "query": {}, "response_format": "ndjson"},
+            },
+        )
+
+        assert response.status_code == 200
+        assert [json.loads(line) for line in response.text.splitlines()] == [{"id": 1}, {"_error": expected}]
+
+    def test_read_ndjson_when_no_results(self, client, mock_bfabric_user_client):
+        """Test that the ndjson format returns an empty body for no results."""
+        mock_bfabric_user_client.iter_read.return_value = iter([ResultContainer([], total_pages_api=0, errors=[])])
+
+        response = client.post(
+            "/read",
+            json={
+                "auth": {"login": "test_user", "webservicepassword": "y" * 32},
+                "params": {"endpoint": "screen", "query": {}, "response_format": "ndjson"},
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.text == ""
+
+    def test_read_uses_response_cache(self, client, mock_bfabric_user_client, response_cache):
+        """Test that identical reads of a user are served from the response cache."""
+        mock_bfabric_user_client.read.return_value = ResultContainer([{"id": 1}], total_pages_api=1, errors=[])
+        request = {
+            "auth": {"login": "test_user", "webservicepassword": "y" * 32},
+            "params": {"endpoint": "sample", "query": {"id": 1}},
+        }
+
+        responses = [client.post("/read", json=request) for _ in range(2)]
+
+        assert [response.json() for response in responses] == [[{"id": 1}], [{"id": 1}]]
+        mock_bfabric_user_client.read.assert_called_once()
+        assert response_cache.stats()["hits"] == 1
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from bfabric_rest_proxy.request_limiter import RequestLimiter
+
+
+def _blocking(started: threading.Event, release: threading.Event, value: int = 0):
+    def func() -> int:
+        started.set()
+        assert release.wait(timeout=5)
+        return value
+
+    return func
+
+
+@pytest.mark.asyncio
+async def test_run():
+    limiter = RequestLimiter(max_concurrent=1, max_pending=1, queue_timeout=1.0)
+    assert await limiter.run("https://a.example", lambda: 42) == 42
+    assert limiter.pending_requests() == {"https://a.example": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_when_too_many_pending():
+    limiter = RequestLimiter(max_concurrent=1, max_pending=1, queue_timeout=1.0)
+    started, release = threading.Event(), threading.Event()
+    running = asyncio.create_task(limiter.run("https://a.example", _blocking(started, release, value=1)))
+    await asyncio.to_thread(started.wait, 5)
+
+    with pytest.raises(HTTPException) as error:
+        await limiter.run("https://a.example", lambda: 2)
+    assert error.value.status_code == 429
+    assert error.value.headers == {"Retry-After": "1"}
+
+    # other instances are not affected
+    assert await limiter.run("https://b.example", lambda: 3) == 3
+
+    release.set()
+    assert await running == 1
+    assert limiter.pending_requests() == {"https://a.example": 0, "https://b.example": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_when_queue_timeout():
+    limiter = RequestLimiter(max_concurrent=1, max_pending=2, queue_timeout=0.1)
+    started, release = threading.Event(), threading.Event()
+    running = asyncio.create_task(limiter.run("https://a.example", _blocking(started, release, value=1)))
+    await asyncio.to_thread(started.wait, 5)
+
+    with pytest.raises(HTTPException) as error:
+        await limiter.run("https://a.example", lambda: 2)
+    assert error.value.status_code == 503
+
+    release.set()
+    assert await running == 1
+    assert limiter.pending_requests() == {"https://a.example": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_when_running_past_queue_timeout():
+    limiter = RequestLimiter(max_concurrent=1, max_pending=1, queue_timeout=0.05)
+    started, release = threading.Event(), threading.Event()
+    threading.Timer(0.2, release.set).start()
+    assert await limiter.run("https://a.example", _blocking(started, release, value=1)) == 1
+
+
+@pytest.mark.parametrize(
+    ("max_concurrent", "max_pending", "match"),
+    [(0, 1, "max_concurrent must be at least 1"), (2, 1, "max_pending must be at least max_concurrent")],
+)
+def test_init_when_invalid(max_concurrent, max_pending, match):
+    with pytest.raises(ValueError, match=match):
+        RequestLimiter(max_concurrent=max_concurrent, max_pending=max_pending, queue_timeout=1.0)
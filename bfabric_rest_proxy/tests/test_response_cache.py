@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+from pydantic import SecretStr
+
+from bfabric import BfabricAuth
+from bfabric_rest_proxy.response_cache import ResponseCache, ResponseCacheKey
+
+INSTANCE = "https://a.example/"
+
+
+def _key(endpoint: str = "sample", login: str = "user", password: str = "p" * 32, **params) -> ResponseCacheKey:
+    auth = BfabricAuth(login=login, password=SecretStr(password))
+    return ResponseCacheKey.for_read(bfabric_instance=INSTANCE, auth=auth, endpoint=endpoint, **params)
+
+
+class Compute:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.n_calls = 0
+
+    async def __call__(self):
+        self.n_calls += 1
+        await asyncio.sleep(0)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def monotonic(mocker):
+    return mocker.patch("bfabric_rest_proxy.response_cache.time.monotonic", return_value=100.0)
+
+
+def test_key_for_read():
+    assert _key(query={"a": 1, "b": 2}) == _key(query={"b": 2, "a": 1})
+    assert _key(offset=0) != _key(offset=100)
+    assert _key(login="user") != _key(login="other")
+    assert _key(password="p" * 32) != _key(password="q" * 32)
+    assert "p" * 32 not in _key().user
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_when_hit(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=4, single_flight=False)
+    compute = Compute([1], [2])
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    assert compute.n_calls == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "coalesced": 0, "entries": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_when_expired(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=4, single_flight=False)
+    compute = Compute([1], [2])
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    monotonic.return_value = 110.0
+    assert await cache.get_or_compute(_key(), compute) == [2]
+    assert cache.stats() == {"hits": 0, "misses": 2, "coalesced": 0, "entries": 1}
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_evicts_least_recently_used(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=2, single_flight=False)
+    compute = Compute("a", "b", "c", "b2")
+    _ = await cache.get_or_compute(_key("a"), compute)
+    _ = await cache.get_or_compute(_key("b"), compute)
+    _ = await cache.get_or_compute(_key("a"), compute)
+    _ = await cache.get_or_compute(_key("c"), compute)
+    assert await cache.get_or_compute(_key("a"), compute) == "a"
+    assert await cache.get_or_compute(_key("b"), compute) == "b2"
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_when_failed(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=4, single_flight=True)
+    compute = Compute(RuntimeError("failed"), [1])
+    with pytest.raises(RuntimeError, match="failed"):
+        await cache.get_or_compute(_key(), compute)
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    assert compute.n_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_when_disabled():
+    cache = ResponseCache(ttl=0.0, max_entries=4, single_flight=False)
+    compute = Compute([1], [2])
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    assert await cache.get_or_compute(_key(), compute) == [2]
+    assert cache.stats() == {"hits": 0, "misses": 0, "coalesced": 0, "entries": 0}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ttl", [0.0, 10.0])
+async def test_get_or_compute_coalesces_concurrent_reads(ttl):
+    cache = ResponseCache(ttl=ttl, max_entries=4, single_flight=True)
+    release = asyncio.Event()
+    n_calls = 0
+
+    async def compute():
+        nonlocal n_calls
+        n_calls += 1
+        await release.wait()
+        return [n_calls]
+
+    tasks = [asyncio.create_task(cache.get_or_compute(_key(), compute)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*tasks) == [[1], [1], [1]]
+    assert n_calls == 1
+    assert cache.stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesced_when_failed():
+    cache = ResponseCache(ttl=0.0, max_entries=4, single_flight=True)
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        raise RuntimeError("failed")
+
+    tasks = [asyncio.create_task(cache.get_or_compute(_key(), compute)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert [str(result) for result in results] == ["failed", "failed"]
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesced_when_cancelled():
+    cache = ResponseCache(ttl=0.0, max_entries=4, single_flight=True)
+    release = asyncio.Event()
+
+    async def compute():
+        await release.wait()
+        return [1]
+
+    first = asyncio.create_task(cache.get_or_compute(_key(), compute))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_or_compute(_key(), compute))
+    await asyncio.sleep(0)
+    _ = first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+    assert await second == [1]
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_invalidate(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=4, single_flight=False)
+    compute = Compute("sample", "workunit", "workunit2")
+    _ = await cache.get_or_compute(_key("sample"), compute)
+    _ = await cache.get_or_compute(_key("workunit"), compute)
+    cache.invalidate("https://other.example/", endpoints=["workunit"])
+    assert cache.stats()["entries"] == 2
+    cache.invalidate(INSTANCE, endpoints=["workunit"])
+    assert await cache.get_or_compute(_key("sample"), compute) == "sample"
+    assert await cache.get_or_compute(_key("workunit"), compute) == "workunit2"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_read(monotonic):
+    cache = ResponseCache(ttl=10.0, max_entries=4, single_flight=False)
+
+    async def compute():
+        cache.invalidate(INSTANCE, endpoints=["sample"])
+        return [1]
+
+    assert await cache.get_or_compute(_key(), compute) == [1]
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize(
+    ("ttl", "max_entries", "match"), [(-1.0, 1, "ttl must be at least 0"), (1.0, 0, "max_entries must be at least 1")]
+)
+def test_init_when_invalid(ttl, max_entries, match):
+    with pytest.raises(ValueError, match=match):
+        ResponseCache(ttl=ttl, max_entries=max_entries, single_flight=False)
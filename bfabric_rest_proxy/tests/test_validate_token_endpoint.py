@@ -5,8 +5,10 @@ to ensure no real API calls are made during testing.
 """
 
 import pytest
+from fastapi.testclient import TestClient
 
 from bfabric.errors import BfabricInstanceNotConfiguredError
+from bfabric_rest_proxy.server import app, get_token_validation_cache
 
 
 class TestValidateTokenEndpoint:
@@ -55,6 +57,7 @@ class TestValidateTokenEndpoint:
         mock_validate.assert_called_once()
         call_kwargs = mock_validate.call_args[1]
         assert call_kwargs["settings"] is mock_settings
+        assert call_kwargs["cache"] is not None
 
     @pytest.mark.asyncio
     async def test_validate_token_expired_token(self, client, mock_settings, mocker):
@@ -83,3 +86,11 @@ class TestValidateTokenEndpoint:
                 "/validate_token",
                 json={"token": "test_token"},
             )
+
+
+def test_shutdown_closes_token_validation_cache(mocker):
+    """Test that the HTTP client of the token validation cache is closed when the server shuts down."""
+    mock_aclose = mocker.patch.object(get_token_validation_cache(), "aclose")
+    with TestClient(app):
+        mock_aclose.assert_not_called()
+    mock_aclose.assert_awaited_once_with()
@@ -51,6 +51,10 @@ class UploadParams(BaseModel):
     a resource pointing at the already-stored bytes without re-transferring them."""
     track_job: bool = False
     """Create a ``UPLOAD`` job tracking the upload; the tus server flips it to DONE/FAILED."""
+    parallel: Annotated[int, cyclopts.Parameter(name="--parallel")] = 1
+    """Number of files to transfer at the same time."""
+    max_rate: Annotated[float | None, cyclopts.Parameter(name="--max-rate")] = None
+    """Limit the combined transfer rate of all files, in MB/s."""
     progress: bool = True
     """Show a live upload progress bar. Pass ``--no-progress`` to disable; it is also
     auto-disabled when stderr is not an interactive terminal."""
@@ -93,6 +97,8 @@ def cmd_workunit_upload(params: UploadParams, *, client: Bfabric) -> None:
             on_progress=reporter.on_progress if reporter else None,
             on_start=reporter.on_start if reporter else None,
             on_file_done=reporter.on_file_done if reporter else None,
+            max_workers=params.parallel,
+            max_bytes_per_second=params.max_rate * 1e6 if params.max_rate is not None else None,
         )
 
     if summary.workunit_id is None:
@@ -119,10 +125,10 @@ def _progress_enabled(*, requested: bool) -> bool:
 class _UploadProgressReporter:
     """Drives the live upload display: an overall ``N/X`` bar, a per-file bar, and a persistent list.
 
-    Files upload sequentially, so one per-file bar is shown at a time -- created when its first chunk
-    is reported and removed once it finishes. Each completed file also prints a persistent ✓/✗ line
-    above the live region (via ``live.console.print``) so the user keeps a scrollback history of what
-    has been uploaded while still seeing where they are in the whole batch.
+    Each file being transferred has its own bar (one at a time, unless ``--parallel`` is given) --
+    created when its first chunk is reported and removed once it finishes. Each completed file also
+    prints a persistent ✓/✗ line above the live region (via ``live.console.print``) so the user keeps a
+    scrollback history of what has been uploaded while still seeing where they are in the whole batch.
     """
 
     def __init__(self, *, live: Live, overall: Progress, current: Progress) -> None:
@@ -25,8 +25,12 @@ def example_config_path() -> Path:
 
 
 class TestEngine:
-    def test_suds_is_the_only_engine(self):
-        assert list(BfabricAPIEngineType) == [BfabricAPIEngineType.SUDS]
+    def test_available_engines(self):
+        assert list(BfabricAPIEngineType) == [BfabricAPIEngineType.SUDS, BfabricAPIEngineType.XML]
+
+    def test_xml_engine(self):
+        config = BfabricClientConfig(base_url="https://example.com", engine="XML")
+        assert config.engine == BfabricAPIEngineType.XML
 
     def test_unknown_engine_is_rejected(self):
         with pytest.raises(ValidationError):
@@ -126,7 +130,9 @@ def test_repr(mock_config: BfabricClientConfig, variant) -> None:
     rep = variant(mock_config)
     assert rep == (
         "BfabricClientConfig(base_url='https://example.com/', application_ids={'app': 1}, job_notification_emails='',"
-        " engine=BfabricAPIEngineType.SUDS)"
+        " engine=BfabricAPIEngineType.SUDS, wsdl_cache_ttl=datetime.timedelta(days=1),"
+        " http=BfabricHttpConfig(max_connections=20, max_keepalive_connections=20,"
+        " keepalive_expiry=datetime.timedelta(seconds=15), timeout=datetime.timedelta(seconds=90), http2=False))"
     )
 
 
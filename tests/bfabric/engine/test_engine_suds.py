@@ -1,3 +1,5 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor
 from urllib.error import URLError
 
 import pytest
@@ -96,9 +98,13 @@ def test_delete_empty_list(engine_suds, mock_auth, mock_suds_service, mocker):
     mock_suds_service.delete.assert_not_called()
 
 
+def test_close(engine_suds):
+    engine_suds.close()
+    assert engine_suds._http_pool.client.is_closed
+
+
 def test_convert_results(engine_suds, mocker):
-    mock_suds_asdict = mocker.patch("bfabric.engine.engine_suds.suds_asdict_recursive")
-    mock_clean_result = mocker.patch("bfabric.engine.engine_suds.clean_result")
+    mock_suds_asdict_clean = mocker.patch("bfabric.engine.engine_suds.suds_asdict_clean")
 
     mock_response = mocker.MagicMock()
     mock_response.sample = [mocker.MagicMock(), mocker.MagicMock()]
@@ -107,26 +113,86 @@ def test_convert_results(engine_suds, mocker):
         "numberofpages": 2,
     }.__getitem__
 
-    mock_suds_asdict.side_effect = [{"result1": "value1"}, {"result2": "value2"}]
-    mock_clean_result.side_effect = lambda x, **kwargs: x
+    mock_suds_asdict_clean.side_effect = [{"result1": "value1"}, {"result2": "value2"}]
 
     result = engine_suds._convert_results(mock_response, "sample")
 
     assert isinstance(result, ResultContainer)
     assert result.results == [{"result1": "value1"}, {"result2": "value2"}]
     assert result.total_pages_api == 2
-    assert mock_suds_asdict.call_count == 2
-    assert mock_clean_result.call_count == 2
+    assert mock_suds_asdict_clean.mock_calls == [
+        mocker.call(mock_response.sample[0], drop_underscores=True),
+        mocker.call(mock_response.sample[1], drop_underscores=True),
+    ]
 
 
 def test_get_suds_service(mocker, mock_client, mock_suds_service):
     construct_client = mocker.patch("bfabric.engine.engine_suds.Client", return_value=mock_client)
     engine = EngineSUDS(base_url="http://example.com/api")
     service = engine._get_suds_service("sample")
-    construct_client.assert_called_once_with("http://example.com/api/sample?wsdl", cache=None)
+    construct_client.assert_called_once_with(
+        "http://example.com/api/sample?wsdl", cache=None, transport=engine._transport
+    )
     assert service == mock_suds_service
 
 
+def test_get_suds_service_when_other_thread(mocker, mock_client, mock_suds_service):
+    construct_client = mocker.patch("bfabric.engine.engine_suds.Client", return_value=mock_client)
+    engine = EngineSUDS(base_url="http://example.com/api")
+    assert engine._get_suds_service("sample") == mock_suds_service
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        service_other_thread = pool.submit(engine._get_suds_service, "sample").result()
+
+    construct_client.assert_called_once_with(
+        "http://example.com/api/sample?wsdl", cache=None, transport=engine._transport
+    )
+    mock_client.clone.assert_called_once_with()
+    assert service_other_thread == mock_client.clone.return_value.service
+    assert engine._get_suds_service("sample") == mock_suds_service
+
+
+class TestWsdlCache:
+    @pytest.fixture
+    def engine(self, tmp_path):
+        return EngineSUDS(
+            base_url="http://example.com/api", wsdl_cache_ttl=datetime.timedelta(hours=1), wsdl_cache_dir=tmp_path
+        )
+
+    def test_client_uses_cache(self, mocker, engine, mock_client):
+        construct_client = mocker.patch("bfabric.engine.engine_suds.Client", return_value=mock_client)
+        engine._get_suds_service("sample")
+        construct_client.assert_called_once_with(
+            "http://example.com/api/sample?wsdl", cache=engine._wsdl_cache, cachingpolicy=1, transport=engine._transport
+        )
+
+    def test_falls_back_to_stale_cache_when_unreachable(self, mocker, engine, mock_client, mock_suds_service):
+        construct_client = mocker.patch(
+            "bfabric.engine.engine_suds.Client",
+            side_effect=[URLError(ConnectionRefusedError(111, "Connection refused")), mock_client],
+        )
+        assert engine._get_suds_service("sample") == mock_suds_service
+        assert construct_client.call_count == 2
+        assert construct_client.call_args.kwargs["cache"]._allow_stale
+
+    def test_raises_when_unreachable_and_nothing_cached(self, mocker, engine):
+        mocker.patch(
+            "bfabric.engine.engine_suds.Client",
+            side_effect=URLError(ConnectionRefusedError(111, "Connection refused")),
+        )
+        with pytest.raises(BfabricUnavailableError):
+            engine._get_suds_service("sample")
+
+    def test_missing_endpoint_does_not_fall_back(self, mocker, engine):
+        construct_client = mocker.patch(
+            "bfabric.engine.engine_suds.Client",
+            side_effect=suds.transport.TransportError("Not Found", 404),
+        )
+        with pytest.raises(BfabricRequestError, match="Non-existent endpoint"):
+            engine._get_suds_service("sample")
+        construct_client.assert_called_once()
+
+
 class TestUnreachableInstance:
     """An unreachable instance must arrive as a RuntimeError, not a transport-library exception.
 
@@ -0,0 +1,419 @@
+import asyncio
+import datetime
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from bfabric.engine.engine_suds import EngineSUDS
+from bfabric.engine.engine_xml import AsyncEngineXML, EngineXML
+from bfabric.errors import BfabricRequestError, BfabricUnavailableError
+from bfabric.results.response_delete import ResponseDelete
+
+WSDL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:tns="http://endpoint.webservice.component.bfabric.org/"
+    targetNamespace="http://endpoint.webservice.component.bfabric.org/" name="SampleService">
+  <types>
+    <xsd:schema>
+      <xsd:import namespace="http://endpoint.webservice.component.bfabric.org/" schemaLocation="sample?xsd=1"/>
+    </xsd:schema>
+  </types>
+  <service name="SampleService">
+    <port name="SamplePort" binding="tns:SamplePortBinding">
+      <soap:address location="http://example.com/api/sample"/>
+    </port>
+  </service>
+</definitions>
+"""
+
+FULL_WSDL = b"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/" xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+    xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:tns="http://endpoint.webservice.component.bfabric.org/"
+    targetNamespace="http://endpoint.webservice.component.bfabric.org/" name="SampleService">
+  <types>
+    <xsd:schema>
+      <xsd:import namespace="http://endpoint.webservice.component.bfabric.org/" schemaLocation="sample?xsd=1"/>
+    </xsd:schema>
+  </types>
+  <message name="read"><part name="parameters" element="tns:read"/></message>
+  <message name="readResponse"><part name="parameters" element="tns:readResponse"/></message>
+  <message name="delete"><part name="parameters" element="tns:delete"/></message>
+  <message name="deleteResponse"><part name="parameters" element="tns:deleteResponse"/></message>
+  <portType name="SampleService">
+    <operation name="read">
+      <input message="tns:read"/>
+      <output message="tns:readResponse"/>
+    </operation>
+    <operation name="delete">
+      <input message="tns:delete"/>
+      <output message="tns:deleteResponse"/>
+    </operation>
+  </portType>
+  <binding name="SamplePortBinding" type="tns:SampleService">
+    <soap:binding transport="http://schemas.xmlsoap.org/soap/http" style="document"/>
+    <operation name="read">
+      <soap:operation soapAction=""/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+    <operation name="delete">
+      <soap:operation soapAction=""/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+  </binding>
+  <service name="SampleService">
+    <port name="SamplePort" binding="tns:SamplePortBinding">
+      <soap:address location="http://example.com/api/sample"/>
+    </port>
+  </service>
+</definitions>
+"""
+
+XSD = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xs:schema xmlns:tns="http://endpoint.webservice.component.bfabric.org/" xmlns:xs="http://www.w3.org/2001/XMLSchema"
+    version="1.0" targetNamespace="http://endpoint.webservice.component.bfabric.org/">
+  <xs:element name="read" type="tns:read"/>
+  <xs:element name="readResponse" type="tns:readResponse"/>
+  <xs:element name="delete" type="tns:delete"/>
+  <xs:element name="deleteResponse" type="tns:deleteResponse"/>
+  <xs:complexType name="read">
+    <xs:sequence><xs:element name="parameters" type="tns:xmlRequestRead" minOccurs="0"/></xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="xmlRequestRead">
+    <xs:sequence>
+      <xs:element name="login" type="xs:string" minOccurs="0"/>
+      <xs:element name="password" type="xs:string" minOccurs="0"/>
+      <xs:element name="page" type="xs:int"/>
+      <xs:element name="idonly" type="xs:boolean"/>
+      <xs:element name="query" type="tns:sample" minOccurs="0"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="delete">
+    <xs:sequence><xs:element name="parameters" type="tns:xmlRequestDelete" minOccurs="0"/></xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="xmlRequestDelete">
+    <xs:sequence>
+      <xs:element name="login" type="xs:string" minOccurs="0"/>
+      <xs:element name="password" type="xs:string" minOccurs="0"/>
+      <xs:element name="id" type="xs:long" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="readResponse">
+    <xs:sequence><xs:element name="return" type="tns:xmlResponse" minOccurs="0"/></xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="deleteResponse">
+    <xs:sequence><xs:element name="return" type="tns:xmlResponse" minOccurs="0"/></xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="xmlResponse">
+    <xs:sequence>
+      <xs:element name="errorreport" type="xs:string" minOccurs="0"/>
+      <xs:element name="numberofpages" type="xs:int" minOccurs="0"/>
+      <xs:element name="page" type="xs:int" minOccurs="0"/>
+      <xs:element name="sample" type="tns:sample" nillable="true" minOccurs="0" maxOccurs="unbounded"/>
+    </xs:sequence>
+  </xs:complexType>
+  <xs:complexType name="entity">
+    <xs:sequence>
+      <xs:element name="createdby" type="xs:string" minOccurs="0"/>
+      <xs:element name="created" type="xs:dateTime" minOccurs="0"/>
+      <xs:element name="deletionreport" type="xs:string" minOccurs="0"/>
+    </xs:sequence>
+    <xs:attribute name="id" type="xs:long"/>
+    <xs:attribute name="classname" type="xs:string"/>
+  </xs:complexType>
+  <xs:complexType name="sample">
+    <xs:complexContent>
+      <xs:extension base="tns:entity">
+        <xs:sequence>
+          <xs:element name="name" type="xs:string" minOccurs="0"/>
+          <xs:element name="includedeletableupdateable" type="xs:boolean" minOccurs="0"/>
+          <xs:element name="concentration" type="xs:double" minOccurs="0"/>
+          <xs:element name="description" type="xs:string" nillable="true" minOccurs="0"/>
+          <xs:element name="container" type="tns:entity" minOccurs="0"/>
+          <xs:element name="child" type="tns:entity" minOccurs="0" maxOccurs="unbounded"/>
+        </xs:sequence>
+      </xs:extension>
+    </xs:complexContent>
+  </xs:complexType>
+</xs:schema>
+"""
+
+READ_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<S:Envelope xmlns:S="http://schemas.xmlsoap.org/soap/envelope/">
+  <S:Body>
+    <ns2:readResponse xmlns:ns2="http://endpoint.webservice.component.bfabric.org/">
+      <return>
+        <numberofpages>3</numberofpages>
+        <page>1</page>
+        <sample id="1" classname="sample">
+          <created>2024-01-02T03:04:05+01:00</created>
+          <name>A &amp; B</name>
+          <concentration>1.5</concentration>
+          <description></description>
+          <container id="10" classname="container"/>
+          <child id="2" classname="sample"/>
+        </sample>
+        <sample id="3" classname="sample">
+          <name>C</name>
+          <child id="4" classname="sample"/>
+          <child id="5" classname="sample"/>
+        </sample>
+      </return>
+    </ns2:readResponse>
+  </S:Body>
+</S:Envelope>
+"""
+
+FAULT_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<S:Envelope xmlns:S="http://schemas.xmlsoap.org/soap/envelope/">
+  <S:Body>
+    <S:Fault><faultcode>S:Server</faultcode><faultstring>Invalid login</faultstring></S:Fault>
+  </S:Body>
+</S:Envelope>
+"""
+
+
+@pytest.fixture
+def mock_auth(mocker):
+    return mocker.MagicMock(login="test_user", password=SecretStr("test_pass"))
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def responses() -> dict[str, httpx.Response]:
+    return {"POST": httpx.Response(200, content=READ_RESPONSE)}
+
+
+@pytest.fixture
+def wsdl() -> bytes:
+    return WSDL
+
+
+@pytest.fixture
+def handler(requests, responses, wsdl):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.method == "POST":
+            return httpx.Response(responses["POST"].status_code, content=responses["POST"].content)
+        if request.url.path != "/api/sample":
+            return httpx.Response(404)
+        if request.url.query == b"wsdl":
+            return httpx.Response(200, content=wsdl)
+        if request.url.query == b"xsd=1":
+            return httpx.Response(200, content=XSD)
+        return httpx.Response(404)
+
+    return handler
+
+
+@pytest.fixture
+def engine_xml(handler):
+    engine = EngineXML(base_url="http://example.com/api")
+    engine._http = httpx.Client(transport=httpx.MockTransport(handler))
+    return engine
+
+
+@pytest.fixture
+def async_engine_xml(handler):
+    engine = AsyncEngineXML(base_url="http://example.com/api")
+    engine._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return engine
+
+
+@pytest.fixture
+def engine_suds(handler):
+    engine = EngineSUDS(base_url="http://example.com/api")
+    engine._http_pool.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return engine
+
+
+@pytest.mark.parametrize("wsdl", [WSDL, FULL_WSDL], ids=["minimal", "full"])
+def test_read(engine_xml, mock_auth, requests):
+    result = engine_xml.read("sample", {"name": "A & B"}, mock_auth)
+
+    assert result.is_success
+    assert result.total_pages_api == 3
+    assert result.to_list_dict() == [
+        {
+            "child": [{"classname": "sample", "id": 2}],
+            "classname": "sample",
+            "concentration": 1.5,
+            "container": {"classname": "container", "id": 10},
+            "created": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=1))),
+            "description": None,
+            "id": 1,
+            "name": "A & B",
+        },
+        {
+            "child": [{"classname": "sample", "id": 4}, {"classname": "sample", "id": 5}],
+            "classname": "sample",
+            "id": 3,
+            "name": "C",
+        },
+    ]
+
+
+@pytest.mark.parametrize("wsdl", [FULL_WSDL])
+def test_read_same_as_engine_suds(engine_xml, engine_suds, mock_auth):
+    result_xml = engine_xml.read("sample", {"name": "A & B"}, mock_auth)
+    result_suds = engine_suds.read("sample", {"name": "A & B"}, mock_auth)
+
+    assert result_xml.to_list_dict() == result_suds.to_list_dict()
+    assert result_xml.total_pages_api == result_suds.total_pages_api
+    assert result_xml.errors == result_suds.errors
+
+
+def test_read_request(engine_xml, mock_auth, requests):
+    engine_xml.read("sample", {"name": "A & B"}, mock_auth, page=2)
+
+    assert [str(request.url) for request in requests] == [
+        "http://example.com/api/sample?wsdl",
+        "http://example.com/api/sample?xsd=1",
+        "http://example.com/api/sample",
+    ]
+    assert requests[-1].content.decode() == (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/" '
+        'xmlns:ns0="http://endpoint.webservice.component.bfabric.org/">'
+        "<soapenv:Header/><soapenv:Body><ns0:read><parameters>"
+        "<login>test_user</login><password>test_pass</password><page>2</page><idonly>false</idonly>"
+        "<query><name>A &amp; B</name><includedeletableupdateable>false</includedeletableupdateable></query>"
+        "</parameters></ns0:read></soapenv:Body></soapenv:Envelope>"
+    )
+
+
+def test_read_caches_schema(engine_xml, mock_auth, requests):
+    engine_xml.read("sample", {}, mock_auth)
+    engine_xml.read("sample", {}, mock_auth)
+    assert [request.method for request in requests] == ["GET", "GET", "POST", "POST"]
+
+
+def test_read_when_fault(engine_xml, mock_auth, responses):
+    responses["POST"] = httpx.Response(500, content=FAULT_RESPONSE)
+    with pytest.raises(BfabricRequestError, match="Invalid login"):
+        engine_xml.read("sample", {}, mock_auth)
+
+
+def test_read_when_http_error(engine_xml, mock_auth, responses):
+    responses["POST"] = httpx.Response(403, content=b"Forbidden")
+    with pytest.raises(BfabricRequestError, match="HTTP 403 from the sample endpoint"):
+        engine_xml.read("sample", {}, mock_auth)
+
+
+def test_read_when_invalid_response(engine_xml, mock_auth, responses):
+    responses["POST"] = httpx.Response(500, content=b"<html><body>Internal error</html>")
+    with pytest.raises(BfabricRequestError, match="Invalid SOAP response"):
+        engine_xml.read("sample", {}, mock_auth)
+
+
+def test_read_when_error_report(engine_xml, mock_auth, responses):
+    responses["POST"] = httpx.Response(
+        200,
+        content=READ_RESPONSE.replace(b"<numberofpages>3</numberofpages>", b"<errorreport>Access denied</errorreport>"),
+    )
+    result = engine_xml.read("sample", {}, mock_auth)
+    assert not result.is_success
+    assert [str(error) for error in result.errors] == ["Access denied"]
+
+
+def test_read_when_non_existent_endpoint(engine_xml, mock_auth):
+    with pytest.raises(BfabricRequestError, match="Non-existent endpoint"):
+        engine_xml.read("nonexistent", {}, mock_auth)
+
+
+def test_read_when_method_not_found(engine_xml, mock_auth):
+    with pytest.raises(BfabricRequestError, match="Failed to find save method for the sample endpoint."):
+        engine_xml.save("sample", {}, mock_auth)
+
+
+def test_read_when_unavailable(mock_auth):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    engine = EngineXML(base_url="http://example.com/api")
+    engine._http = httpx.Client(transport=httpx.MockTransport(handler))
+    with pytest.raises(BfabricUnavailableError):
+        engine.read("sample", {}, mock_auth)
+
+
+def test_delete(engine_xml, mock_auth, requests, responses):
+    responses["POST"] = httpx.Response(
+        200,
+        content=b"""<?xml version="1.0" encoding="UTF-8"?>
+<S:Envelope xmlns:S="http://schemas.xmlsoap.org/soap/envelope/">
+  <S:Body>
+    <ns2:deleteResponse xmlns:ns2="http://endpoint.webservice.component.bfabric.org/">
+      <return>
+        <sample id="1" classname="sample"><deletionreport>Sample 1 removed successfully.</deletionreport></sample>
+        <sample id="3" classname="sample"><deletionreport>Sample 3 is still in use.</deletionreport></sample>
+      </return>
+    </ns2:deleteResponse>
+  </S:Body>
+</S:Envelope>
+""",
+    )
+    result = engine_xml.delete("sample", [1, 3], mock_auth)
+
+    assert isinstance(result, ResponseDelete)
+    assert b"<id>1</id><id>3</id>" in requests[-1].content
+    assert result.to_list_dict() == [{"id": 1, "deletionreport": "Sample 1 removed successfully."}]
+    assert [str(error) for error in result.errors] == ["Sample 3 is still in use."]
+
+
+def test_delete_when_empty_list(engine_xml, mock_auth, requests):
+    result = engine_xml.delete("sample", [], mock_auth)
+    assert isinstance(result, ResponseDelete)
+    assert result.to_list_dict() == []
+    assert requests == []
+
+
+def test_close():
+    engine = EngineXML(base_url="http://example.com/api")
+    engine.close()
+    assert engine._http.is_closed
+
+
+async def test_async_read(async_engine_xml, engine_xml, mock_auth, requests):
+    result = await async_engine_xml.read("sample", {"name": "A & B"}, mock_auth, page=2)
+    assert result.to_list_dict() == engine_xml.read("sample", {"name": "A & B"}, mock_auth, page=2).to_list_dict()
+    assert result.total_pages_api == 3
+    assert requests[2].content == requests[-1].content
+
+
+async def test_async_read_concurrently(async_engine_xml, mock_auth, requests):
+    results = await asyncio.gather(*(async_engine_xml.read("sample", {}, mock_auth, page=i) for i in (1, 2, 3)))
+    assert [len(result) for result in results] == [2, 2, 2]
+    assert len([request for request in requests if request.method == "POST"]) == 3
+
+
+async def test_async_read_when_fault(async_engine_xml, mock_auth, responses):
+    responses["POST"] = httpx.Response(500, content=FAULT_RESPONSE)
+    with pytest.raises(BfabricRequestError, match="Invalid login"):
+        await async_engine_xml.read("sample", {}, mock_auth)
+
+
+async def test_async_read_when_unavailable(mock_auth):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    engine = AsyncEngineXML(base_url="http://example.com/api")
+    engine._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    with pytest.raises(BfabricUnavailableError):
+        await engine.read("sample", {}, mock_auth)
+
+
+async def test_async_delete_when_empty_list(async_engine_xml, mock_auth, requests):
+    result = await async_engine_xml.delete("sample", [], mock_auth)
+    assert isinstance(result, ResponseDelete)
+    assert requests == []
+
+
+async def test_async_aclose(async_engine_xml):
+    await async_engine_xml.aclose()
+    assert async_engine_xml._http.is_closed
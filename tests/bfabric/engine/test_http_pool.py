@@ -0,0 +1,134 @@
+import asyncio
+import copy
+import datetime
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import suds.transport
+
+from bfabric.config.bfabric_client_config import BfabricHttpConfig
+from bfabric.engine._http_pool import ConnectionStats, HttpPool, HttpxTransport, create_async_client
+from bfabric.errors import BfabricConfigError, BfabricUnavailableError
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _mock_pool(handler) -> HttpPool:
+    return HttpPool(BfabricHttpConfig(), transport=httpx.MockTransport(handler))
+
+
+def test_stats_when_connection_reused(server_url):
+    pool = HttpPool(BfabricHttpConfig())
+    for _ in range(3):
+        assert pool.client.get(server_url).content == b"ok"
+    assert pool.stats == ConnectionStats(requests=3, connections_opened=1, requests_per_connection=(3,))
+    assert pool.stats.requests_reused == 2
+    pool.close()
+
+
+def test_stats_when_no_keepalive_connections(server_url):
+    pool = HttpPool(BfabricHttpConfig(max_keepalive_connections=0))
+    for _ in range(3):
+        pool.client.get(server_url)
+    assert pool.stats.connections_opened == 3
+    assert pool.stats.requests_reused == 0
+    pool.close()
+
+
+def test_stats_when_mock_transport():
+    pool = _mock_pool(lambda request: httpx.Response(200))
+    pool.client.get("http://example.com/")
+    assert pool.stats == ConnectionStats(requests=1, connections_opened=1, requests_per_connection=())
+
+
+def test_pool_timeout():
+    pool = HttpPool(BfabricHttpConfig(timeout=datetime.timedelta(minutes=5)))
+    assert pool.client.timeout == httpx.Timeout(300.0)
+    pool.close()
+
+
+def test_create_async_client():
+    config = BfabricHttpConfig(timeout=datetime.timedelta(minutes=5), max_connections=5)
+    client = create_async_client(config)
+    assert client.timeout == httpx.Timeout(300.0)
+    assert client._transport._pool._max_connections == 5
+    asyncio.run(client.aclose())
+
+
+def test_pool_when_http2_unavailable(mocker):
+    mocker.patch("bfabric.engine._http_pool.importlib.util.find_spec", return_value=None)
+    with pytest.raises(BfabricConfigError, match=r"pip install 'bfabric\[http2\]'"):
+        HttpPool(BfabricHttpConfig(http2=True))
+
+
+def test_transport_open():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "GET"
+        return httpx.Response(200, content=b"<wsdl/>")
+
+    transport = HttpxTransport(_mock_pool(handler), base_url="http://example.com/api")
+    stream = transport.open(suds.transport.Request("http://example.com/api/sample?wsdl"))
+    assert stream.read() == b"<wsdl/>"
+
+
+def test_transport_send():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.content == b"<envelope/>"
+        assert request.headers["SOAPAction"] == '""'
+        return httpx.Response(200, content=b"<reply/>", headers={"Content-Type": "text/xml"})
+
+    transport = HttpxTransport(_mock_pool(handler), base_url="http://example.com/api")
+    request = suds.transport.Request("http://example.com/api/sample", message=b"<envelope/>")
+    request.headers = {"SOAPAction": '""'}
+    reply = transport.send(request)
+    assert reply.code == 200
+    assert reply.message == b"<reply/>"
+    assert reply.headers["content-type"] == "text/xml"
+
+
+def test_transport_when_error_status():
+    transport = HttpxTransport(
+        _mock_pool(lambda request: httpx.Response(500, content=b"<fault/>")), base_url="http://example.com/api"
+    )
+    with pytest.raises(suds.transport.TransportError) as exc_info:
+        transport.send(suds.transport.Request("http://example.com/api/sample", message=b"<envelope/>"))
+    assert exc_info.value.httpcode == 500
+    assert exc_info.value.fp.read() == b"<fault/>"
+
+
+def test_transport_when_unreachable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    transport = HttpxTransport(_mock_pool(handler), base_url="http://example.com/api")
+    with pytest.raises(BfabricUnavailableError, match="Could not reach the B-Fabric instance"):
+        transport.open(suds.transport.Request("http://example.com/api/sample?wsdl"))
+
+
+def test_transport_deepcopy_shares_pool():
+    transport = HttpxTransport(_mock_pool(lambda request: httpx.Response(200)), base_url="http://example.com/api")
+    assert copy.deepcopy(transport) is transport
@@ -0,0 +1,73 @@
+import datetime
+
+import pytest
+from suds.sax.text import Text
+from suds.sudsobject import Factory
+
+from bfabric.engine.response_format_suds import suds_asdict_clean, suds_asdict_recursive
+from bfabric.results.response_format_dict import clean_result
+
+
+@pytest.fixture
+def suds_workunit():
+    return Factory.object(
+        "workunit",
+        {
+            "_id": 30,
+            "_classname": "workunit",
+            "name": Text("My workunit"),
+            "created": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "status": Text("available"),
+            "application": Factory.object("application", {"_id": 1, "_classname": "application"}),
+            "container": Factory.object("project", {"_id": 3000, "_classname": "project", "_projectid": 3000}),
+            "resource": [
+                Factory.object("resource", {"_id": 2, "_classname": "resource", "size": 1024}),
+                Factory.object("resource", {"_id": 1, "_classname": "resource", "size": 2048}),
+            ],
+            "keyword": [Text("b"), Text("a")],
+        },
+    )
+
+
+def test_suds_asdict_clean(suds_workunit):
+    result = suds_asdict_clean(suds_workunit)
+    assert result == {
+        "application": {"classname": "application", "id": 1},
+        "classname": "workunit",
+        "container": {"classname": "project", "id": 3000, "projectid": 3000},
+        "created": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "id": 30,
+        "keyword": ["b", "a"],
+        "name": "My workunit",
+        "resource": [
+            {"classname": "resource", "id": 2, "size": 1024},
+            {"classname": "resource", "id": 1, "size": 2048},
+        ],
+        "status": "available",
+    }
+    assert list(result) == sorted(result)
+    assert list(result["container"]) == ["classname", "id", "projectid"]
+    assert type(result["name"]) is str
+    assert type(result["keyword"][0]) is str
+
+
+def test_suds_asdict_clean_when_keep_underscores(suds_workunit):
+    result = suds_asdict_clean(suds_workunit, drop_underscores=False)
+    assert list(result) == sorted(result)
+    assert result["_id"] == 30
+    assert result["container"] == {"_classname": "project", "_id": 3000, "_projectid": 3000}
+
+
+@pytest.mark.parametrize("drop_underscores", [True, False])
+def test_suds_asdict_clean_matches_clean_result(suds_workunit, drop_underscores):
+    expected = clean_result(
+        suds_asdict_recursive(suds_workunit, convert_types=True),
+        drop_underscores_suds=drop_underscores,
+        sort_keys=True,
+    )
+    assert suds_asdict_clean(suds_workunit, drop_underscores=drop_underscores) == expected
+
+
+def test_suds_asdict_clean_when_renamed_key_exists():
+    suds_object = Factory.object("sample", {"id": 1, "_id": 2})
+    assert suds_asdict_clean(suds_object) == {"id": 2}
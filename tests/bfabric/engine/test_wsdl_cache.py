@@ -0,0 +1,58 @@
+import datetime
+import os
+import time
+
+import pytest
+
+from bfabric.engine._wsdl_cache import WsdlCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return WsdlCache(tmp_path / "wsdl", ttl=datetime.timedelta(hours=1))
+
+
+def _expire(cache, id):
+    path = cache._path(id)
+    old = time.time() - 2 * 3600
+    os.utime(path, (old, old))
+
+
+def test_get_when_missing(cache):
+    assert cache.get("sample") is None
+
+
+def test_put_and_get(cache):
+    cache.put("sample", {"definitions": [1, 2, 3]})
+    assert cache.get("sample") == {"definitions": [1, 2, 3]}
+    assert not list(cache._path("sample").parent.glob(".*"))
+
+
+def test_get_when_expired(cache):
+    cache.put("sample", {"definitions": [1, 2, 3]})
+    _expire(cache, "sample")
+    assert cache.get("sample") is None
+    assert cache._path("sample").exists()
+
+
+def test_stale_when_expired(cache):
+    cache.put("sample", {"definitions": [1, 2, 3]})
+    _expire(cache, "sample")
+    assert cache.stale().get("sample") == {"definitions": [1, 2, 3]}
+
+
+def test_get_when_corrupt(cache):
+    cache.put("sample", {"definitions": [1, 2, 3]})
+    cache._path("sample").write_bytes(b"not a pickle")
+    assert cache.get("sample") is None
+
+
+def test_try_open(tmp_path):
+    cache = WsdlCache.try_open(tmp_path / "wsdl", ttl=datetime.timedelta(hours=1))
+    assert isinstance(cache, WsdlCache)
+    assert cache.location == str(tmp_path / "wsdl")
+
+
+def test_try_open_when_not_usable(tmp_path, mocker):
+    mocker.patch.object(WsdlCache, "__init__", side_effect=PermissionError("denied"))
+    assert WsdlCache.try_open(tmp_path / "wsdl", ttl=datetime.timedelta(hours=1)) is None
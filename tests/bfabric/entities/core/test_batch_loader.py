@@ -0,0 +1,120 @@
+import pytest
+
+from bfabric.entities.core.batch_loader import current_batch_loader
+from bfabric.entities.core.entity import Entity
+from bfabric.entities.core.entity_reader import EntityReader
+from bfabric.entities.core.uri import EntityUri
+from bfabric.results.result_container import ResultContainer
+
+
+@pytest.fixture
+def mock_client(mock_client):
+    def read(endpoint, obj, max_results=100, **kwargs):
+        results = [{"id": id, "classname": endpoint, "name": f"{endpoint} {id}"} for id in obj["id"] if id != 404]
+        return ResultContainer(results, total_pages_api=1, errors=[])
+
+    mock_client.read.side_effect = read
+    return mock_client
+
+
+@pytest.fixture
+def reader(mock_client):
+    return EntityReader.for_client(mock_client)
+
+
+def _sample(mock_client, bfabric_instance, sample_id: int, project_id: int) -> Entity:
+    data_dict = {"id": sample_id, "classname": "sample", "container": {"id": project_id, "classname": "project"}}
+    return Entity(data_dict, client=mock_client, bfabric_instance=bfabric_instance)
+
+
+def _read_ids(mock_client) -> list[list[int]]:
+    return [call.args[1]["id"] for call in mock_client.read.mock_calls]
+
+
+def test_references_loaded_for_all_tracked_entities(reader, mock_client, bfabric_instance):
+    with reader.batch():
+        project_ids = [1, 2, 1, 3]
+        samples = [_sample(mock_client, bfabric_instance, i, project_id) for i, project_id in enumerate(project_ids, 1)]
+        assert samples[0].refs.get("container")["name"] == "project 1"
+        assert _read_ids(mock_client) == [[1, 2, 3]]
+        assert all(sample.refs.is_loaded("container") for sample in samples)
+        assert [sample.refs.get("container")["name"] for sample in samples[1:]] == [
+            "project 2",
+            "project 1",
+            "project 3",
+        ]
+    assert len(mock_client.read.mock_calls) == 1
+
+
+def test_references_when_sibling_reference_missing(reader, mock_client, bfabric_instance):
+    with reader.batch():
+        first = _sample(mock_client, bfabric_instance, 1, project_id=1)
+        other = _sample(mock_client, bfabric_instance, 2, project_id=404)
+        assert first.refs.get("container").id == 1
+        assert not other.refs.is_loaded("container")
+        with pytest.raises(ValueError, match="Entity not found"):
+            other.refs.get("container")
+
+
+def test_references_when_entity_created_outside(reader, mock_client, bfabric_instance):
+    outside = _sample(mock_client, bfabric_instance, 1, project_id=1)
+    with reader.batch():
+        inside = _sample(mock_client, bfabric_instance, 2, project_id=2)
+        inside.refs.get("container")
+    assert not outside.refs.is_loaded("container")
+    assert _read_ids(mock_client) == [[2]]
+
+
+def test_references_when_other_client(reader, mock_client, bfabric_instance, mocker):
+    other_client = mocker.MagicMock(name="other_client", config=mock_client.config)
+    other_client.read.side_effect = mock_client.read.side_effect
+    with reader.batch():
+        other = _sample(other_client, bfabric_instance, 1, project_id=1)
+        sample = _sample(mock_client, bfabric_instance, 2, project_id=2)
+        sample.refs.get("container")
+    assert not other.refs.is_loaded("container")
+
+
+def test_references_without_batch(mock_client, bfabric_instance):
+    samples = [_sample(mock_client, bfabric_instance, i, project_id=i) for i in range(1, 4)]
+    for sample in samples:
+        sample.refs.get("container")
+    assert _read_ids(mock_client) == [[1], [2], [3]]
+
+
+def test_load_id(reader, mock_client, bfabric_instance):
+    with reader.batch() as loader:
+        pending = [loader.load_id("sample", sample_id) for sample_id in [10, 404, 20]]
+        pending.append(loader.load_id("project", 1))
+        mock_client.read.assert_not_called()
+        assert pending[0].result()["name"] == "sample 10"
+        assert pending[1].result() is None
+        assert pending[3].uri == EntityUri(f"{bfabric_instance}project/show.html?id=1")
+        assert pending[3].result().id == 1
+    assert sorted(_read_ids(mock_client)) == [[1], [10, 404, 20]]
+
+
+def test_load_when_already_read(reader, mock_client):
+    with reader.batch() as loader:
+        first = loader.load_id("sample", 10)
+        first.result()
+        second = loader.load_id("sample", 10)
+        assert second.result() is first.result()
+    assert len(mock_client.read.mock_calls) == 1
+
+
+def test_batch_reads_pending_on_exit(reader, mock_client):
+    with reader.batch() as loader:
+        pending = loader.load_id("sample", 10)
+    mock_client.read.assert_called_once()
+    assert pending.result().id == 10
+
+
+def test_batch_scope(reader):
+    assert current_batch_loader() is None
+    with reader.batch() as loader:
+        assert current_batch_loader() is loader
+        with reader.batch() as inner:
+            assert current_batch_loader() is inner
+        assert current_batch_loader() is loader
+    assert current_batch_loader() is None
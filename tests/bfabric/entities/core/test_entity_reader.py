@@ -3,6 +3,7 @@ import pytest
 from bfabric.entities.core.entity import Entity
 from bfabric.entities.core.entity_reader import EntityReader, EntityResult
 from bfabric.entities.core.uri import EntityUri
+from bfabric.results.result_container import ResultContainer
 
 
 @pytest.fixture
@@ -151,7 +152,7 @@ class TestReadUris:
 
         assert result == {uri_project_1: mock_entity_project_1, uri_project_2: mock_entity_project_2}
         mock_multi_query.read_multi.assert_called_once_with(
-            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100, 200]
+            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100, 200], max_workers=4
         )
         mock_cache_stack.item_put_all.assert_called()
         assert mock_instantiate_entity.call_count == 2
@@ -176,7 +177,7 @@ class TestReadUris:
 
         assert result == {uri_project_1: mock_entity_project_1, uri_project_2: mock_entity_project_2}
         mock_multi_query.read_multi.assert_called_once_with(
-            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[200]
+            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[200], max_workers=4
         )
 
     def test_multiple_entity_types(
@@ -193,7 +194,7 @@ class TestReadUris:
         """Test reading URIs of different entity types in a single call."""
         mock_cache_stack.item_get_all.return_value = {}
 
-        def multi_query_side_effect(endpoint, obj, multi_query_key, multi_query_vals):
+        def multi_query_side_effect(endpoint, obj, multi_query_key, multi_query_vals, max_workers):
             if endpoint == "project":
                 return [{"id": 100, "classname": "project", "name": "Project 1"}]
             elif endpoint == "user":
@@ -284,7 +285,7 @@ class TestReadId:
 
         assert result == mock_entity_project_1
         mock_multi_query.read_multi.assert_called_once_with(
-            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100]
+            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100], max_workers=4
         )
 
     def test_read_missing_entity_returns_none(
@@ -342,7 +343,7 @@ class TestReadIds:
 
         assert result == {uri_project_1: mock_entity_project_1, uri_project_2: mock_entity_project_2}
         mock_multi_query.read_multi.assert_called_once_with(
-            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100, 200]
+            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100, 200], max_workers=4
         )
 
     def test_accepts_entity_class(
@@ -371,7 +372,7 @@ class TestReadIds:
 
         assert result == {uri_project_1: project}
         mock_multi_query.read_multi.assert_called_once_with(
-            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100]
+            endpoint="project", obj={}, multi_query_key="id", multi_query_vals=[100], max_workers=4
         )
 
     def test_some_missing_entities(
@@ -648,3 +649,66 @@ class TestEntityResult:
 
     def test_present_all_missing(self, uri):
         assert EntityResult({uri(1): None, uri(2): None}).present == []
+
+
+class TestPrefetch:
+    @pytest.fixture
+    def mock_client(self, mock_client):
+        def read(endpoint, obj, max_results=100, **kwargs):
+            results = []
+            for id in obj["id"]:
+                if id == 404:
+                    continue
+                result = {"id": id, "classname": endpoint, "name": f"{endpoint} {id}"}
+                if endpoint == "workunit":
+                    result["application"] = {"id": id // 10, "classname": "application"}
+                results.append(result)
+            return ResultContainer(results, total_pages_api=1, errors=[])
+
+        mock_client.read.side_effect = read
+        return mock_client
+
+    @pytest.fixture
+    def resources(self, mock_client, bfabric_instance):
+        def _resource(resource_id: int, sample_id: int, workunit_id: int) -> Entity:
+            data_dict = {
+                "id": resource_id,
+                "classname": "resource",
+                "sample": {"id": sample_id, "classname": "sample"},
+                "workunit": {"id": workunit_id, "classname": "workunit"},
+            }
+            return Entity(data_dict, client=mock_client, bfabric_instance=bfabric_instance)
+
+        return [_resource(1, 10, 100), _resource(2, 20, 100), _resource(3, 404, 110)]
+
+    @staticmethod
+    def _reads(mock_client) -> list[tuple[str, list[int]]]:
+        return [(call.args[0], call.args[1]["id"]) for call in mock_client.read.mock_calls]
+
+    def test_prefetch(self, entity_reader, mock_client, resources):
+        entity_reader.prefetch(resources, ["sample", "workunit.application"])
+        assert sorted(self._reads(mock_client)) == [
+            ("application", [10, 11]),
+            ("sample", [10, 20, 404]),
+            ("workunit", [100, 110]),
+        ]
+        mock_client.read.reset_mock()
+
+        assert [resource.refs.workunit.refs.application.id for resource in resources] == [10, 10, 11]
+        assert [resource.refs.sample["name"] for resource in resources[:2]] == ["sample 10", "sample 20"]
+        mock_client.read.assert_not_called()
+
+    def test_prefetch_when_reference_not_found(self, entity_reader, mock_client, resources):
+        entity_reader.prefetch(resources, ["sample"])
+        assert not resources[2].refs.is_loaded("sample")
+        with pytest.raises(ValueError, match="Entity not found"):
+            resources[2].refs.get("sample")
+
+    def test_prefetch_when_already_loaded(self, entity_reader, mock_client, resources):
+        entity_reader.prefetch(resources, ["workunit"])
+        entity_reader.prefetch(resources, ["workunit", "workunit.application"])
+        assert sorted(self._reads(mock_client)) == [("application", [10, 11]), ("workunit", [100, 110])]
+
+    def test_prefetch_when_reference_missing(self, entity_reader, mock_client, resources):
+        entity_reader.prefetch(resources, ["container", "sample.container"])
+        assert self._reads(mock_client) == [("sample", [10, 20, 404])]
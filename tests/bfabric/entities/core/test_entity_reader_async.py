@@ -0,0 +1,86 @@
+import pytest
+
+from bfabric import AsyncBfabric
+from bfabric.entities.cache.context import cache_entities
+from bfabric.entities.core.entity import Entity
+from bfabric.entities.core.entity_reader_async import AsyncEntityReader
+from bfabric.entities.core.uri import EntityUri
+from bfabric.results.result_container import ResultContainer
+
+
+@pytest.fixture
+def mock_async_client(mocker, bfabric_instance):
+    client = mocker.MagicMock(spec=AsyncBfabric, config=mocker.MagicMock(base_url=bfabric_instance))
+
+    async def read(endpoint, obj, max_results=100):
+        ids = obj.get("id", [])
+        results = [{"id": id, "classname": endpoint, "name": f"{endpoint} {id}"} for id in ids if id != 404]
+        if "name" in obj:
+            results = [{"id": 1, "classname": endpoint, "name": obj["name"]}]
+        return ResultContainer(results, total_pages_api=1, errors=[])
+
+    client.read = mocker.AsyncMock(side_effect=read)
+    return client
+
+
+@pytest.fixture
+def reader(mock_async_client):
+    return AsyncEntityReader.for_client(client=mock_async_client)
+
+
+async def test_read_ids(reader, mock_async_client, bfabric_instance):
+    result = await reader.read_ids("project", [100, 404, 200])
+    assert list(result) == [
+        EntityUri(f"{bfabric_instance}project/show.html?id=100"),
+        EntityUri(f"{bfabric_instance}project/show.html?id=404"),
+        EntityUri(f"{bfabric_instance}project/show.html?id=200"),
+    ]
+    assert [entity.id if entity else None for entity in result.values()] == [100, None, 200]
+    assert all(entity is None or entity._client is None for entity in result.values())
+    mock_async_client.read.assert_awaited_once_with("project", {"id": [100, 404, 200]}, max_results=None)
+
+
+async def test_read_ids_when_more_than_query_limit(reader, mock_async_client):
+    result = await reader.read_ids("sample", list(range(1, 251)))
+    assert len(result.present) == 250
+    assert [call.args[1]["id"] for call in mock_async_client.read.await_args_list] == [
+        list(range(1, 101)),
+        list(range(101, 201)),
+        list(range(201, 251)),
+    ]
+
+
+async def test_read_uris_when_multiple_types(reader, mock_async_client, bfabric_instance):
+    uris = [f"{bfabric_instance}project/show.html?id=100", f"{bfabric_instance}user/show.html?id=1"]
+    result = await reader.read_uris(uris)
+    assert [entity.classname for entity in result.present] == ["project", "user"]
+    assert mock_async_client.read.await_count == 2
+
+
+async def test_read_uris_when_wrong_instance(reader, mock_async_client):
+    with pytest.raises(ValueError, match="Unsupported B-Fabric instances"):
+        await reader.read_uri("https://other-instance.example.org/bfabric/project/show.html?id=100")
+    mock_async_client.read.assert_not_awaited()
+
+
+async def test_read_uris_uses_cache(reader, mock_async_client):
+    with cache_entities("project"):
+        first = await reader.read_id("project", 100)
+        second = await reader.read_id("project", 100)
+    assert second is first
+    mock_async_client.read.assert_awaited_once()
+
+
+async def test_read_id_when_expected_type_mismatch(reader):
+    class Other(Entity):
+        pass
+
+    with pytest.raises(ValueError, match="Unexpected entity type"):
+        await reader.read_id("project", 100, expected_type=Other)
+
+
+async def test_query_one(reader, mock_async_client):
+    entity = await reader.query_one("project", {"name": "My project"})
+    assert entity.id == 1
+    assert entity["name"] == "My project"
+    mock_async_client.read.assert_awaited_once_with("project", obj={"name": "My project"}, max_results=1)
@@ -1,6 +1,9 @@
+import time
+
 import pytest
 
 from bfabric.bfabric import Bfabric
+from bfabric.errors import BfabricRequestError
 from bfabric.experimental.multi_query import MultiQuery, _count_query_elements
 from bfabric.results.result_container import ResultContainer
 
@@ -27,12 +30,14 @@ class TestReadMulti:
                 {"containerid": 5, "relativepath": values[:99]},
                 max_results=None,
                 return_id_only=False,
+                check=False,
             ),
             mocker.call(
                 "importresource",
                 {"containerid": 5, "relativepath": values[99:]},
                 max_results=None,
                 return_id_only=False,
+                check=False,
             ),
         ]
 
@@ -40,7 +45,7 @@ class TestReadMulti:
         values = list(range(100))
         multi_query.read_multi("project", {}, "id", values)
         assert mock_client.read.mock_calls == [
-            mocker.call("project", {"id": values}, max_results=None, return_id_only=False)
+            mocker.call("project", {"id": values}, max_results=None, return_id_only=False, check=False)
         ]
 
     def test_list_valued_field_reserves_one_element_per_value(self, mock_client, multi_query):
@@ -82,6 +87,74 @@ class TestReadMulti:
         multi_query.read_multi("project", {}, "id", [1], return_id_only=True)
         assert mock_client.read.mock_calls[0].kwargs["return_id_only"]
 
+    def test_concurrent_chunks_keep_order(self, mock_client, multi_query):
+        def read(endpoint, query, **kwargs):
+            # the first chunks finish last
+            time.sleep(0.02 if query["id"][0] < 200 else 0)
+            return ResultContainer([{"id": value} for value in query["id"]], total_pages_api=1, errors=[])
+
+        mock_client.read.side_effect = read
+        result = multi_query.read_multi("project", {}, "id", list(range(450)), max_workers=4)
+        assert [item["id"] for item in result] == list(range(450))
+        assert mock_client.read.call_count == 5
+
+    def test_aggregates_errors_of_all_chunks(self, mock_client, multi_query):
+        mock_client.read.side_effect = lambda endpoint, query, **kwargs: ResultContainer(
+            [], total_pages_api=1, errors=[BfabricRequestError(f"failed at {query['id'][0]}")]
+        )
+        with pytest.raises(BfabricRequestError, match="failed at 0; failed at 100; failed at 200"):
+            multi_query.read_multi("project", {}, "id", list(range(250)), max_workers=2)
+        assert mock_client.read.call_count == 3
+
+    def test_returns_errors_when_not_checked(self, mock_client, multi_query):
+        mock_client.read.side_effect = lambda endpoint, query, **kwargs: ResultContainer(
+            [], total_pages_api=1, errors=[BfabricRequestError("failed")]
+        )
+        result = multi_query.read_multi("project", {}, "id", list(range(150)), check=False)
+        assert len(result.errors) == 2
+
+    def test_raises_when_invalid_max_workers(self, mock_client, multi_query):
+        with pytest.raises(ValueError, match="max_workers must be at least 1, got 0"):
+            multi_query.read_multi("project", {}, "id", [1], max_workers=0)
+        mock_client.read.assert_not_called()
+
+
+class TestDeleteMulti:
+    def test_deletes_in_chunks(self, mock_client, multi_query):
+        mock_client.delete.side_effect = lambda endpoint, ids, **kwargs: ResultContainer(
+            [{"id": id} for id in ids], total_pages_api=0, errors=[]
+        )
+        result = multi_query.delete_multi("sample", list(range(250)), max_workers=3)
+        assert [item["id"] for item in result] == list(range(250))
+        assert sorted(call.args[1] for call in mock_client.delete.mock_calls) == [
+            list(range(100)),
+            list(range(100, 200)),
+            list(range(200, 250)),
+        ]
+        assert all(call.kwargs == {"check": False} for call in mock_client.delete.mock_calls)
+
+    def test_aggregates_errors_of_all_chunks(self, mock_client, multi_query):
+        mock_client.delete.side_effect = lambda endpoint, ids, **kwargs: ResultContainer(
+            [], total_pages_api=0, errors=[BfabricRequestError(f"cannot delete {ids[0]}")]
+        )
+        with pytest.raises(BfabricRequestError, match="cannot delete 0; cannot delete 100"):
+            multi_query.delete_multi("sample", list(range(150)), max_workers=2)
+
+    def test_empty_list_makes_no_requests(self, mock_client, multi_query):
+        result = multi_query.delete_multi("sample", [])
+        mock_client.delete.assert_not_called()
+        assert len(result) == 0
+
+
+class TestExistsMulti:
+    def test_exists_multi(self, mock_client, multi_query):
+        mock_client.read.side_effect = lambda endpoint, query, **kwargs: ResultContainer(
+            [{"id": value} for value in query["id"] if value % 2 == 0], total_pages_api=1, errors=[]
+        )
+        result = multi_query.exists_multi("sample", "id", list(range(150)), max_workers=2)
+        assert result == [value % 2 == 0 for value in range(150)]
+        assert mock_client.read.call_count == 2
+
 
 class TestCountQueryElements:
     @pytest.mark.parametrize(
@@ -8,6 +8,7 @@ are touched. The tests exercise the orchestration and the failure-cleanup path.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import pytest
@@ -722,6 +723,102 @@ class TestUrlCallback:
         assert mock_send.call_args.kwargs["on_url"] is None
 
 
+class TestConcurrentTransfers:
+    @pytest.fixture
+    def three_files(self, rest):
+        rest.create_resources.return_value = _created("a.txt", "b.txt", "c.txt")
+        rest.get_upload_token.return_value = UploadTokenResult(token="tok", tus_endpoint="https://tus/")
+        return _params("/src/a.txt", "/src/b.txt", "/src/c.txt")
+
+    def test_transfers_files_at_the_same_time(self, mock_client, mock_send, three_files):
+        barrier = threading.Barrier(3, timeout=5)
+        mock_send.side_effect = lambda *args, **kwargs: barrier.wait()
+
+        summary = upload_files(mock_client, three_files, max_workers=3)
+
+        assert [upload.filename for upload in summary.uploads] == ["a.txt", "b.txt", "c.txt"]
+
+    def test_results_keep_the_order_of_the_files(self, mocker, mock_client, mock_send, three_files):
+        def send(sink, path, creds, **kwargs):
+            if path.name == "b.txt":
+                raise TransferError("network hiccup")
+
+        mock_send.side_effect = send
+        on_file_done = mocker.Mock()
+
+        summary = upload_files(mock_client, three_files, max_workers=2, on_file_done=on_file_done)
+
+        assert [upload.filename for upload in summary.uploads] == ["a.txt", "c.txt"]
+        assert [failure.filename for failure in summary.failures] == ["b.txt"]
+        assert sorted(call.args for call in on_file_done.call_args_list) == [
+            ("a.txt", True),
+            ("b.txt", False),
+            ("c.txt", True),
+        ]
+
+    def test_callbacks_are_serialized(self, mock_client, mock_send, three_files):
+        running = threading.Lock()
+        reports = []
+
+        def on_progress(filename, done, total):
+            assert running.acquire(blocking=False), "callbacks overlap"
+            threading.Event().wait(0.01)
+            reports.append((filename, done))
+            running.release()
+
+        def send(sink, path, creds, **kwargs):
+            for done in (1, 2):
+                kwargs["on_progress"](done, 2)
+
+        mock_send.side_effect = send
+
+        upload_files(mock_client, three_files, max_workers=3, on_progress=on_progress)
+
+        assert sorted(reports) == [(name, done) for name in ("a.txt", "b.txt", "c.txt") for done in (1, 2)]
+
+    def test_unexpected_error_propagates(self, mock_client, mock_send, three_files):
+        mock_send.side_effect = RuntimeError("bug")
+
+        with pytest.raises(RuntimeError, match="bug"):
+            upload_files(mock_client, three_files, max_workers=2)
+
+        assert _status_updates(mock_client) == ["failed"]
+
+    def test_token_minted_again_before_it_expires(self, mock_client, rest, mock_send, three_files):
+        rest.get_upload_token.side_effect = [
+            UploadTokenResult(token=f"tok-{i}", tus_endpoint="https://tus/", expires_in=60) for i in range(4)
+        ]
+
+        upload_files(mock_client, three_files)
+
+        assert [call.args[0].token.get_secret_value() for call in mock_send.call_args_list] == [
+            "tok-1",
+            "tok-2",
+            "tok-3",
+        ]
+
+    def test_bandwidth_limit(self, mocker, mock_client, mock_send, three_files):
+        sleep = mocker.patch("bfabric.operations.workunit.upload.time.sleep")
+        mocker.patch("bfabric.operations.workunit.upload.time.monotonic", return_value=100.0)
+        mock_send.side_effect = lambda sink, path, creds, **kwargs: kwargs["on_progress"](500, 500)
+
+        upload_files(mock_client, three_files, max_bytes_per_second=1000)
+
+        assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0, 1.5]
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_workers": 0}, "max_workers must be at least 1, got 0"),
+            ({"max_bytes_per_second": 0}, "max_bytes_per_second must be positive, got 0"),
+        ],
+    )
+    def test_invalid_arguments(self, mock_client, rest, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            upload_files(mock_client, _params("/src/a.txt"), **kwargs)
+        rest.create_resources.assert_not_called()
+
+
 class TestPreflight:
     """Fail-fast checks that run before any workunit is created."""
 
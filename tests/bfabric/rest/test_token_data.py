@@ -6,7 +6,7 @@ import httpx
 from pydantic import SecretStr, ValidationError
 
 from bfabric.errors import BfabricTokenExpiredError, BfabricTokenInvalidError
-from bfabric.rest.token_data import TokenData, get_token_data, get_token_data_async
+from bfabric.rest.token_data import TokenData, get_token_data, get_token_data_async, validate_token
 
 
 @pytest.fixture
@@ -174,3 +174,17 @@ def test_get_token_data(mocker, token_data, base_url):
     call_args = mock_get_token_data_async.call_args
     assert call_args.kwargs["base_url"] == base_url
     assert call_args.kwargs["token"] == "mock-token"
+
+
+@pytest.mark.asyncio
+async def test_validate_token_with_cache(mocker, token_data, base_url):
+    settings = mocker.Mock(validation_bfabric_instance=base_url, supported_bfabric_instances=[token_data.caller])
+    mock_cache = mocker.AsyncMock()
+    mock_cache.get_token_data.return_value = token_data
+    mock_get_token_data_async = mocker.patch("bfabric.rest.token_data.get_token_data_async")
+
+    result = await validate_token(token="mock-token", settings=settings, cache=mock_cache)
+
+    assert result == token_data
+    mock_cache.get_token_data.assert_called_once_with(base_url=base_url, token="mock-token")
+    mock_get_token_data_async.assert_not_called()
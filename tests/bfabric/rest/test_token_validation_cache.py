@@ -0,0 +1,150 @@
+import asyncio
+import datetime
+
+import pytest
+from pydantic import SecretStr
+
+from bfabric.errors import BfabricTokenInvalidError
+from bfabric.rest.token_validation_cache import TokenValidationCache
+from bfabric.rest.token_data import TokenData
+
+BASE_URL = "https://example.com/mock-base-url"
+
+
+def _token_data(expires_in: datetime.timedelta) -> TokenData:
+    return TokenData(
+        job_id=1,
+        application_id=2,
+        entity_class="Dataset",
+        entity_id=3,
+        user="user",
+        user_ws_password="password",
+        token_expires=datetime.datetime.now(datetime.timezone.utc) + expires_in,
+        web_service_user="true",
+        caller="https://example.com/mock-caller",
+        environment="mock",
+    )
+
+
+@pytest.fixture
+def token_data() -> TokenData:
+    return _token_data(datetime.timedelta(hours=1))
+
+
+@pytest.fixture
+def mock_get_token_data_async(mocker, token_data):
+    return mocker.patch("bfabric.rest.token_validation_cache.get_token_data_async", return_value=token_data)
+
+
+@pytest.fixture
+def http_client(mocker):
+    return mocker.Mock(name="http_client")
+
+
+@pytest.fixture
+def cache(http_client) -> TokenValidationCache:
+    return TokenValidationCache(max_entries=2, max_age=60.0, http_client=http_client)
+
+
+@pytest.mark.asyncio
+async def test_get_token_data(cache, token_data, mock_get_token_data_async, http_client):
+    assert await cache.get_token_data(BASE_URL, "token") == token_data
+    assert await cache.get_token_data(BASE_URL, SecretStr("token")) == token_data
+    mock_get_token_data_async.assert_called_once_with(base_url=BASE_URL, token="token", http_client=http_client)
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_when_different_tokens(cache, mock_get_token_data_async):
+    _ = await cache.get_token_data(BASE_URL, "token1")
+    _ = await cache.get_token_data(BASE_URL, "token2")
+    _ = await cache.get_token_data("https://other.example.com", "token1")
+    assert mock_get_token_data_async.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_when_token_expired(cache, mock_get_token_data_async):
+    mock_get_token_data_async.return_value = _token_data(datetime.timedelta(seconds=-1))
+    _ = await cache.get_token_data(BASE_URL, "token")
+    _ = await cache.get_token_data(BASE_URL, "token")
+    assert mock_get_token_data_async.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_when_max_age_exceeded(cache, mock_get_token_data_async, mocker):
+    mock_time = mocker.patch("bfabric.rest.token_validation_cache.time.time", return_value=1000.0)
+    mock_get_token_data_async.return_value = _token_data(datetime.timedelta(days=365))
+    _ = await cache.get_token_data(BASE_URL, "token")
+    mock_time.return_value = 1059.0
+    _ = await cache.get_token_data(BASE_URL, "token")
+    assert mock_get_token_data_async.call_count == 1
+    mock_time.return_value = 1061.0
+    _ = await cache.get_token_data(BASE_URL, "token")
+    assert mock_get_token_data_async.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_evicts_least_recently_used(cache, mock_get_token_data_async):
+    for token in ["token1", "token2", "token1", "token3", "token1", "token2"]:
+        _ = await cache.get_token_data(BASE_URL, token)
+    assert [call.kwargs["token"] for call in mock_get_token_data_async.call_args_list] == [
+        "token1",
+        "token2",
+        "token3",
+        "token2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_when_invalid(cache, token_data, mock_get_token_data_async):
+    mock_get_token_data_async.side_effect = [BfabricTokenInvalidError(), token_data]
+    with pytest.raises(BfabricTokenInvalidError):
+        await cache.get_token_data(BASE_URL, "token")
+    assert await cache.get_token_data(BASE_URL, "token") == token_data
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_coalesces_concurrent_validations(cache, token_data, mocker):
+    release = asyncio.Event()
+
+    async def get_token_data_async(**kwargs):
+        await release.wait()
+        return token_data
+
+    mock = mocker.patch("bfabric.rest.token_validation_cache.get_token_data_async", side_effect=get_token_data_async)
+    tasks = [asyncio.create_task(cache.get_token_data(BASE_URL, "token")) for _ in range(3)]
+    await asyncio.sleep(0)
+    _ = tasks[0].cancel()
+    release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [token_data, token_data]
+    mock.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_token_data_creates_pooled_http_client(mock_get_token_data_async):
+    cache = TokenValidationCache()
+    _ = await cache.get_token_data(BASE_URL, "token1")
+    _ = await cache.get_token_data(BASE_URL, "token2")
+    http_clients = [call.kwargs["http_client"] for call in mock_get_token_data_async.call_args_list]
+    assert http_clients[0] is not None
+    assert http_clients[0] is http_clients[1]
+    await cache.aclose()
+    assert http_clients[0].is_closed
+
+
+def test_get_token_data_when_event_loop_changed(mock_get_token_data_async):
+    cache = TokenValidationCache()
+    _ = asyncio.run(cache.get_token_data(BASE_URL, "token1"))
+    _ = asyncio.run(cache.get_token_data(BASE_URL, "token2"))
+    first, second = [call.kwargs["http_client"] for call in mock_get_token_data_async.call_args_list]
+    assert first is not second
+    assert first.is_closed
+    assert not second.is_closed
+    asyncio.run(cache.aclose())
+    assert second.is_closed
+
+
+def test_init_when_invalid():
+    with pytest.raises(ValueError, match="max_entries must be at least 1"):
+        TokenValidationCache(max_entries=0)
@@ -10,7 +10,10 @@ from bfabric.config import DEFAULT_CONFIG_FILE
 from bfabric.config.bfabric_auth import OAUTH_LOGIN
 from bfabric.config.config_data import ConfigData
 from bfabric.engine.engine_suds import EngineSUDS
+from bfabric.engine.engine_xml import EngineXML
 from bfabric.entities.core.entity_reader import EntityReader
+from bfabric.errors import BfabricRequestError
+from bfabric.results.result_container import ResultContainer
 
 # The core OAuth API no longer bakes in a default scope; tests pass it explicitly.
 _TEST_SCOPE = "api:read api:write"
@@ -177,6 +180,18 @@ def test_with_auth(mocker, bfabric_instance):
     assert bfabric_instance.auth == mock_old_auth
 
 
+def test_for_auth(mock_engine, mock_auth, bfabric_instance):
+    bfabric_instance._engine = mock_engine
+
+    client = bfabric_instance.for_auth(mock_auth)
+
+    assert client.auth == mock_auth
+    assert client.config == bfabric_instance.config
+    assert client._engine is mock_engine
+    with pytest.raises(ValueError, match="Authentication not available"):
+        _ = bfabric_instance.auth
+
+
 def test_with_auth_when_exception(mocker, bfabric_instance):
     mock_old_auth = mocker.MagicMock(name="mock_old_auth")
     mock_new_auth = mocker.MagicMock(name="mock_new_auth")
@@ -268,6 +283,87 @@ def test_read_when_pages_available_and_check(bfabric_instance, mocker):
     assert result[5] == 10
 
 
+def test_read_when_pages_available_and_max_workers(bfabric_instance, mocker):
+    bfabric_instance._auth = mocker.MagicMock(name="mock_auth")
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    page_items = {page: [f"{page}.{i}" for i in range(100)] for page in range(1, 5)}
+    mock_engine.read.side_effect = lambda **kwargs: ResultContainer(
+        page_items[kwargs["page"]], total_pages_api=4, errors=[f"error {kwargs['page']}"]
+    )
+
+    result = bfabric_instance.read(endpoint="mock_endpoint", obj={}, max_results=None, check=False, max_workers=3)
+
+    assert sorted(call.kwargs["page"] for call in mock_engine.read.mock_calls) == [1, 2, 3, 4]
+    assert result.results == [item for page in range(1, 5) for item in page_items[page]]
+    assert result.errors == ["error 1", "error 2", "error 3", "error 4"]
+    assert result.total_pages_api == 4
+
+
+def test_read_when_pages_available_and_max_workers_with_offset(bfabric_instance, mocker):
+    bfabric_instance._auth = mocker.MagicMock(name="mock_auth")
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    page_items = {page: list(range((page - 1) * 100, page * 100)) for page in range(1, 5)}
+    mock_engine.read.side_effect = lambda **kwargs: ResultContainer(
+        page_items[kwargs["page"]], total_pages_api=4, errors=[]
+    )
+
+    result = bfabric_instance.read(endpoint="mock_endpoint", obj={}, max_results=150, offset=120, max_workers=4)
+
+    assert sorted(call.kwargs["page"] for call in mock_engine.read.mock_calls) == [1, 2, 3]
+    assert result.results == list(range(120, 270))
+
+
+def test_read_when_invalid_max_workers(bfabric_instance, mocker):
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        bfabric_instance.read(endpoint="mock_endpoint", obj={}, max_workers=0)
+    mock_engine.read.assert_not_called()
+
+
+def test_iter_read_when_no_pages_available(bfabric_instance, mocker):
+    bfabric_instance._auth = mocker.MagicMock(name="mock_auth")
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    mock_engine.read.return_value = ResultContainer([], total_pages_api=0, errors=[])
+
+    pages = list(bfabric_instance.iter_read(endpoint="mock_endpoint", obj={}))
+
+    assert len(pages) == 1
+    assert pages[0].results == []
+    mock_engine.read.assert_called_once()
+
+
+def test_iter_read_when_pages_available(bfabric_instance, mocker):
+    bfabric_instance._auth = mocker.MagicMock(name="mock_auth")
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    page_items = {page: list(range((page - 1) * 100, page * 100)) for page in range(1, 5)}
+    mock_engine.read.side_effect = lambda **kwargs: ResultContainer(
+        page_items[kwargs["page"]], total_pages_api=4, errors=[]
+    )
+
+    pages = bfabric_instance.iter_read(endpoint="mock_endpoint", obj={}, max_results=150, offset=120)
+
+    first_page = next(pages)
+    assert first_page.results == list(range(120, 200))
+    assert first_page.total_pages_api == 4
+    assert [call.kwargs["page"] for call in mock_engine.read.mock_calls] == [1, 2]
+    assert [page.results for page in pages] == [list(range(200, 270))]
+    assert [call.kwargs["page"] for call in mock_engine.read.mock_calls] == [1, 2, 3]
+
+
+def test_iter_read_when_error_and_check(bfabric_instance, mocker):
+    bfabric_instance._auth = mocker.MagicMock(name="mock_auth")
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    mock_engine.read.side_effect = lambda **kwargs: ResultContainer(
+        [1] * 100, total_pages_api=2, errors=[BfabricRequestError("failed")] if kwargs["page"] == 2 else []
+    )
+
+    pages = bfabric_instance.iter_read(endpoint="mock_endpoint", obj={}, max_results=None)
+
+    assert len(next(pages)) == 100
+    with pytest.raises(BfabricRequestError, match="failed"):
+        next(pages)
+
+
 def test_save_when_no_auth(bfabric_instance, mocker):
     mock_engine = mocker.patch.object(bfabric_instance, "_engine")
 
@@ -446,7 +542,10 @@ def test_repr(bfabric_instance, variant):
     assert (
         variant(bfabric_instance) == "Bfabric(config_data=ConfigData("
         "client=BfabricClientConfig(base_url='https://example.com/api/', application_ids={}, "
-        "job_notification_emails='', engine=BfabricAPIEngineType.SUDS), auth=None, "
+        "job_notification_emails='', engine=BfabricAPIEngineType.SUDS, wsdl_cache_ttl=datetime.timedelta(days=1), "
+        "http=BfabricHttpConfig(max_connections=20, max_keepalive_connections=20, "
+        "keepalive_expiry=datetime.timedelta(seconds=15), timeout=datetime.timedelta(seconds=90), http2=False)), "
+        "auth=None, "
         "auth_method=None, client_id=None, env_name=None))"
     )
 
@@ -827,3 +926,31 @@ class TestPickling:
         restored = pickle.loads(pickle.dumps(client))  # noqa: S301
         assert restored._credential_provider is None
         assert restored.auth.login == "user"
+
+
+def test_engine_when_suds(bfabric_instance):
+    assert isinstance(bfabric_instance._engine, EngineSUDS)
+
+
+def test_engine_when_xml(mock_config):
+    config = mock_config.model_copy(update={"engine": BfabricAPIEngineType.XML})
+    client = Bfabric(config_data=ConfigData(client=config, auth=None))
+    assert isinstance(client._engine, EngineXML)
+
+
+def test_connection_stats(mocker, bfabric_instance):
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    assert bfabric_instance.connection_stats == mock_engine.connection_stats
+
+
+def test_close(mocker, bfabric_instance):
+    mock_engine = mocker.patch.object(bfabric_instance, "_engine")
+    with bfabric_instance as client:
+        assert client is bfabric_instance
+    mock_engine.close.assert_called_once_with()
+
+
+def test_close_when_engine_not_created(mocker, bfabric_instance):
+    mock_engine_suds = mocker.patch("bfabric.bfabric.EngineSUDS")
+    bfabric_instance.close()
+    mock_engine_suds.assert_not_called()
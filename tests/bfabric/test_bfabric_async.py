@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from bfabric import AsyncBfabric, BfabricAuth, BfabricClientConfig
+from bfabric.config.config_data import ConfigData
+from bfabric.engine.engine_xml import AsyncEngineXML
+from bfabric.entities.core.entity_reader_async import AsyncEntityReader
+from bfabric.errors import BfabricRequestError
+from bfabric.results.result_container import ResultContainer
+
+
+@pytest.fixture
+def mock_config():
+    return BfabricClientConfig(base_url="https://example.com/api/")
+
+
+@pytest.fixture
+def mock_auth():
+    return BfabricAuth(login="_test_user", password="y" * 32)
+
+
+@pytest.fixture
+def mock_engine(mocker):
+    return mocker.AsyncMock(name="mock_engine", spec=AsyncEngineXML)
+
+
+@pytest.fixture
+def client(mock_config, mock_auth, mock_engine):
+    return AsyncBfabric(config_data=ConfigData(client=mock_config, auth=mock_auth), _engine=mock_engine)
+
+
+def _page(i_page: int, n_pages: int = 3, n_items: int = 100) -> ResultContainer:
+    return ResultContainer([{"id": (i_page - 1) * 100 + i} for i in range(n_items)], total_pages_api=n_pages, errors=[])
+
+
+def test_init_creates_engine(mocker, mock_config, mock_auth):
+    mock_engine_class = mocker.patch("bfabric.bfabric_async.AsyncEngineXML")
+    client = AsyncBfabric(config_data=ConfigData(client=mock_config, auth=mock_auth), max_connections=5)
+    assert client._engine == mock_engine_class.return_value
+    mock_engine_class.assert_called_once_with(
+        base_url="https://example.com/api/", http_config=mock_config.http.model_copy(update={"max_connections": 5})
+    )
+
+
+def test_init_creates_engine_with_http_config(mocker, mock_config, mock_auth):
+    mock_engine_class = mocker.patch("bfabric.bfabric_async.AsyncEngineXML")
+    _ = AsyncBfabric(config_data=ConfigData(client=mock_config, auth=mock_auth))
+    mock_engine_class.assert_called_once_with(base_url="https://example.com/api/", http_config=mock_config.http)
+
+
+def test_auth_when_missing(mock_config, mock_engine):
+    client = AsyncBfabric(config_data=ConfigData(client=mock_config, auth=None), _engine=mock_engine)
+    with pytest.raises(ValueError, match="Authentication not available"):
+        _ = client.auth
+
+
+def test_with_auth(client, mock_engine):
+    other_auth = BfabricAuth(login="other_user", password="z" * 32)
+    other = client.with_auth(other_auth)
+    assert other.auth == other_auth
+    assert client.auth.login == "_test_user"
+    assert other._engine is mock_engine
+    assert other.reader._client is other
+
+
+def test_reader(client):
+    assert isinstance(client.reader, AsyncEntityReader)
+
+
+async def test_read_when_no_pages_available(client, mock_engine, mock_auth):
+    mock_engine.read.return_value = ResultContainer([{"id": 1}], total_pages_api=0, errors=[])
+    result = await client.read("sample", {"name": "x"})
+    assert result.to_list_dict() == [{"id": 1}]
+    mock_engine.read.assert_awaited_once_with(
+        endpoint="sample", obj={"name": "x"}, auth=mock_auth, page=1, return_id_only=False
+    )
+
+
+async def test_read_when_pages_available(client, mock_engine):
+    mock_engine.read.side_effect = lambda **kwargs: _page(kwargs["page"])
+    result = await client.read("sample", {}, max_results=250, offset=30)
+    assert [item["id"] for item in result] == list(range(30, 280))
+    assert [call.kwargs["page"] for call in mock_engine.read.await_args_list] == [1, 2, 3]
+
+
+async def test_read_concurrency(client, mock_engine):
+    n_running = 0
+    max_running = 0
+
+    async def read(**kwargs):
+        nonlocal n_running, max_running
+        n_running += 1
+        max_running = max(max_running, n_running)
+        await asyncio.sleep(0.01)
+        n_running -= 1
+        return _page(kwargs["page"], n_pages=6)
+
+    mock_engine.read.side_effect = read
+    result = await client.read("sample", {}, max_results=None, max_concurrency=2)
+    assert [item["id"] for item in result] == list(range(600))
+    assert max_running == 2
+
+
+async def test_read_when_invalid_max_concurrency(client):
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1, got 0"):
+        await client.read("sample", {}, max_concurrency=0)
+
+
+async def test_read_when_error_and_check(client, mock_engine):
+    mock_engine.read.return_value = ResultContainer([], total_pages_api=0, errors=[BfabricRequestError("fail")])
+    with pytest.raises(RuntimeError):
+        await client.read("sample", {})
+
+
+async def test_iter_read(client, mock_engine):
+    mock_engine.read.side_effect = lambda **kwargs: _page(kwargs["page"])
+    pages = [page async for page in client.iter_read("sample", {}, max_results=150, offset=20)]
+    assert [len(page) for page in pages] == [80, 70]
+    assert pages[0][0]["id"] == 20
+    assert pages[1][-1]["id"] == 169
+
+
+async def test_save(client, mock_engine, mock_auth):
+    mock_engine.save.return_value = ResultContainer([{"id": 1}], total_pages_api=0, errors=[])
+    result = await client.save("sample", {"name": "x"})
+    assert result.to_list_dict() == [{"id": 1}]
+    mock_engine.save.assert_awaited_once_with(endpoint="sample", obj={"name": "x"}, auth=mock_auth, method="save")
+
+
+async def test_delete(client, mock_engine, mock_auth):
+    mock_engine.delete.return_value = ResultContainer([{"id": 1}], total_pages_api=0, errors=[])
+    await client.delete("sample", 1)
+    mock_engine.delete.assert_awaited_once_with(endpoint="sample", id=1, auth=mock_auth)
+
+
+@pytest.mark.parametrize("results, expected", [([{"id": 1}], True), ([], False)])
+async def test_exists(client, mock_engine, results, expected):
+    mock_engine.read.return_value = ResultContainer(results, total_pages_api=0, errors=[])
+    assert await client.exists("sample", "name", "x", query={"container": 1}) is expected
+    assert mock_engine.read.await_args.kwargs["obj"] == {"container": 1, "name": "x"}
+    assert mock_engine.read.await_args.kwargs["return_id_only"] is True
+
+
+async def test_async_context_manager(client, mock_engine):
+    async with client as entered:
+        assert entered is client
+    mock_engine.aclose.assert_awaited_once_with()
+
+
+async def test_connect_token_async(mocker):
+    token_data = mocker.MagicMock(caller="https://example.com/api/", user="user", user_ws_password="p" * 32)
+    mock_validate = mocker.patch("bfabric.bfabric_async.validate_token", return_value=token_data)
+    settings = mocker.MagicMock(name="settings")
+    client, data = await AsyncBfabric.connect_token_async(token="token", settings=settings)
+    assert data is token_data
+    assert client.auth.login == "user"
+    assert client.config.base_url == "https://example.com/api/"
+    mock_validate.assert_awaited_once_with(token="token", settings=settings)
+
+
+def test_connect(mocker, mock_config, mock_auth):
+    mocker.patch("bfabric.bfabric_async.load_config_data", return_value=ConfigData(client=mock_config, auth=mock_auth))
+    client = AsyncBfabric.connect()
+    assert client.config == mock_config
+    assert client.auth == mock_auth
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+
+import pytest
+
+from bfabric.transfer._generic import fetch
+from bfabric.transfer._generic.cache import FetchCache
+from bfabric.transfer._generic.credentials import Credentials
+from bfabric.transfer._generic.fetch import fetch_to_path
+from bfabric.transfer._generic.sources import TransferSourceLocal
+
+
+def _md5(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FetchCache(cache_dir=tmp_path / "cache", max_bytes=100)
+
+
+@pytest.fixture
+def make_file(tmp_path):
+    def _make(name: str, data: bytes):
+        path = tmp_path / "files" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    return _make
+
+
+def test_materialize_when_missing(cache, tmp_path):
+    assert not cache.materialize(_md5(b"a"), tmp_path / "dest")
+    assert not (tmp_path / "dest").exists()
+
+
+def test_insert_and_materialize(cache, make_file, tmp_path):
+    source = make_file("a.txt", b"aaaa")
+    cache.insert(_md5(b"aaaa"), source)
+
+    dest = tmp_path / "out" / "a.txt"
+    assert cache.materialize(_md5(b"aaaa"), dest)
+
+    assert dest.read_bytes() == b"aaaa"
+    assert os.path.samefile(dest, source)
+
+
+def test_materialize_when_entry_modified(cache, make_file, tmp_path):
+    source = make_file("a.txt", b"aaaa")
+    cache.insert(_md5(b"aaaa"), source)
+    source.write_bytes(b"modified")
+
+    assert not cache.materialize(_md5(b"aaaa"), tmp_path / "dest")
+    assert not (cache.cache_dir / "objects" / _md5(b"aaaa")[:2] / _md5(b"aaaa")).exists()
+
+
+def test_insert_evicts_least_recently_used(cache, make_file, tmp_path):
+    for name in ("a", "b"):
+        cache.insert(_md5(name.encode()), make_file(name, name.encode() * 40))
+    # "a" was used more recently than "b", so "b" is evicted
+    assert cache.materialize(_md5(b"a"), tmp_path / "a")
+    cache.insert(_md5(b"c"), make_file("c", b"c" * 40))
+
+    assert [name for name in "abc" if cache.materialize(_md5(name.encode()), tmp_path / name)] == ["a", "c"]
+
+
+def test_insert_when_larger_than_cache(cache, make_file, tmp_path):
+    cache.insert(_md5(b"big"), make_file("big", b"x" * 101))
+    assert not cache.materialize(_md5(b"big"), tmp_path / "big")
+
+
+def test_insert_concurrently(cache, make_file, tmp_path):
+    files = {_md5(str(i).encode()): make_file(str(i), str(i).encode()) for i in range(20)}
+    threads = [threading.Thread(target=cache.insert, args=item) for item in files.items()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(cache.materialize(checksum, tmp_path / "out" / checksum) for checksum in files)
+
+
+@pytest.fixture
+def op_cp(mocker):
+    """Copies local files with cp instead of rsync, which is not necessarily installed."""
+    mocker.patch("bfabric.transfer._generic.fetch._operation_copy_rsync", return_value=False)
+    return mocker.spy(fetch, "_operation_copy_cp")
+
+
+def test_fetch_to_path_uses_cache(cache, make_file, tmp_path, op_cp):
+    source = TransferSourceLocal(path=make_file("source.txt", b"payload"))
+    checksum = _md5(b"payload")
+
+    fetch_to_path(source, tmp_path / "first.txt", Credentials(), checksum=checksum, cache=cache)
+    fetch_to_path(source, tmp_path / "second.txt", Credentials(), checksum=checksum, cache=cache)
+
+    op_cp.assert_called_once()
+    assert (tmp_path / "second.txt").read_bytes() == b"payload"
+    assert os.path.samefile(tmp_path / "first.txt", tmp_path / "second.txt")
+
+
+def test_fetch_to_path_without_checksum_skips_cache(cache, make_file, tmp_path, op_cp):
+    source = make_file("source.txt", b"payload")
+    fetch_to_path(TransferSourceLocal(path=source), tmp_path / "dest.txt", Credentials(), cache=cache)
+    assert not cache.cache_dir.exists()
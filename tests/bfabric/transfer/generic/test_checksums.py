@@ -116,3 +116,31 @@ def test_collect_file_infos_dir_excluded_to_empty_raises(tmp_path: Path) -> None
     # silently creating a workunit with no resources.
     with pytest.raises(ValueError):
         collect_file_infos([d], exclude_names={".marker"})
+
+
+@pytest.mark.parametrize("data", [b"", b"some bytes to hash"])
+def test_md5_checksum_use_mmap(tmp_path: Path, data: bytes) -> None:
+    f = tmp_path / "data.bin"
+    f.write_bytes(data)
+
+    assert md5_checksum(f, use_mmap=True) == md5_checksum(f)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_collect_file_infos_keeps_order(tmp_path: Path, max_workers: int, use_mmap: bool) -> None:
+    d = tmp_path / "d"
+    d.mkdir()
+    for i in range(20):
+        (d / f"{i:02d}.txt").write_bytes(str(i).encode() * 1000)
+    (tmp_path / "top.txt").write_bytes(b"t")
+
+    infos = collect_file_infos([tmp_path / "top.txt", d], max_workers=max_workers, use_mmap=use_mmap)
+
+    assert [i.name for i in infos] == ["top.txt", *(f"{i:02d}.txt" for i in range(20))]
+    assert [i.md5 for i in infos] == [md5_checksum(i.path) for i in infos]
+
+
+def test_collect_file_infos_invalid_max_workers(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_workers must be at least 1, got 0"):
+        collect_file_infos([tmp_path], max_workers=0)
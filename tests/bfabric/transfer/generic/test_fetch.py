@@ -11,15 +11,18 @@ import httpx
 import pytest
 from logot import Logot, logged
 
+from bfabric.transfer._generic import fetch
 from bfabric.transfer._generic.credentials import Credentials
 from bfabric.transfer._generic.errors import TransferError
 from bfabric.transfer._generic.fetch import (
+    FetchRequest,
     _operation_copy_cp,
     _operation_copy_http,
     _operation_copy_rsync,
     _operation_copy_scp,
     _operation_link_symbolic,
     _verify_checksum,
+    fetch_many,
     fetch_to_path,
 )
 from bfabric.transfer._generic.sources import (
@@ -328,7 +331,7 @@ class TestFetchToPathDispatch:
 
         fetch_to_path(source, dest, Credentials(token_provider=lambda: "tok"))
 
-        mock_http.assert_called_once_with(source=source, output_path=tmp, bearer_token="tok")
+        mock_http.assert_called_once_with(source=source, output_path=tmp, bearer_token="tok", digest=None)
         op_rsync.assert_not_called()
         assert dest.exists()
 
@@ -480,3 +483,136 @@ class TestFetchToPathChecksum:
         assert not dest.exists()
         # The verification failure must remove only the link, never the source file.
         assert src.read_bytes() == b"payload"
+
+    def test_http_checksum_computed_while_streaming(self, mocker, mock_http_stream, tmp_path):
+        body = b"payload"
+        mock_http_stream(body=body)
+        md5_checksum = mocker.spy(fetch, "md5_checksum")
+        dest = tmp_path / "destination.txt"
+
+        fetch_to_path(
+            TransferSourceHttp(url="https://host/f.txt", auth=None),
+            dest,
+            Credentials(),
+            checksum=hashlib.md5(body).hexdigest(),
+        )
+
+        assert dest.read_bytes() == body
+        md5_checksum.assert_not_called()
+
+    def test_local_checksum_computed_while_copying(self, mocker, tmp_path):
+        op_rsync = mocker.patch("bfabric.transfer._generic.fetch._operation_copy_rsync")
+        md5_checksum = mocker.spy(fetch, "md5_checksum")
+        src = tmp_path / "source.txt"
+        src.write_bytes(b"payload" * 300_000)
+        dest = tmp_path / "destination.txt"
+
+        fetch_to_path(
+            TransferSourceLocal(path=src), dest, Credentials(), checksum=hashlib.md5(src.read_bytes()).hexdigest()
+        )
+
+        assert dest.read_bytes() == src.read_bytes()
+        op_rsync.assert_not_called()
+        md5_checksum.assert_not_called()
+
+
+class TestFetchMany:
+    """fetch_many moves the ssh files of each host with a single rsync call."""
+
+    @pytest.fixture
+    def remote_root(self, tmp_path):
+        root = tmp_path / "remote"
+        for name in ("a.raw", "b.raw", "c.raw"):
+            path = root / "store" / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(name.encode())
+        return root
+
+    @pytest.fixture
+    def mock_rsync(self, mocker, remote_root):
+        """Patches subprocess.run with a stand-in for rsync --files-from, copying from ``remote_root``."""
+
+        def run(cmd, check):
+            files_from = Path(cmd[3].removeprefix("--files-from="))
+            target = Path(cmd[-1])
+            for remote_path in files_from.read_bytes().split(b"\0")[:-1]:
+                source = remote_root / remote_path.decode().lstrip("/")
+                if source.exists():
+                    (target / remote_path.decode().lstrip("/")).parent.mkdir(parents=True, exist_ok=True)
+                    (target / remote_path.decode().lstrip("/")).write_bytes(source.read_bytes())
+            return mocker.MagicMock(returncode=0)
+
+        return mocker.patch("bfabric.transfer._generic.fetch.subprocess.run", side_effect=run)
+
+    @pytest.fixture
+    def mock_fetch_to_path(self, mocker):
+        return mocker.patch("bfabric.transfer._generic.fetch.fetch_to_path")
+
+    @staticmethod
+    def _request(dest: Path, host: str, path: str, checksum: str | None = None) -> FetchRequest:
+        return FetchRequest(source=TransferSourceSsh(host=host, path=path), dest=dest, checksum=checksum)
+
+    def test_batches_by_host(self, mock_rsync, mock_fetch_to_path, tmp_path):
+        out = tmp_path / "out"
+        requests = [
+            self._request(out / "a.raw", "host", "/store/a.raw", checksum=hashlib.md5(b"a.raw").hexdigest()),
+            self._request(out / "sub" / "b.raw", "host", "/store/b.raw"),
+            self._request(out / "c.raw", "other", "/store/c.raw"),
+        ]
+
+        fetch_many(requests, Credentials(ssh_user="user"))
+
+        mock_rsync.assert_called_once()
+        cmd = mock_rsync.call_args.args[0]
+        assert cmd[:3] == ["rsync", "-rltv", "--from0"]
+        assert cmd[-3:-1] == ["--", "user@host:/"]
+        assert (out / "a.raw").read_bytes() == b"a.raw"
+        assert (out / "sub" / "b.raw").read_bytes() == b"b.raw"
+        assert sorted(path.name for path in out.iterdir()) == ["a.raw", "sub"]
+        mock_fetch_to_path.assert_called_once_with(
+            requests[2].source, out / "c.raw", Credentials(ssh_user="user"), checksum=None, link_ok=False, cache=None
+        )
+
+    def test_same_remote_file_twice(self, mock_rsync, mock_fetch_to_path, tmp_path):
+        requests = [self._request(tmp_path / name, "host", "/store/a.raw") for name in ("first.raw", "second.raw")]
+
+        fetch_many(requests, Credentials())
+
+        assert (tmp_path / "first.raw").read_bytes() == b"a.raw"
+        assert (tmp_path / "second.raw").read_bytes() == b"a.raw"
+        mock_fetch_to_path.assert_not_called()
+
+    def test_missing_file_fetched_individually(self, mock_rsync, mock_fetch_to_path, tmp_path):
+        requests = [
+            self._request(tmp_path / "a.raw", "host", "/store/a.raw"),
+            self._request(tmp_path / "missing.raw", "host", "/store/missing.raw"),
+        ]
+
+        fetch_many(requests, Credentials())
+
+        assert (tmp_path / "a.raw").exists()
+        mock_fetch_to_path.assert_called_once_with(
+            requests[1].source, tmp_path / "missing.raw", Credentials(), checksum=None, link_ok=False, cache=None
+        )
+
+    def test_checksum_mismatch_raises_and_cleans(self, mock_rsync, mock_fetch_to_path, tmp_path):
+        requests = [
+            self._request(tmp_path / "a.raw", "host", "/store/a.raw", checksum="deadbeef"),
+            self._request(tmp_path / "b.raw", "host", "/store/b.raw"),
+        ]
+
+        with pytest.raises(TransferError, match="Checksum mismatch"):
+            fetch_many(requests, Credentials())
+
+        assert list(tmp_path.iterdir()) == [tmp_path / "remote"]
+
+    def test_relative_path_not_batched(self, mock_rsync, mock_fetch_to_path, tmp_path):
+        requests = [
+            self._request(tmp_path / "a.raw", "host", "store/a.raw"),
+            self._request(tmp_path / "b.raw", "host", "/store/../store/b.raw"),
+        ]
+
+        fetch_many(requests, Credentials())
+
+        mock_rsync.assert_not_called()
+        assert mock_fetch_to_path.call_count == 2
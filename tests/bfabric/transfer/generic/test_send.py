@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from pathlib import Path
 from subprocess import CalledProcessError
+from unittest.mock import call
 
 import pytest
 from bfabric.transfer._generic import _tus_mover
 from bfabric.transfer._generic._upload_types import UploadOutcome
 from bfabric.transfer._generic.credentials import Credentials
 from bfabric.transfer._generic.errors import TransferError
-from bfabric.transfer._generic.send import send_to_sink
+from bfabric.transfer._generic.send import SendRequest, send_many, send_to_sink
 from bfabric.transfer._generic.sinks import TransferSinkLocal, TransferSinkScp, TransferSinkTus
 
 
@@ -21,7 +23,8 @@ def test_send_local_copies_file(tmp_path):
     outcome = send_to_sink(TransferSinkLocal(path=dest), src, Credentials())
 
     assert dest.read_bytes() == b"payload"
-    assert outcome == UploadOutcome(bytes_uploaded=7, final_offset=7, upload_url=None)
+    assert outcome == UploadOutcome(bytes_uploaded=7, final_offset=7, upload_url=None, elapsed=outcome.elapsed)
+    assert outcome.elapsed >= 0
 
 
 def test_send_local_reports_progress(tmp_path):
@@ -109,3 +112,79 @@ def test_importing_transfer_does_not_import_tuspy():
     )
     result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
     assert result.returncode == 0, result.stdout + result.stderr
+
+
+class TestSendMany:
+    """send_many pushes the scp files of each host with a single rsync call."""
+
+    @pytest.fixture
+    def remote_root(self, tmp_path):
+        return tmp_path / "remote"
+
+    @pytest.fixture
+    def mock_rsync(self, mocker, remote_root):
+        """Patches subprocess.run with a stand-in for rsync --files-from -L, copying to ``remote_root``."""
+
+        def run(cmd, check):
+            files_from = Path(cmd[3].removeprefix("--files-from="))
+            staging = Path(cmd[-2])
+            for path in files_from.read_bytes().decode().split("\0")[:-1]:
+                (remote_root / path).parent.mkdir(parents=True, exist_ok=True)
+                (remote_root / path).write_bytes((staging / path).read_bytes())
+            return mocker.MagicMock(returncode=0)
+
+        return mocker.patch("bfabric.transfer._generic.send.subprocess.run", side_effect=run)
+
+    @pytest.fixture
+    def mock_send_to_sink(self, mocker):
+        return mocker.patch("bfabric.transfer._generic.send.send_to_sink")
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        paths = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            path = tmp_path / "local" / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_text(name)
+            paths.append(path)
+        return paths
+
+    def test_batches_by_host(self, mock_rsync, mock_send_to_sink, remote_root, files, tmp_path):
+        requests = [
+            SendRequest(sink=TransferSinkScp(host="host", path="/store/out/a.txt"), src=files[0]),
+            SendRequest(sink=TransferSinkScp(host="host", path="/store/sub/renamed.txt"), src=files[1]),
+            SendRequest(sink=TransferSinkScp(host="other", path="/store/c.txt"), src=files[2]),
+            SendRequest(sink=TransferSinkLocal(path=tmp_path / "copy.txt"), src=files[2]),
+        ]
+
+        send_many(requests, Credentials(ssh_user="user"))
+
+        mock_rsync.assert_called_once()
+        cmd = mock_rsync.call_args.args[0]
+        assert cmd[:3] == ["rsync", "-rtvLO", "--from0"]
+        assert cmd[-1] == "user@host:/"
+        assert (remote_root / "store" / "out" / "a.txt").read_text() == "a.txt"
+        assert (remote_root / "store" / "sub" / "renamed.txt").read_text() == "b.txt"
+        assert mock_send_to_sink.call_count == 2
+        mock_send_to_sink.assert_has_calls(
+            [call(request.sink, request.src, Credentials(ssh_user="user")) for request in requests[2:]], any_order=True
+        )
+
+    def test_failed_batch_sent_individually(self, mocker, mock_send_to_sink, files):
+        run = mocker.patch("bfabric.transfer._generic.send.subprocess.run", return_value=mocker.MagicMock(returncode=1))
+        requests = [
+            SendRequest(sink=TransferSinkScp(host="host", path=f"/store/{path.name}"), src=path) for path in files[:2]
+        ]
+
+        send_many(requests, Credentials())
+
+        run.assert_called_once()
+        assert [call.args[1] for call in mock_send_to_sink.call_args_list] == files[:2]
+
+    def test_relative_remote_path_sent_individually(self, mock_rsync, mock_send_to_sink, files):
+        requests = [SendRequest(sink=TransferSinkScp(host="host", path=path.name), src=path) for path in files[:2]]
+
+        send_many(requests, Credentials())
+
+        mock_rsync.assert_not_called()
+        assert mock_send_to_sink.call_count == 2
@@ -11,7 +11,8 @@ from pathlib import Path
 
 import pytest
 from bfabric.transfer._generic import _tus_mover
-from bfabric.transfer._generic._tus_mover import upload_file
+from bfabric.transfer._generic._tus_mover import _ChunkSizer, upload_file
+from bfabric.transfer._generic._upload_types import INITIAL_CHUNK_SIZE
 from bfabric.transfer._generic.errors import TransferError
 
 CREATED_URL = "https://tus.example/new-upload"
@@ -28,6 +29,7 @@ class FakeUploader:
         self._server_offset = server_offset
         self._fail_at_chunk = fail_at_chunk
         self._chunks_done = 0
+        self.chunk_sizes: list[int] = []
         self.set_url_calls: list[str] = []
 
     def set_url(self, url: str) -> None:
@@ -44,6 +46,7 @@ class FakeUploader:
             self.url = CREATED_URL
         if self._fail_at_chunk is not None and self._chunks_done == self._fail_at_chunk:
             raise ConnectionError("simulated network drop")
+        self.chunk_sizes.append(self.chunk_size)
         self.offset = min(self.offset + self.chunk_size, self.file_size)
         self._chunks_done += 1
 
@@ -63,12 +66,12 @@ def _install_fake_tus(mocker, server_offset: int = 0, fail_at_chunk: int | None
         def set_headers(self, headers: dict) -> None:
             captured["headers"] = headers
 
-        def uploader(self, file_path, chunk_size, metadata, retries=0, retry_delay=0):
+        def uploader(self, file_path, chunk_size, metadata, retries=0, retry_delay=0, chunk_sizer=None):
             up = FakeUploader(file_path, chunk_size, server_offset, fail_at_chunk)
             captured["uploader"] = up
             return up
 
-    mocker.patch.object(_tus_mover, "TusClient", _FakeTusClient)
+    mocker.patch.object(_tus_mover, "_SessionTusClient", _FakeTusClient)
     return captured
 
 
@@ -218,3 +221,88 @@ def test_bearer_token_set_on_client(mocker, tmp_path):
     f = _make_file(tmp_path, 4)
     upload_file("https://tus.example/", "the-tus-token", f, {"resourceId": "1"}, chunk_size=4)
     assert captured["headers"] == {"Authorization": "Bearer the-tus-token"}
+
+
+def test_outcome_reports_throughput(mocker, tmp_path):
+    _install_fake_tus(mocker)
+    mocker.patch.object(_tus_mover.time, "perf_counter", side_effect=[10.0, 10.5, 11.0, 12.0])
+    f = _make_file(tmp_path, 4)
+
+    outcome = upload_file("https://tus.example/", "tok", f, {"resourceId": "1"}, chunk_size=4)
+
+    assert outcome.elapsed == 2.0
+    assert outcome.throughput == 2.0
+
+
+def test_chunk_size_adapts_by_default(mocker, tmp_path):
+    captured = _install_fake_tus(mocker)
+    f = _make_file(tmp_path, 3 * INITIAL_CHUNK_SIZE)
+
+    upload_file("https://tus.example/", "tok", f, {"resourceId": "1"})
+
+    # the first chunk is sent at the initial size, after which the rest of the file fits in the doubled one
+    assert captured["uploader"].chunk_sizes == [INITIAL_CHUNK_SIZE, 2 * INITIAL_CHUNK_SIZE]
+
+
+def test_requests_share_session_and_retries_shrink_chunks(mocker, tmp_path):
+    # Runs the real tuspy uploader; only the shared session is replaced.
+    session = mocker.patch.object(_tus_mover, "_SESSION")
+    session.post.return_value = mocker.Mock(status_code=201, headers={"location": "/files/abc"})
+    session.head.return_value = mocker.Mock(status_code=200, headers={"upload-offset": "0"})
+    chunk_sizes: list[int] = []
+
+    def _patch(url, data, headers, **kwargs):
+        chunk_sizes.append(len(data))
+        if len(chunk_sizes) == 1:
+            return mocker.Mock(status_code=500, headers={}, content=b"")
+        offset = int(headers["upload-offset"]) + len(data)
+        return mocker.Mock(status_code=204, headers={"Upload-Offset": str(offset)}, content=b"")
+
+    session.patch.side_effect = _patch
+    f = _make_file(tmp_path, INITIAL_CHUNK_SIZE)
+
+    outcome = upload_file("https://tus.example/files/", "tok", f, {"resourceId": "1"}, retry_delay=0)
+
+    assert outcome.upload_url == "https://tus.example/files/abc"
+    assert outcome.final_offset == INITIAL_CHUNK_SIZE
+    # the failed chunk is resent at half the size, which is kept for the rest of the file
+    assert chunk_sizes == [INITIAL_CHUNK_SIZE, INITIAL_CHUNK_SIZE // 2, INITIAL_CHUNK_SIZE // 2]
+    session.head.assert_called_once()
+
+
+class TestChunkSizer:
+    def test_grows_while_throughput_rises(self):
+        sizer = _ChunkSizer(4, minimum=1, maximum=64)
+        sizer.record(4, 1.0)
+        assert sizer.size == 8
+        sizer.record(8, 1.0)
+        assert sizer.size == 16
+        sizer.record(16, 2.0)
+        assert sizer.size == 16
+
+    def test_capped_at_maximum(self):
+        sizer = _ChunkSizer(32, minimum=1, maximum=64)
+        sizer.record(32, 1.0)
+        sizer.record(64, 0.5)
+        assert sizer.size == 64
+
+    def test_last_partial_chunk_ignored(self):
+        sizer = _ChunkSizer(4, minimum=1, maximum=64)
+        sizer.record(2, 1.0)
+        assert sizer.size == 4
+
+    def test_shrinks_on_failure_and_grows_again(self):
+        sizer = _ChunkSizer(16, minimum=4, maximum=64)
+        assert sizer.shrink() == 8
+        # the chunk that needed a retry is not measured
+        sizer.record(8, 10.0)
+        assert sizer.size == 8
+        sizer.record(8, 1.0)
+        assert sizer.size == 16
+        assert [sizer.shrink() for _ in range(3)] == [8, 4, 4]
+
+    def test_fixed_size(self):
+        sizer = _ChunkSizer(4, minimum=4, maximum=4)
+        sizer.record(4, 1.0)
+        assert sizer.size == 4
+        assert sizer.shrink() == 4
@@ -7,6 +7,7 @@ from pytest_mock import MockerFixture
 from bfabric.entities import WorkflowStep, WorkflowTemplateStep
 from bfabric_app_runner.actions.execute import execute_run, execute_outputs, _ensure_dispatched, _register_workflow_step
 from bfabric_app_runner.actions.types import ActionDispatch, ActionRun, ActionInputs, ActionProcess, ActionOutputs
+from bfabric_app_runner.errors import ChunksFailedError
 
 
 @pytest.fixture
@@ -125,6 +126,28 @@ def test_run_specific_chunk_does_not_set_available(mocker, mock_client):
     mock_client.save.assert_not_called()
 
 
+def test_run_parallel_when_chunk_fails_does_not_set_available(mocker, action_run, mock_client, tmp_path):
+    """Test that execute_run with a failed chunk does not set workunit status, even if continuing on error."""
+    action = action_run.model_copy(update={"parallel": 2, "continue_on_error": True})
+    chunk_dirs = [tmp_path / "chunk1", tmp_path / "chunk2"]
+    mocker.patch("bfabric_app_runner.actions.execute._ensure_dispatched")
+    mocker.patch("bfabric_app_runner.actions.execute._validate_chunks_list", return_value=chunk_dirs)
+    mock_execute_inputs = mocker.patch("bfabric_app_runner.actions.execute.execute_inputs")
+    mock_execute_process = mocker.patch(
+        "bfabric_app_runner.actions.execute.execute_process",
+        side_effect=lambda action, client: None if action.chunk.endswith("chunk2") else 1 / 0,
+    )
+    mock_execute_outputs = mocker.patch("bfabric_app_runner.actions.execute.execute_outputs")
+
+    with pytest.raises(ChunksFailedError, match="1 chunk\\(s\\) failed"):
+        execute_run(action=action, client=mock_client)
+
+    assert mock_execute_inputs.call_count == 2
+    assert mock_execute_process.call_count == 2
+    assert [call.kwargs["action"].chunk for call in mock_execute_outputs.mock_calls] == [str(chunk_dirs[1])]
+    mock_client.save.assert_not_called()
+
+
 class TestEnsureDispatched:
     """Tests for the self-healing re-dispatch guard used by run-all (issue #283)."""
 
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+from loguru import logger
+
+from bfabric_app_runner.app_runner.chunk_pool import CHUNK_LOG_FILE, run_chunks
+from bfabric_app_runner.errors import ChunksFailedError
+
+
+@pytest.fixture
+def chunks(tmp_path):
+    chunk_dirs = [tmp_path / f"chunk{i}" for i in range(1, 5)]
+    for chunk_dir in chunk_dirs:
+        chunk_dir.mkdir()
+    return chunk_dirs
+
+
+@pytest.mark.parametrize("parallel", [1, 3])
+def test_run_chunks(chunks, parallel):
+    done = []
+    run_chunks(chunks, done.append, parallel=parallel)
+    assert sorted(done) == chunks
+
+
+def test_run_chunks_runs_concurrently(chunks):
+    barrier = threading.Barrier(len(chunks), timeout=5)
+    run_chunks(chunks, lambda chunk: barrier.wait(), parallel=len(chunks))
+
+
+def test_run_chunks_when_sequential_no_chunk_log(chunks):
+    run_chunks(chunks, lambda chunk: logger.info(f"running {chunk.name}"))
+    assert not any((chunk / CHUNK_LOG_FILE).exists() for chunk in chunks)
+
+
+def test_run_chunks_when_parallel_chunk_log(chunks):
+    run_chunks(chunks, lambda chunk: logger.info(f"running {chunk.name}"), parallel=2)
+    for chunk in chunks:
+        log = (chunk / CHUNK_LOG_FILE).read_text()
+        assert f"running {chunk.name}" in log
+        assert all(f"running {other.name}\n" not in log for other in chunks if other != chunk)
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_run_chunks_when_fail_fast(chunks, parallel):
+    started = []
+    failure_logged = threading.Event()
+
+    def run_chunk(chunk):
+        started.append(chunk)
+        if chunk.name == "chunk1":
+            raise RuntimeError("chunk1 failed")
+        # keep the other worker busy until the failure was handled, when it would otherwise pick the next chunk
+        failure_logged.wait(timeout=5)
+
+    sink_id = logger.add(lambda message: failure_logged.set(), filter=lambda record: "failed" in record["message"])
+    try:
+        with pytest.raises(RuntimeError, match="^chunk1 failed$"):
+            run_chunks(chunks, run_chunk, parallel=parallel)
+    finally:
+        logger.remove(sink_id)
+    assert sorted(started) == chunks[:parallel]
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_run_chunks_when_continue_on_error(chunks, parallel):
+    done = []
+
+    def run_chunk(chunk):
+        if chunk.name in ("chunk1", "chunk3"):
+            raise ValueError(f"{chunk.name} failed")
+        done.append(chunk)
+
+    with pytest.raises(ChunksFailedError, match="2 chunk\\(s\\) failed") as error:
+        run_chunks(chunks, run_chunk, parallel=parallel, continue_on_error=True)
+    assert sorted(done) == [chunks[1], chunks[3]]
+    assert list(error.value.failures) == [chunks[0], chunks[2]]
+    assert str(error.value.failures[chunks[2]]) == "chunk3 failed"
+
+
+def test_run_chunks_when_invalid_parallel(chunks):
+    with pytest.raises(ValueError, match="parallel must be at least 1, got 0"):
+        run_chunks(chunks, lambda chunk: None, parallel=0)
@@ -184,6 +184,24 @@ class TestRunApp:
         assert mock_bfabric.save.call_count == expected_calls
         assert mock_execute_command.call_count == 3
 
+    def test_when_chunk_fails(
+        self, mock_app_version, mock_bfabric, work_dir_with_chunks, mock_execute_command, mock_run_app_dependencies
+    ):
+        """Test run_app does not finalize the workunit when a chunk fails"""
+        mock_run_app_dependencies.prepare_folder.side_effect = RuntimeError("staging failed")
+        with pytest.raises(RuntimeError, match="staging failed"):
+            run_app(
+                app_spec=mock_app_version,
+                workunit_ref=123,
+                work_dir=work_dir_with_chunks,
+                client=mock_bfabric,
+                force_storage=None,
+                parallel=2,
+            )
+
+        mock_bfabric.save.assert_called_once_with("workunit", {"id": 123, "status": "processing"})
+        mock_run_app_dependencies.register_outputs.assert_not_called()
+
     def test_with_path_workunit_ref(
         self, mock_app_version, mock_bfabric, work_dir_with_chunks, mock_execute_command, mock_run_app_dependencies
     ):
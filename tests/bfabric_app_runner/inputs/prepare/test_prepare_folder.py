@@ -1,10 +1,15 @@
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 from typing import Literal
 
 import pytest
 from bfabric.config.bfabric_auth import OAUTH_LOGIN
+from bfabric.transfer import TransferError
 from bfabric_app_runner.inputs.prepare.prepare_context import PrepareContext
 from bfabric_app_runner.inputs.prepare.prepare_folder import (
+    _input_cache_from_env,
     prepare_folder,
     _prepare_input_files,
     _clean_input_files,
@@ -12,7 +17,13 @@ from bfabric_app_runner.inputs.prepare.prepare_folder import (
     _resolve_token_provider,
 )
 from bfabric_app_runner.inputs.resolve.resolved_inputs import ResolvedInputs, ResolvedFile, ResolvedStaticFile
-from bfabric_app_runner.specs.inputs.file_spec import FileSourceHttp, FileSourceHttpValue, FileSourceLocal
+from bfabric_app_runner.specs.inputs.file_spec import (
+    FileSourceHttp,
+    FileSourceHttpValue,
+    FileSourceLocal,
+    FileSourceSsh,
+    FileSourceSshValue,
+)
 from bfabric_app_runner.specs.inputs_spec import InputsSpec
 
 
@@ -92,6 +103,8 @@ def test_prepare_folder_prepare_action(mocker, mock_inputs_spec_read_yaml, mock_
         input_files=mock_resolved_inputs,
         working_dir=target_folder,
         context=PrepareContext(ssh_user=ssh_user, token_provider=None),
+        max_workers=8,
+        max_per_host=4,
     )
 
 
@@ -173,6 +186,8 @@ def test_prepare_folder_with_filter(mocker, mock_inputs_spec_read_yaml, mock_res
         input_files=mock_filtered_inputs,
         working_dir=target_folder,
         context=PrepareContext(ssh_user=None, token_provider=None),
+        max_workers=8,
+        max_per_host=4,
     )
 
 
@@ -279,6 +294,8 @@ def test_prepare_folder_default_target_folder(mocker, mock_inputs_spec_read_yaml
         input_files=mock_resolved_inputs,
         working_dir=inputs_yaml.parent,
         context=PrepareContext(ssh_user=None, token_provider=None),
+        max_workers=8,
+        max_per_host=4,
     )
 
 
@@ -287,24 +304,165 @@ def test_prepare_input_files(mocker, mock_prepare_resolved_file, mock_prepare_re
     working_dir = Path("/path/to/working")
     ssh_user = "test_user"
 
-    # Create mock files
-    mock_resolved_file = mocker.MagicMock(spec=ResolvedFile)
-    mock_static_file = mocker.MagicMock(spec=ResolvedStaticFile)
-
-    # Create mock resolved inputs
-    mock_resolved_inputs = mocker.MagicMock(spec=ResolvedInputs)
-    mock_resolved_inputs.files = [mock_resolved_file, mock_static_file]
+    # Create resolved files
+    resolved_file = ResolvedFile(source=FileSourceLocal(local="/a.txt"), filename="a.txt", link=False, checksum=None)
+    static_file = ResolvedStaticFile(filename="b.txt", content="b")
+    resolved_inputs = ResolvedInputs(files=[resolved_file, static_file])
 
     context = PrepareContext(ssh_user=ssh_user, token_provider=lambda: "tok")
 
     # Call the function
-    _prepare_input_files(input_files=mock_resolved_inputs, working_dir=working_dir, context=context)
+    _prepare_input_files(input_files=resolved_inputs, working_dir=working_dir, context=context)
 
     # Verify
-    mock_prepare_resolved_file.assert_called_once_with(
-        file=mock_resolved_file, working_dir=working_dir, context=context
+    mock_prepare_resolved_file.assert_called_once_with(file=resolved_file, working_dir=working_dir, context=context)
+    mock_prepare_resolved_static_file.assert_called_once_with(file=static_file, working_dir=working_dir)
+
+
+def _ssh_resolved(host: str, filename: str) -> ResolvedFile:
+    return ResolvedFile(
+        source=FileSourceSsh(ssh=FileSourceSshValue(host=host, path=f"/store/{filename}")),
+        filename=filename,
+        link=False,
+        checksum=None,
+    )
+
+
+def _http_host_resolved(host: str, filename: str) -> ResolvedFile:
+    return ResolvedFile(
+        source=FileSourceHttp(http=FileSourceHttpValue(url=f"https://{host}/store/{filename}")),
+        filename=filename,
+        link=False,
+        checksum=None,
+    )
+
+
+def test_prepare_input_files_limits_transfers_per_host(mocker, tmp_path):
+    running = defaultdict(int)
+    max_running = defaultdict(int)
+    lock = threading.Lock()
+
+    def prepare(file, working_dir, context):
+        host = file.source.http.url.split("/")[2]
+        with lock:
+            running[host] += 1
+            max_running[host] = max(max_running[host], running[host])
+        time.sleep(0.02)
+        (working_dir / file.filename).write_text(file.filename)
+        with lock:
+            running[host] -= 1
+
+    mocker.patch("bfabric_app_runner.inputs.prepare.prepare_folder.prepare_resolved_file", side_effect=prepare)
+    files = [_http_host_resolved(host, f"{host}_{i}.raw") for host in ("fgcz-a", "fgcz-b") for i in range(4)]
+
+    _prepare_input_files(
+        input_files=ResolvedInputs(files=files), working_dir=tmp_path, context=PrepareContext(), max_per_host=2
+    )
+
+    assert max_running == {"fgcz-a": 2, "fgcz-b": 2}
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(file.filename for file in files)
+
+
+def test_prepare_input_files_batches_ssh_files_by_host(mocker, mock_prepare_resolved_file):
+    mock_prepare_resolved_files = mocker.patch(
+        "bfabric_app_runner.inputs.prepare.prepare_folder.prepare_resolved_files"
+    )
+    files = [
+        _ssh_resolved("fgcz-a", "a1.raw"),
+        _ssh_resolved("fgcz-b", "b1.raw"),
+        _ssh_resolved("fgcz-a", "a2.raw"),
+        _http_host_resolved("fgcz-a", "a3.raw"),
+    ]
+    working_dir = Path("/path/to/working")
+    context = PrepareContext()
+
+    _prepare_input_files(input_files=ResolvedInputs(files=files), working_dir=working_dir, context=context)
+
+    mock_prepare_resolved_files.assert_called_once_with(
+        files=[files[0], files[2]], working_dir=working_dir, context=context
     )
-    mock_prepare_resolved_static_file.assert_called_once_with(file=mock_static_file, working_dir=working_dir)
+    assert sorted(call.kwargs["file"].filename for call in mock_prepare_resolved_file.mock_calls) == [
+        "a3.raw",
+        "b1.raw",
+    ]
+
+
+def test_prepare_input_files_when_error_removes_staged_files(mocker, tmp_path):
+    (tmp_path / "existing.raw").write_text("existing")
+
+    def prepare(file, working_dir, context):
+        if file.filename == "broken.raw":
+            raise TransferError("Failed to fetch file")
+        (working_dir / file.filename).write_text(file.filename)
+
+    mocker.patch("bfabric_app_runner.inputs.prepare.prepare_folder.prepare_resolved_file", side_effect=prepare)
+    files = [_http_host_resolved("fgcz-a", name) for name in ("existing.raw", "new.raw", "broken.raw")]
+
+    with pytest.raises(TransferError, match="Failed to fetch file"):
+        _prepare_input_files(
+            input_files=ResolvedInputs(files=files), working_dir=tmp_path, context=PrepareContext(), max_workers=1
+        )
+
+    assert [path.name for path in tmp_path.iterdir()] == ["existing.raw"]
+
+
+def test_prepare_input_files_when_error_skips_waiting_files(mocker, tmp_path):
+    staged = []
+
+    def prepare(file, working_dir, context):
+        staged.append(file.filename)
+        if file.filename == "broken.raw":
+            raise TransferError("Failed to fetch file")
+
+    mocker.patch("bfabric_app_runner.inputs.prepare.prepare_folder.prepare_resolved_file", side_effect=prepare)
+    files = [_http_host_resolved("fgcz-a", name) for name in ("broken.raw", "a1.raw", "a2.raw", "a3.raw")]
+
+    # all batches are running and waiting for the single slot of the host when the first one fails
+    with pytest.raises(TransferError, match="Failed to fetch file"):
+        _prepare_input_files(
+            input_files=ResolvedInputs(files=files),
+            working_dir=tmp_path,
+            context=PrepareContext(),
+            max_workers=4,
+            max_per_host=1,
+        )
+
+    # no batch is started after the failed one
+    assert staged[-1] == "broken.raw"
+
+
+def test_prepare_input_files_skips_unchanged_files(mocker, tmp_path):
+    def prepare(file, working_dir, context):
+        (working_dir / file.filename).write_text(file.filename)
+
+    mock_prepare = mocker.patch(
+        "bfabric_app_runner.inputs.prepare.prepare_folder.prepare_resolved_file", side_effect=prepare
+    )
+    mock_md5 = mocker.patch("bfabric_app_runner.inputs.staging_manifest.md5_checksum", return_value="md5-a")
+    files = [
+        _http_host_resolved("fgcz-a", "a.raw").model_copy(update={"checksum": "md5-a"}),
+        _http_host_resolved("fgcz-a", "b.raw"),
+    ]
+
+    for _ in range(2):
+        _prepare_input_files(input_files=ResolvedInputs(files=files), working_dir=tmp_path, context=PrepareContext())
+
+    assert [call.kwargs["file"].filename for call in mock_prepare.mock_calls] == ["a.raw", "b.raw", "b.raw"]
+    mock_md5.assert_not_called()
+
+    # a file modified since it was staged is hashed and staged again
+    (tmp_path / "a.raw").write_text("modified")
+    mock_md5.return_value = "md5-modified"
+    _prepare_input_files(input_files=ResolvedInputs(files=files[:1]), working_dir=tmp_path, context=PrepareContext())
+    mock_md5.assert_called_once_with(tmp_path / "a.raw")
+    assert mock_prepare.mock_calls[-1].kwargs["file"].filename == "a.raw"
+
+
+def test_prepare_input_files_when_invalid_max_workers(tmp_path):
+    with pytest.raises(ValueError, match="max_workers must be at least 1, got 0"):
+        _prepare_input_files(
+            input_files=ResolvedInputs(files=[]), working_dir=tmp_path, context=PrepareContext(), max_workers=0
+        )
 
 
 def _http_resolved(url: str, auth: Literal["bfabric"] | None) -> ResolvedFile:
@@ -412,3 +570,24 @@ def test_clean_input_files(fs, mocker, mock_logger):
     assert not file1_path.exists()  # Should be removed
     assert not file2_path.exists()  # Should still not exist
     mock_logger.info.assert_called_once_with(f"Removed {file1_path}")
+
+
+def test_input_cache_from_env_when_unset(monkeypatch):
+    monkeypatch.delenv("BFABRIC_APP_RUNNER_INPUT_CACHE", raising=False)
+    assert _input_cache_from_env() is None
+
+
+def test_input_cache_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("BFABRIC_APP_RUNNER_INPUT_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("BFABRIC_APP_RUNNER_INPUT_CACHE_MAX_GB", "2.5")
+    cache = _input_cache_from_env()
+    assert cache.cache_dir == tmp_path / "cache"
+    assert cache._max_bytes == 2_500_000_000
+
+
+@pytest.mark.parametrize("max_gb", ["lots", "0", "-1", "inf"])
+def test_input_cache_from_env_when_invalid_max_gb(monkeypatch, tmp_path, max_gb):
+    monkeypatch.setenv("BFABRIC_APP_RUNNER_INPUT_CACHE", str(tmp_path / "cache"))
+    monkeypatch.setenv("BFABRIC_APP_RUNNER_INPUT_CACHE_MAX_GB", max_gb)
+    with pytest.raises(ValueError, match="BFABRIC_APP_RUNNER_INPUT_CACHE_MAX_GB must be a positive number"):
+        _input_cache_from_env()
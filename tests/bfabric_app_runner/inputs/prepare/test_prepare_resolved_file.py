@@ -88,7 +88,7 @@ def test_prepare_resolved_file_routes_http(mock_fetch, tmp_path):
     assert source == TransferSourceHttp(url="https://host/data/f.txt", auth="bfabric")
     assert dest == tmp_path / "destination.txt"
     assert creds.token_provider() == "tok"
-    assert kwargs == {"checksum": None, "link_ok": False}
+    assert kwargs == {"checksum": None, "link_ok": False, "cache": None}
 
 
 def test_prepare_resolved_file_local(mock_fetch, tmp_path):
@@ -99,7 +99,7 @@ def test_prepare_resolved_file_local(mock_fetch, tmp_path):
     assert source == TransferSourceLocal(path=Path("/source.txt"))
     assert dest == tmp_path / "destination.txt"
     assert creds.ssh_user == "user"
-    assert kwargs == {"checksum": "abc", "link_ok": False}
+    assert kwargs == {"checksum": "abc", "link_ok": False, "cache": None}
 
 
 def test_prepare_resolved_file_ssh(mock_fetch, tmp_path):
@@ -111,7 +111,7 @@ def test_prepare_resolved_file_ssh(mock_fetch, tmp_path):
     (source, _dest, creds), kwargs = mock_fetch.call_args
     assert source == TransferSourceSsh(host="host", path="/source.txt")
     assert creds.ssh_user == "user"
-    assert kwargs == {"checksum": None, "link_ok": False}
+    assert kwargs == {"checksum": None, "link_ok": False, "cache": None}
 
 
 def test_prepare_resolved_file_link(mock_fetch, tmp_path):
@@ -120,7 +120,15 @@ def test_prepare_resolved_file_link(mock_fetch, tmp_path):
 
     (source, _dest, _creds), kwargs = mock_fetch.call_args
     assert source == TransferSourceLocal(path=Path("/source.txt"))
-    assert kwargs == {"checksum": None, "link_ok": True}
+    assert kwargs == {"checksum": None, "link_ok": True, "cache": None}
+
+
+def test_prepare_resolved_file_passes_cache(mock_fetch, tmp_path, mocker):
+    cache = mocker.Mock(name="cache")
+    file = ResolvedFile(source={"local": "/source.txt"}, filename="destination.txt", link=False, checksum="abc")
+    prepare_resolved_file(file=file, working_dir=tmp_path, context=PrepareContext(cache=cache))
+
+    assert mock_fetch.call_args.kwargs["cache"] is cache
 
 
 def test_prepare_link_raises_for_non_local_source(tmp_path):
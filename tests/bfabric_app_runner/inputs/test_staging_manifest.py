@@ -0,0 +1,90 @@
+import hashlib
+import os
+
+import pytest
+
+from bfabric_app_runner.inputs.staging_manifest import MANIFEST_FILE, StagingManifest
+
+
+def _md5(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+@pytest.fixture
+def md5_checksum(mocker):
+    return mocker.patch(
+        "bfabric_app_runner.inputs.staging_manifest.md5_checksum", side_effect=lambda path: _md5(path.read_bytes())
+    )
+
+
+@pytest.fixture
+def staged_file(tmp_path):
+    path = tmp_path / "sub" / "a.raw"
+    path.parent.mkdir()
+    path.write_bytes(b"aaaa")
+    return path
+
+
+def test_verify_when_not_recorded(tmp_path, staged_file, md5_checksum):
+    manifest = StagingManifest.load(tmp_path)
+    assert manifest.verify(staged_file, _md5(b"aaaa"))
+    assert not manifest.verify(staged_file, _md5(b"bbbb"))
+    md5_checksum.assert_called_once_with(staged_file)
+
+
+def test_verify_when_recorded_skips_hashing(tmp_path, staged_file, md5_checksum):
+    manifest = StagingManifest.load(tmp_path)
+    manifest.record(staged_file, _md5(b"aaaa"))
+    manifest.save()
+
+    reloaded = StagingManifest.load(tmp_path)
+    assert reloaded.verify(staged_file, _md5(b"aaaa"))
+    assert not reloaded.verify(staged_file, _md5(b"bbbb"))
+    md5_checksum.assert_not_called()
+
+
+def test_verify_when_modified(tmp_path, staged_file, md5_checksum):
+    manifest = StagingManifest.load(tmp_path)
+    manifest.record(staged_file, _md5(b"aaaa"))
+
+    # same size and modification time, but a different inode
+    stat = staged_file.stat()
+    replaced = staged_file.with_name("replaced")
+    replaced.write_bytes(b"cccc")
+    os.utime(replaced, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    replaced.replace(staged_file)
+
+    assert not manifest.verify(staged_file, _md5(b"aaaa"))
+    assert manifest.verify(staged_file, _md5(b"cccc"))
+    md5_checksum.assert_called_once_with(staged_file)
+
+
+def test_save_when_unchanged(tmp_path):
+    StagingManifest.load(tmp_path).save()
+    assert not (tmp_path / MANIFEST_FILE).exists()
+
+
+def test_try_save_when_not_writable(tmp_path, staged_file, mocker):
+    manifest = StagingManifest.load(tmp_path)
+    manifest.record(staged_file, _md5(b"aaaa"))
+    mocker.patch("pathlib.Path.write_text", side_effect=PermissionError("read-only file system"))
+    logger = mocker.patch("bfabric_app_runner.inputs.staging_manifest.logger")
+
+    manifest.try_save()
+
+    logger.warning.assert_called_once()
+    assert not (tmp_path / MANIFEST_FILE).exists()
+
+
+def test_try_save_when_folder_missing(tmp_path, staged_file):
+    manifest = StagingManifest.load(tmp_path / "missing")
+    manifest.record(staged_file, _md5(b"aaaa"))
+    manifest.try_save()
+    assert not (tmp_path / "missing").exists()
+
+
+def test_load_when_unreadable(tmp_path, staged_file, md5_checksum):
+    (tmp_path / MANIFEST_FILE).write_text("{not json")
+    manifest = StagingManifest.load(tmp_path)
+    assert manifest.verify(staged_file, _md5(b"aaaa"))
+    md5_checksum.assert_called_once()
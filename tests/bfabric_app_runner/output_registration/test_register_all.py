@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 from bfabric.entities import Workunit
+from bfabric_app_runner.output_registration import register
 from bfabric_app_runner.output_registration.register import register_all
 from bfabric_app_runner.specs.outputs_spec import CopyResourceSpec
 
@@ -89,3 +90,115 @@ class TestRegisterAll:
         assert resource_data["workunitid"] == 5000
         assert resource_data["relativepath"] == "out/folder/result.txt"
         assert resource_data["status"] == "available"
+
+    def test_hashes_the_file_once(self, client, workunit_definition, spec):
+        register_all(
+            client=client,
+            workunit_definition=workunit_definition,
+            specs_list=[spec],
+            ssh_user=None,
+            force_storage=None,
+        )
+
+        register.md5_checksum.assert_called_once_with(spec.local_path)
+        assert client.save.call_args.args[1]["filechecksum"] == "checksum"
+
+    def test_required_resource_missing(self, client, workunit_definition, tmp_path):
+        local_path = tmp_path / "missing.txt"
+        local_path.write_text("payload")
+        spec = CopyResourceSpec(local_path=local_path, store_entry_path=Path("missing.txt"), update_existing="required")
+
+        with pytest.raises(ValueError, match="Resource missing.txt not found in workunit 5000"):
+            register_all(
+                client=client,
+                workunit_definition=workunit_definition,
+                specs_list=[spec],
+                ssh_user=None,
+                force_storage=None,
+            )
+
+        client.save.assert_not_called()
+
+
+class TestRegisterAllBatched:
+    @pytest.fixture()
+    def workunit_definition(self, mocker):
+        wd = mocker.MagicMock()
+        wd.registration.workunit_id = 5000
+        wd.registration.storage_id = 2
+        wd.registration.storage_output_folder = Path("out/folder")
+        return wd
+
+    @pytest.fixture()
+    def client(self, mocker):
+        client = mocker.MagicMock()
+        client.reader.read_id.return_value.scp_prefix = "storagehost:/base/"
+        return client
+
+    @pytest.fixture()
+    def multi_query(self, mocker):
+        multi_query = mocker.patch.object(register, "MultiQuery")
+        multi_query.return_value.read_multi.return_value = [{"name": "b.txt", "id": 7}]
+        return multi_query.return_value
+
+    @pytest.fixture(autouse=True)
+    def send_many(self, mocker):
+        mocker.patch.object(register, "md5_checksum", side_effect=lambda path: f"md5 {path.name}")
+        return mocker.patch.object(register, "send_many")
+
+    @staticmethod
+    def _specs(tmp_path, names, **kwargs) -> list[CopyResourceSpec]:
+        specs = []
+        for name in names:
+            (tmp_path / name).write_text(name)
+            specs.append(CopyResourceSpec(local_path=tmp_path / name, store_entry_path=Path(name), **kwargs))
+        return specs
+
+    def _register(self, client, workunit_definition, specs_list) -> None:
+        register_all(
+            client=client,
+            workunit_definition=workunit_definition,
+            specs_list=specs_list,
+            ssh_user="bfabric",
+            force_storage=None,
+            batched=True,
+        )
+
+    def test_registers_files_together(self, client, workunit_definition, multi_query, send_many, tmp_path):
+        specs = self._specs(tmp_path, ["a.txt"], update_existing="no") + self._specs(tmp_path, ["b.txt", "c.txt"])
+
+        self._register(client, workunit_definition, specs)
+
+        multi_query.read_multi.assert_called_once_with(
+            "resource", {"workunitid": 5000}, multi_query_key="name", multi_query_vals=["b.txt", "c.txt"]
+        )
+        send_requests, creds = send_many.call_args.args
+        assert [request.sink.path for request in send_requests] == [
+            "/base/out/folder/a.txt",
+            "/base/out/folder/b.txt",
+            "/base/out/folder/c.txt",
+        ]
+        assert creds.ssh_user == "bfabric"
+        client.save.assert_called_once()
+        endpoint, resources = client.save.call_args.args
+        assert endpoint == "resource"
+        assert [resource.get("id") for resource in resources] == [None, 7, None]
+        assert [resource["filechecksum"] for resource in resources] == ["md5 a.txt", "md5 b.txt", "md5 c.txt"]
+
+    def test_saves_in_pages_of_100(self, client, workunit_definition, multi_query, tmp_path):
+        specs = self._specs(tmp_path, [f"file_{i}.txt" for i in range(150)])
+
+        self._register(client, workunit_definition, specs)
+
+        # one multi-query, which splits the names into chunks itself
+        multi_query.read_multi.assert_called_once()
+        assert [len(call.args[1]) for call in client.save.call_args_list] == [100, 50]
+
+    def test_required_resource_missing(self, client, workunit_definition, multi_query, send_many, tmp_path):
+        specs = self._specs(tmp_path, ["missing.txt"], update_existing="required")
+
+        with pytest.raises(ValueError, match="Resource missing.txt not found in workunit 5000"):
+            self._register(client, workunit_definition, specs)
+
+        send_many.assert_not_called()
+        client.save.assert_not_called()
@@ -198,6 +198,18 @@ class TestCmdWorkunitUpload:
         _, kwargs = upload_files.call_args
         assert kwargs["params"].track_job is True
 
+    def test_parallel_and_max_rate_forwarded(self, mocker, summary):
+        upload_files = mocker.patch.object(upload_mod, "upload_files", return_value=summary)
+        self._patch_context(mocker, None)
+        mocker.patch.object(upload_mod, "_progress_enabled", return_value=False)
+
+        params = UploadParams(files=[Path("x")], container_id=1, application_id=2, parallel=4, max_rate=2.5)
+        upload_mod.cmd_workunit_upload.__wrapped__(params, client=mocker.MagicMock())
+
+        _, kwargs = upload_files.call_args
+        assert kwargs["max_workers"] == 4
+        assert kwargs["max_bytes_per_second"] == 2.5e6
+
     def test_on_duplicate_applies_to_every_file(self, mocker, summary):
         # The CLI flag is uniform for the invocation; per-file policies are a library-level capability.
         upload_files = mocker.patch.object(upload_mod, "upload_files", return_value=summary)